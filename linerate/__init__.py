@@ -2,7 +2,8 @@ import importlib.metadata as importlib_metadata
 
 __version__ = importlib_metadata.version(__name__)
 
-from . import equations  # noqa
+from . import axes, equations, geodesy, solar_position  # noqa
+from .compilation import warmup  # noqa
 from .model import *  # noqa
 from .solver import *  # noqa
 from .types import *  # noqa
@@ -0,0 +1,111 @@
+r"""Named axes for evaluating many spans, times and weather scenarios at once.
+
+All model inputs are broadcast together with the usual NumPy rules, so a thermal model can
+evaluate the heat balance for all combinations of spans, times and (optionally) weather ensemble
+members in one call. To make the broadcasting explicit, the axes of the model inputs are laid out
+according to a *layout*, a tuple of axis names. The default layout is ``("time", "span")``, and
+``("ensemble", "time", "span")`` adds an axis for weather ensemble members or scenarios.
+
+The span axis is always the last axis of a layout. This way, the one-dimensional arrays of a
+:py:class:`linerate.types.SpanArray` (with shape ``(num_spans,)``) broadcast against the other
+inputs without being reshaped, and span-only quantities, like the span geometry and the
+conductor parameters, are computed once per span. Similarly, time-only quantities, like the solar
+position, are computed once per time if the times have shape ``(num_times, 1)``. Only the terms
+that actually vary along all axes, like the convective cooling with a time- and span-dependent
+wind speed, are computed for the full product.
+
+Use :py:func:`align` to place arrays with named axes in a layout:
+
+>>> import numpy as np
+>>> from linerate import axes
+>>> wind_speed = np.ones((24, 100))  # Axes ("time", "span")
+>>> axes.align(wind_speed, ("time", "span"), layout=("ensemble", "time", "span")).shape
+(1, 24, 100)
+>>> air_temperature = np.ones((100, 50, 24))  # Axes ("span", "ensemble", "time")
+>>> axes.align(air_temperature, ("span", "ensemble", "time"), ("ensemble", "time", "span")).shape
+(50, 24, 100)
+>>> time = np.arange("2024-06-01", "2024-06-02", dtype="datetime64[h]")
+>>> axes.align(time, ("time",)).shape
+(24, 1)
+
+The results of a model with the layout ``layout`` have the shape given by broadcasting all its
+inputs, e.g. ``(num_ensemble_members, num_times, num_spans)`` for the layout
+``("ensemble", "time", "span")``, and the span axis can be found with :py:func:`get_axis`, e.g.
+for :py:class:`linerate.model.Line`.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = ["SPAN", "TIME", "ENSEMBLE", "DEFAULT_LAYOUT", "align", "get_axis"]
+
+#: Name of the span axis.
+SPAN = "span"
+#: Name of the time axis.
+TIME = "time"
+#: Name of the ensemble (or scenario) axis.
+ENSEMBLE = "ensemble"
+#: The default layout of model inputs.
+DEFAULT_LAYOUT = (TIME, SPAN)
+
+
+def _check_layout(layout: Sequence[str]) -> Tuple[str, ...]:
+    layout = tuple(layout)
+    if len(set(layout)) != len(layout):
+        raise ValueError(f"The axis names in the layout {layout} must be unique.")
+    if SPAN in layout and layout[-1] != SPAN:
+        raise ValueError(f"The span axis must be the last axis of the layout, got {layout}.")
+    return layout
+
+
+def get_axis(name: str, layout: Sequence[str] = DEFAULT_LAYOUT) -> int:
+    """Get the (negative) index of a named axis in a layout.
+
+    The index is negative, so it can also be used for arrays with fewer leading axes than the
+    layout, e.g. for results that do not vary along the first axes.
+    """
+    layout = _check_layout(layout)
+    if name not in layout:
+        raise ValueError(f"The axis {name!r} is not in the layout {layout}.")
+    return layout.index(name) - len(layout)
+
+
+def align(
+    value: npt.ArrayLike, axes: Sequence[str], layout: Sequence[str] = DEFAULT_LAYOUT
+) -> np.ndarray:
+    """Place an array with named axes in a layout.
+
+    The axes of ``value`` are transposed to the order of the layout, and axes of length one are
+    inserted for the axes of the layout that ``value`` does not have. No data is copied.
+
+    Parameters
+    ----------
+    value:
+        Array with one axis per name in ``axes``.
+    axes:
+        The names of the axes of ``value``, all of which must be in the layout.
+    layout:
+        The names of all axes, in order. The span axis, if any, must be last.
+
+    Returns
+    -------
+    ndarray
+        View of ``value`` with ``len(layout)`` dimensions that broadcasts against other arrays
+        in the same layout.
+    """
+    layout = _check_layout(layout)
+    value = np.asarray(value)
+    axes = tuple(axes)
+    if value.ndim != len(axes):
+        raise ValueError(f"The array has {value.ndim} axes, but {len(axes)} names were given.")
+    if len(set(axes)) != len(axes):
+        raise ValueError(f"The axis names {axes} must be unique.")
+    unknown_axes = set(axes) - set(layout)
+    if unknown_axes:
+        raise ValueError(f"The axes {sorted(unknown_axes)} are not in the layout {layout}.")
+
+    ordered_axes = [name for name in layout if name in axes]
+    value = np.transpose(value, [axes.index(name) for name in ordered_axes])
+    return value.reshape([value.shape[ordered_axes.index(n)] if n in axes else 1 for n in layout])
@@ -0,0 +1,54 @@
+r"""Compilation of the numba kernels.
+
+Parts of the equations (e.g. the Nusselt number correlations of :cite:p:`cigre601` and the fused
+heat balance and air properties) are compiled with numba. All kernels are cached on disk
+(``cache=True``), so the machine code is only generated once, and later processes load it from
+the cache. By default, the cache is stored in ``__pycache__`` directories next to the source
+files, or in a user-wide cache directory if those are not writable. Set the environment variable
+``NUMBA_CACHE_DIR`` to use another directory, e.g. a directory that is baked into a container
+image.
+
+The kernels are still loaded and wrapped as NumPy ufuncs the first time they are called, which
+takes up to a few hundred milliseconds per model, since numba does not cache the ufunc loops.
+Call :py:func:`warmup` when a worker process starts, or before forking worker processes, to pay
+this cost up front instead of in the first rating:
+
+>>> import linerate
+>>> linerate.warmup()
+"""
+
+import importlib
+import pkgutil
+from typing import Iterator
+
+from numba.np.ufunc.dufunc import DUFunc
+
+import linerate.equations
+
+__all__ = ["warmup"]
+
+
+def _get_compiled_ufuncs() -> Iterator[DUFunc]:
+    """Yield the lazily compiled ufuncs of all modules in ``linerate.equations``."""
+    modules = pkgutil.walk_packages(linerate.equations.__path__, "linerate.equations.")
+    for module_info in modules:
+        module = importlib.import_module(module_info.name)
+        for value in vars(module).values():
+            if isinstance(value, DUFunc) and value.__module__ == module.__name__:
+                yield value
+
+
+def warmup() -> None:
+    """Compile all numba kernels for float64 arguments, or load them from the on-disk cache.
+
+    The kernels are compiled for the signature where all arguments and the return value are
+    ``float64``, which is the signature used by the thermal models. Kernels that are already
+    compiled for this signature are skipped, so calling :py:func:`warmup` again is cheap. Without
+    a populated cache, all kernels are compiled, which takes several seconds. Later processes load
+    the kernels from the cache, which is faster, but still takes a few seconds, since the ufunc
+    loops are generated in every process.
+    """
+    for ufunc in _get_compiled_ufuncs():
+        loop = "d" * ufunc.nin + "->d"
+        if loop not in ufunc.types:
+            ufunc.add("float64({})".format(", ".join(["float64"] * ufunc.nin)))
@@ -5,4 +5,12 @@ returned and the parameters of the right hand side are required as function argu
 function is implemented with vectorization over all numerical parameters.
 """
 
-from . import cigre601, ieee738, joule_heating, math, radiative_cooling, solar_angles  # noqa
+from . import (  # noqa
+    air_properties,
+    cigre601,
+    ieee738,
+    joule_heating,
+    math,
+    radiative_cooling,
+    solar_angles,
+)
@@ -0,0 +1,403 @@
+r"""Compiled approximations of the properties of air.
+
+The convective cooling of all standards depends on the properties of the air film surrounding the
+conductor, which each standard approximates with polynomials in the film temperature (and the
+altitude). The functions in this module evaluate these polynomials in Horner form, compiled with
+numba. They broadcast like NumPy ufuncs, and can also be called from other compiled functions, so
+the equation modules of the standards, the thermal models and the fused heat balance kernels
+share one implementation.
+
+Since all properties are computed from the same film temperature, the functions
+:py:func:`compute_cigre601_air_properties`, :py:func:`compute_ieee738_air_properties` and
+:py:func:`compute_cigre207_air_properties` return all properties of a standard in one fused pass,
+without allocating arrays for the intermediate results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import guvectorize, vectorize
+
+from ..units import (
+    Celsius,
+    KilogramPerCubeMeter,
+    KilogramPerMeterPerSecond,
+    Meter,
+    SquareMeterPerSecond,
+    Unitless,
+    WattPerMeterPerKelvin,
+)
+
+#: :math:`c_f~\left[\text{J}~\text{kg}^{-1}~\text{K}^{-1}\right]`. The specific heat capacity of
+#: air used by :cite:p:`cigre601`.
+SPECIFIC_HEAT_CAPACITY_OF_AIR = 1005.0
+
+
+# CIGRE 601
+###########
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre601_thermal_conductivity_of_air(
+    film_temperature: Celsius,
+) -> WattPerMeterPerKelvin:
+    r"""Thermal conductivity of air, equation (18) on page 24 of :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\lambda_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The thermal
+        conductivity of air.
+    """
+    T_f = film_temperature
+    return (-2.763e-8 * T_f + 7.23e-5) * T_f + 2.368e-2
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre601_dynamic_viscosity_of_air(
+    film_temperature: Celsius,
+) -> KilogramPerMeterPerSecond:
+    r"""Dynamic viscosity of air, equation (19) on page 25 of :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\mu_f~\left[\text{kg}~\text{m}^{-1}~\text{s}^{-1}\right]`. The dynamic viscosity
+        of air.
+    """
+    T_f = film_temperature
+    return (-2.03e-11 * T_f + 4.635e-8) * T_f + 17.239e-6
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre601_air_density(
+    film_temperature: Celsius, height_above_sea_level: Meter
+) -> KilogramPerCubeMeter:
+    r"""Density of air, equation (20) on page 25 of :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+    height_above_sea_level:
+        :math:`y~\left[\text{m}\right]`. The conductor's altitude.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\gamma~\left[\text{kg}~\text{m}^{-3}\right]`. The mass density of air.
+    """
+    T_f = film_temperature
+    y = height_above_sea_level
+    return ((6.379e-9 * y - 1.525e-4) * y + 1.293) / (1 + 0.00367 * T_f)
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre601_prandtl_number(film_temperature: Celsius) -> Unitless:
+    r"""Prandtl number of air, :math:`c_f \mu_f / \lambda_f`, see page 8 of :cite:p:`cigre601`.
+
+    Uses :py:data:`SPECIFIC_HEAT_CAPACITY_OF_AIR`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\text{Pr}`. The Prandtl number.
+    """
+    return (
+        SPECIFIC_HEAT_CAPACITY_OF_AIR
+        * compute_cigre601_dynamic_viscosity_of_air(film_temperature)
+        / compute_cigre601_thermal_conductivity_of_air(film_temperature)
+    )
+
+
+@guvectorize(
+    ["void(float64, float64, float64[:], float64[:], float64[:], float64[:], float64[:])"],
+    "(),()->(),(),(),(),()",
+    nopython=True,
+    cache=True,
+)
+def _compute_cigre601_air_properties(T_f, y, lambda_f, mu_f, gamma_f, nu_f, Pr):
+    lambda_f[0] = compute_cigre601_thermal_conductivity_of_air(T_f)
+    mu_f[0] = compute_cigre601_dynamic_viscosity_of_air(T_f)
+    gamma_f[0] = compute_cigre601_air_density(T_f, y)
+    nu_f[0] = mu_f[0] / gamma_f[0]
+    Pr[0] = SPECIFIC_HEAT_CAPACITY_OF_AIR * mu_f[0] / lambda_f[0]
+
+
+def compute_cigre601_air_properties(
+    film_temperature: Celsius, height_above_sea_level: Meter
+) -> Tuple[
+    WattPerMeterPerKelvin,
+    KilogramPerMeterPerSecond,
+    KilogramPerCubeMeter,
+    SquareMeterPerSecond,
+    Unitless,
+]:
+    r"""Compute all properties of air from :cite:p:`cigre601` in one pass.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+    height_above_sea_level:
+        :math:`y~\left[\text{m}\right]`. The conductor's altitude.
+
+    Returns
+    -------
+    Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+        The thermal conductivity :math:`\lambda_f`, the dynamic viscosity :math:`\mu_f`, the
+        density :math:`\gamma`, the kinematic viscosity :math:`\nu_f = \mu_f / \gamma` and the
+        Prandtl number :math:`\text{Pr}`, see
+        :py:func:`compute_cigre601_thermal_conductivity_of_air`,
+        :py:func:`compute_cigre601_dynamic_viscosity_of_air`,
+        :py:func:`compute_cigre601_air_density` and :py:func:`compute_cigre601_prandtl_number`.
+    """
+    return _compute_cigre601_air_properties(film_temperature, height_above_sea_level)
+
+
+# IEEE 738
+##########
+
+
+@vectorize(nopython=True, cache=True)
+def compute_ieee738_thermal_conductivity_of_air(film_temperature: Celsius) -> WattPerMeterPerKelvin:
+    r"""Thermal conductivity of air, equation (15a) on page 18 of :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_\text{film}~\left[^\circ\text{C}\right]`. The temperature of the air film
+        surrounding the conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`k_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The thermal conductivity
+        of air.
+    """
+    T_film = film_temperature
+    return (-4.407e-9 * T_film + 7.477e-5) * T_film + 2.424e-2
+
+
+@vectorize(nopython=True, cache=True)
+def compute_ieee738_dynamic_viscosity_of_air(
+    film_temperature: Celsius,
+) -> KilogramPerMeterPerSecond:
+    r"""Dynamic viscosity of air, equation (13a) on page 17 of :cite:p:`ieee738`.
+
+    The power :math:`(T_\text{film} + 273)^{1.5}` is computed with a square root.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_\text{film}~\left[^\circ\text{C}\right]`. The temperature of the air film
+        surrounding the conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\mu_f~\left[\text{kg}~\text{m}^{-1}~\text{s}^{-1}\right]`. The dynamic viscosity
+        of air.
+    """
+    T_film = film_temperature
+    T_film_273 = T_film + 273
+    return 1.458e-6 * (T_film_273 * np.sqrt(T_film_273)) / (T_film + 383.4)
+
+
+@vectorize(nopython=True, cache=True)
+def compute_ieee738_air_density(
+    film_temperature: Celsius, elevation: Meter
+) -> KilogramPerCubeMeter:
+    r"""Density of air, equation (14a) on page 17 of :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_\text{film}~\left[^\circ\text{C}\right]`. The temperature of the air film
+        surrounding the conductor.
+    elevation:
+        :math:`H_e~\left[\text{m}\right]`. The elevation of the conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\rho_f~\left[\text{kg}~\text{m}^{-3}\right]`. The mass density of air.
+    """
+    T_film = film_temperature
+    H_e = elevation
+    return ((6.379e-9 * H_e - 1.525e-4) * H_e + 1.293) / (1 + 0.00367 * T_film)
+
+
+@guvectorize(
+    ["void(float64, float64, float64[:], float64[:], float64[:], float64[:])"],
+    "(),()->(),(),(),()",
+    nopython=True,
+    cache=True,
+)
+def _compute_ieee738_air_properties(T_film, H_e, k_f, mu_f, rho_f, nu_f):
+    k_f[0] = compute_ieee738_thermal_conductivity_of_air(T_film)
+    mu_f[0] = compute_ieee738_dynamic_viscosity_of_air(T_film)
+    rho_f[0] = compute_ieee738_air_density(T_film, H_e)
+    nu_f[0] = mu_f[0] / rho_f[0]
+
+
+def compute_ieee738_air_properties(
+    film_temperature: Celsius, elevation: Meter
+) -> Tuple[
+    WattPerMeterPerKelvin, KilogramPerMeterPerSecond, KilogramPerCubeMeter, SquareMeterPerSecond
+]:
+    r"""Compute all properties of air from :cite:p:`ieee738` in one pass.
+
+    :cite:p:`ieee738` does not use the Prandtl number, so it is not computed.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_\text{film}~\left[^\circ\text{C}\right]`. The temperature of the air film
+        surrounding the conductor.
+    elevation:
+        :math:`H_e~\left[\text{m}\right]`. The elevation of the conductor.
+
+    Returns
+    -------
+    Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+        The thermal conductivity :math:`k_f`, the dynamic viscosity :math:`\mu_f`, the density
+        :math:`\rho_f` and the kinematic viscosity :math:`\nu_f = \mu_f / \rho_f`, see
+        :py:func:`compute_ieee738_thermal_conductivity_of_air`,
+        :py:func:`compute_ieee738_dynamic_viscosity_of_air` and
+        :py:func:`compute_ieee738_air_density`.
+    """
+    return _compute_ieee738_air_properties(film_temperature, elevation)
+
+
+# CIGRE 207
+###########
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre207_thermal_conductivity_of_air(
+    film_temperature: Celsius,
+) -> WattPerMeterPerKelvin:
+    r"""Thermal conductivity of air, page 5 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\lambda_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The thermal
+        conductivity of air.
+    """
+    return 7.2e-5 * film_temperature + 2.42e-2
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre207_kinematic_viscosity_of_air(film_temperature: Celsius) -> SquareMeterPerSecond:
+    r"""Kinematic viscosity of air, page 5 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\nu_f~\left[\text{m}^2~\text{s}^{-1}\right]`. The kinematic viscosity of air.
+    """
+    return 9.5e-8 * film_temperature + 1.32e-5
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre207_relative_air_density(height_above_sea_level: Meter) -> Unitless:
+    r"""Density of air relative to the density at sea level, page 6 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    height_above_sea_level:
+        :math:`y~\left[\text{m}\right]`. The conductor's altitude.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\rho_r`. The relative mass density of air.
+    """
+    return np.exp(-1.16e-4 * height_above_sea_level)
+
+
+@vectorize(nopython=True, cache=True)
+def compute_cigre207_prandtl_number(film_temperature: Celsius) -> Unitless:
+    r"""Prandtl number of air, page 5 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\text{Pr}`. The Prandtl number.
+    """
+    return -2.5e-4 * film_temperature + 0.715
+
+
+@guvectorize(
+    ["void(float64, float64[:], float64[:], float64[:])"], "()->(),(),()", nopython=True, cache=True
+)
+def _compute_cigre207_air_properties(T_f, lambda_f, nu_f, Pr):
+    lambda_f[0] = compute_cigre207_thermal_conductivity_of_air(T_f)
+    nu_f[0] = compute_cigre207_kinematic_viscosity_of_air(T_f)
+    Pr[0] = compute_cigre207_prandtl_number(T_f)
+
+
+def compute_cigre207_air_properties(
+    film_temperature: Celsius,
+) -> Tuple[WattPerMeterPerKelvin, SquareMeterPerSecond, Unitless]:
+    r"""Compute all temperature dependent properties of air from :cite:p:`cigre207` in one pass.
+
+    The relative density only depends on the altitude, see
+    :py:func:`compute_cigre207_relative_air_density`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f~\left[^\circ\text{C}\right]`. The temperature of the air film surrounding the
+        conductor.
+
+    Returns
+    -------
+    Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+        The thermal conductivity :math:`\lambda_f`, the kinematic viscosity :math:`\nu_f` and
+        the Prandtl number :math:`\text{Pr}`, see
+        :py:func:`compute_cigre207_thermal_conductivity_of_air`,
+        :py:func:`compute_cigre207_kinematic_viscosity_of_air` and
+        :py:func:`compute_cigre207_prandtl_number`.
+    """
+    return _compute_cigre207_air_properties(film_temperature)
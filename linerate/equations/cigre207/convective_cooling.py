@@ -3,15 +3,20 @@ import warnings
 import numpy as np
 
 from ...units import (
+    BoolOrBoolArray,
     Celsius,
     KilogramPerCubeMeter,
     Meter,
     MeterPerSecond,
+    PerKelvin,
     Radian,
     SquareMeterPerSecond,
+    SquareMeterPerSecondPerKelvin,
     Unitless,
     WattPerMeterPerKelvin,
+    WattPerMeterPerSquareKelvin,
 )
+from .. import air_properties
 
 # Physical quantities
 #####################
@@ -35,8 +40,30 @@ def compute_thermal_conductivity_of_air(film_temperature: Celsius) -> WattPerMet
         :math:`\lambda_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The thermal
         conductivity of air at the given temperature.
     """
-    T_f = film_temperature
-    return 2.42e-2 + 7.2e-5 * T_f
+    return air_properties.compute_cigre207_thermal_conductivity_of_air(film_temperature)
+
+
+def compute_thermal_conductivity_of_air_derivative(
+    film_temperature: Celsius,
+) -> WattPerMeterPerSquareKelvin:
+    r"""Derivative of the thermal conductivity of air with respect to the film temperature.
+
+    Derivative of the approximation on page 5 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f = 0.5 (T_s + T_a)~\left[^\circ\text{C}\right]`. The temperature of the
+        thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor sufrace temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \lambda_f / \partial T_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-2}\right]`.
+        The derivative of the thermal conductivity of air.
+    """
+    return 7.2e-5 + 0 * film_temperature
 
 
 def compute_relative_air_density(height_above_sea_level: Meter) -> Unitless:
@@ -55,8 +82,7 @@ def compute_relative_air_density(height_above_sea_level: Meter) -> Unitless:
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\rho_r`. The relative mass density of air.
     """
-    y = height_above_sea_level
-    return np.exp(-1.16e-4 * y)
+    return air_properties.compute_cigre207_relative_air_density(height_above_sea_level)
 
 
 def compute_kinematic_viscosity_of_air(film_temperature: Celsius) -> KilogramPerCubeMeter:
@@ -76,8 +102,30 @@ def compute_kinematic_viscosity_of_air(film_temperature: Celsius) -> KilogramPer
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\nu_f~\left[\text{m}^2~\text{s}^{-1}\right]`. The kinematic viscosity of air.
     """
-    T_f = film_temperature
-    return 1.32e-5 + 9.5e-8 * T_f
+    return air_properties.compute_cigre207_kinematic_viscosity_of_air(film_temperature)
+
+
+def compute_kinematic_viscosity_of_air_derivative(
+    film_temperature: Celsius,
+) -> SquareMeterPerSecondPerKelvin:
+    r"""Derivative of the kinematic viscosity of air with respect to the film temperature.
+
+    Derivative of the approximation on page 5 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f = 0.5 (T_s + T_a)~\left[^\circ\text{C}\right]`. The temperature of the
+        thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor sufrace temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \nu_f / \partial T_f~\left[\text{m}^2~\text{s}^{-1}~\text{K}^{-1}\right]`.
+        The derivative of the kinematic viscosity of air.
+    """
+    return 9.5e-8 + 0 * film_temperature
 
 
 def compute_prandtl_number(
@@ -101,7 +149,30 @@ def compute_prandtl_number(
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\text{Pr}`. The Prandtl number.
     """
-    return 0.715 - 2.5e-4 * film_temperature
+    return air_properties.compute_cigre207_prandtl_number(film_temperature)
+
+
+def compute_prandtl_number_derivative(
+    film_temperature: Celsius,
+) -> PerKelvin:
+    r"""Derivative of the Prandtl number with respect to the film temperature.
+
+    Derivative of the approximation on page 5 of :cite:p:`cigre207`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f = 0.5 (T_s + T_a)~\left[^\circ\text{C}\right]`. The temperature of the
+        thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor sufrace temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \text{Pr} / \partial T_f~\left[\text{K}^{-1}\right]`. The derivative
+        of the Prandtl number.
+    """
+    return -2.5e-4 + 0 * film_temperature
 
 
 def compute_reynolds_number(
@@ -143,18 +214,37 @@ def compute_reynolds_number(
 #############################
 
 
+def _get_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number):
+    """Boolean mask of the Reynolds numbers outside the range of the Nusselt number table."""
+    Re = reynolds_number
+    return np.logical_or(Re < 100, Re > 5e4)
+
+
 def _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number):
     Re = reynolds_number
     if np.any(Re < 0):
         raise ValueError("Reynolds number cannot be negative.")
 
-    if np.any(np.logical_or(Re < 100, Re > 5e4)):
+    if np.any(_get_perpendicular_flow_nusseltnumber_out_of_bounds(Re)):
         warnings.warn("Reynolds number is out of bounds", stacklevel=5)
 
 
+def _get_perpendicular_flow_nusseltnumber_coefficients(reynolds_number, conductor_roughness):
+    # From table on page 6 in Cigre207
+    Re = reynolds_number
+    Rs = conductor_roughness
+    conditions = [Re < 100, Re < 2.65e3, Rs <= 0.05]
+    B_choices = [0, 0.641, 0.178]
+    n_choices = [0, 0.471, 0.633]
+    B = np.select(conditions, B_choices, default=0.048)
+    n = np.select(conditions, n_choices, default=0.800)
+    return B, n
+
+
 def compute_perpendicular_flow_nusseltnumber(
     reynolds_number: Unitless,
     conductor_roughness: Meter,
+    validate: bool = True,
 ) -> Unitless:
     r"""Compute the Nusselt number for perpendicular flow.
 
@@ -166,24 +256,51 @@ def compute_perpendicular_flow_nusseltnumber(
         :math:`\text{Re}`. The Reynolds number.
     conductor_roughness:
         :math:`\text{Rs}`. The roughness number
+    validate:
+        If True, a ValueError is raised for negative Reynolds numbers, and a warning is issued for
+        Reynolds numbers outside the range of the table. If False, the checks are skipped, e.g.
+        because the inputs were already validated (see
+        :py:attr:`linerate.models.thermal_model.ThermalModel.validation`).
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\text{Nu}_{90}`. The perpendicular flow Nusselt number.
     """
-    _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number)
-    # From table on page 6 in Cigre207
+    if validate:
+        _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number)
     Re = reynolds_number
-    Rs = conductor_roughness
-    conditions = [Re < 100, Re < 2.65e3, Rs <= 0.05]
-    B_choices = [0, 0.641, 0.178]
-    n_choices = [0, 0.471, 0.633]
-    B = np.select(conditions, B_choices, default=0.048)
-    n = np.select(conditions, n_choices, default=0.800)
+    B, n = _get_perpendicular_flow_nusseltnumber_coefficients(Re, conductor_roughness)
     return B * Re**n
 
 
+def compute_perpendicular_flow_nusseltnumber_exponent(
+    reynolds_number: Unitless,
+    conductor_roughness: Meter,
+) -> Unitless:
+    r"""Compute the Reynolds number exponent of the perpendicular flow Nusselt number.
+
+    The perpendicular flow Nusselt number is given by :math:`\text{Nu}_{90} = B \text{Re}^n`,
+    (table on page 6 of :cite:p:`cigre207`). This function returns :math:`n`, which is also the
+    logarithmic derivative, :math:`\partial \ln \text{Nu}_{90} / \partial \ln \text{Re}`.
+
+    Parameters
+    ----------
+    reynolds_number:
+        :math:`\text{Re}`. The Reynolds number.
+    conductor_roughness:
+        :math:`\text{Rs}`. The roughness number
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`n`. The Reynolds number exponent.
+    """
+    return _get_perpendicular_flow_nusseltnumber_coefficients(reynolds_number, conductor_roughness)[
+        1
+    ]
+
+
 def compute_low_wind_speed_nusseltnumber(
     perpendicular_flow_nusselt_number: Unitless,
 ) -> Unitless:
@@ -243,6 +360,14 @@ def correct_wind_direction_effect_on_nusselt_number(
 #############################################
 
 
+def _get_horizontal_natural_nusselt_number_out_of_bounds(
+    grashof_number: Unitless, prandtl_number: Unitless
+) -> BoolOrBoolArray:
+    r"""Boolean mask of the :math:`\text{Gr}\text{Pr}` values outside the valid range."""
+    GrPr = grashof_number * prandtl_number
+    return np.logical_or(GrPr < 0, GrPr >= 1e12)
+
+
 def _check_horizontal_natural_nusselt_number(
     grashof_number: Unitless, prandtl_number: Unitless
 ) -> None:
@@ -253,9 +378,23 @@ def _check_horizontal_natural_nusselt_number(
         raise ValueError("GrPr out of bounds: Must be < 10^12.")
 
 
+def _get_horizontal_natural_nusselt_number_coefficients(grashof_prandtl_product):
+    GrPr = grashof_prandtl_product
+    # CIGRE 207 only allows GrPr in the range 1e2-1e6.
+    # In Incropera (2006), Table 9.1, the same values appear, but the table covers a wider range
+    # from 1e-10 to 1e12, which we use here
+    conditions = [GrPr < 1e-2, GrPr < 1e2, GrPr < 1e4, GrPr < 1e7, GrPr < 1e12]
+    n_choices = [0.058, 0.148, 0.188, 0.250, 0.333]
+    C_choices = [0.0675, 1.02, 0.850, 0.480, 0.125]
+    C = np.select(conditions, C_choices, default=np.nan)
+    n = np.select(conditions, n_choices, default=np.nan)
+    return C, n
+
+
 def compute_horizontal_natural_nusselt_number(
     grashof_number: Unitless,
     prandtl_number: Unitless,
+    validate: bool = True,
 ) -> Unitless:
     r"""The Nusselt number for natural (passive) convection on a horizontal conductor.
 
@@ -268,25 +407,50 @@ def compute_horizontal_natural_nusselt_number(
         :math:`\text{Gr}`. The Grashof number.
     prandtl_number:
         :math:`\text{Pr}`. The Prandtl number.
+    validate:
+        If True, a ValueError is raised if :math:`\text{Gr}\text{Pr}` is negative or at least
+        :math:`10^{12}`. If False, the check is skipped, e.g. because the inputs were already
+        validated (see :py:attr:`linerate.models.thermal_model.ThermalModel.validation`).
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\text{Nu}_0`. The natural convection nusselt number assuming horizontal conductor.
     """
-    _check_horizontal_natural_nusselt_number(grashof_number, prandtl_number)
+    if validate:
+        _check_horizontal_natural_nusselt_number(grashof_number, prandtl_number)
     GrPr = grashof_number * prandtl_number
-    # CIGRE 207 only allows GrPr in the range 1e2-1e6.
-    # In Incropera (2006), Table 9.1, the same values appear, but the table covers a wider range
-    # from 1e-10 to 1e12, which we use here
-    conditions = [GrPr < 1e-2, GrPr < 1e2, GrPr < 1e4, GrPr < 1e7, GrPr < 1e12]
-    n_choices = [0.058, 0.148, 0.188, 0.250, 0.333]
-    C_choices = [0.0675, 1.02, 0.850, 0.480, 0.125]
-    C = np.select(conditions, C_choices, default=np.nan)
-    n = np.select(conditions, n_choices, default=np.nan)
+    C, n = _get_horizontal_natural_nusselt_number_coefficients(GrPr)
     return C * GrPr**n
 
 
+def compute_horizontal_natural_nusselt_number_exponent(
+    grashof_number: Unitless,
+    prandtl_number: Unitless,
+) -> Unitless:
+    r"""Compute the exponent of the natural convection Nusselt number.
+
+    The natural convection Nusselt number is given by :math:`\text{Nu}_0 = C (\text{Gr}\text{Pr})^n`
+    (Table II on page 7 of :cite:p:`cigre207` and Table 9.1 of :cite:p:`incropera2007`). This
+    function returns :math:`n`, which is also the logarithmic derivative,
+    :math:`\partial \ln \text{Nu}_0 / \partial \ln (\text{Gr}\text{Pr})`.
+
+    Parameters
+    ----------
+    grashof_number:
+        :math:`\text{Gr}`. The Grashof number.
+    prandtl_number:
+        :math:`\text{Pr}`. The Prandtl number.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`n`. The exponent of :math:`\text{Gr}\text{Pr}`.
+    """
+    GrPr = grashof_number * prandtl_number
+    return _get_horizontal_natural_nusselt_number_coefficients(GrPr)[1]
+
+
 def compute_nusselt_number(
     forced_convection_nusselt_number: Unitless,
     natural_nusselt_number: Unitless,
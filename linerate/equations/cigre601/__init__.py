@@ -2,4 +2,4 @@
 This submodule contains implementations of equations listed in :cite:p:`cigre601`.
 """
 
-from . import convective_cooling, solar_heating  # noqa
+from . import convective_cooling, heat_balance, solar_heating  # noqa
@@ -1,19 +1,24 @@
 import warnings
 
 import numpy as np
-from numba import vectorize
+from numba import njit, vectorize
 
 from ...units import (
+    BoolOrBoolArray,
     Celsius,
     KilogramPerCubeMeter,
+    KilogramPerCubeMeterPerKelvin,
     KilogramPerMeterPerSecond,
+    KilogramPerMeterPerSecondPerKelvin,
     Meter,
     Radian,
     SquareMeterPerSecond,
     Unitless,
     WattPerMeter,
     WattPerMeterPerKelvin,
+    WattPerMeterPerSquareKelvin,
 )
+from .. import air_properties
 
 # Physical quantities
 #####################
@@ -88,8 +93,31 @@ def compute_thermal_conductivity_of_air(film_temperature: Celsius) -> WattPerMet
         :math:`\lambda_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The thermal
         conductivity of air at the given temperature.
     """
+    return air_properties.compute_cigre601_thermal_conductivity_of_air(film_temperature)
+
+
+def compute_thermal_conductivity_of_air_derivative(
+    film_temperature: Celsius,
+) -> WattPerMeterPerSquareKelvin:
+    r"""Derivative of the thermal conductivity of air with respect to the film temperature.
+
+    Derivative of Equation (18) on page 24 of :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f = 0.5 (T_s + T_a)~\left[^\circ\text{C}\right]`. The temperature of the
+        thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor sufrace temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \lambda_f / \partial T_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-2}\right]`.
+        The derivative of the thermal conductivity of air.
+    """
     T_f = film_temperature
-    return 2.368e-2 + 7.23e-5 * T_f - 2.763e-8 * (T_f**2)
+    return 7.23e-5 - 2 * 2.763e-8 * T_f
 
 
 def compute_air_density(
@@ -113,9 +141,34 @@ def compute_air_density(
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\gamma~\left[\text{kg}~\text{m}^{-3}\right]`. The mass density of air.
     """
+    return air_properties.compute_cigre601_air_density(film_temperature, height_above_sea_level)
+
+
+def compute_air_density_derivative(
+    film_temperature: Celsius, height_above_sea_level: Meter
+) -> KilogramPerCubeMeterPerKelvin:
+    r"""Derivative of the density of air with respect to the film temperature.
+
+    Derivative of Equation (20) on page 25 of :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f = 0.5 (T_s + T_a)~\left[^\circ\text{C}\right]`. The temperature of the
+        thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor sufrace temperature.
+    height_above_sea_level:
+        :math:`y~\left[\text{m}\right]`. The conductor's altitude.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \gamma / \partial T_f~\left[\text{kg}~\text{m}^{-3}~\text{K}^{-1}\right]`.
+        The derivative of the mass density of air.
+    """
     T_f = film_temperature
     y = height_above_sea_level
-    return (1.293 - 1.525e-4 * y + 6.379e-9 * (y**2)) / (1 + 0.00367 * T_f)
+    return -0.00367 * (1.293 - 1.525e-4 * y + 6.379e-9 * (y**2)) / (1 + 0.00367 * T_f) ** 2
 
 
 def compute_dynamic_viscosity_of_air(film_temperature: Celsius) -> KilogramPerMeterPerSecond:
@@ -136,8 +189,31 @@ def compute_dynamic_viscosity_of_air(film_temperature: Celsius) -> KilogramPerMe
         :math:`\mu_f~\left[\text{kg}~\text{m}^{-1}~\text{s}^{-1}\right]`. The dynamic viscosity
         of air.
     """
+    return air_properties.compute_cigre601_dynamic_viscosity_of_air(film_temperature)
+
+
+def compute_dynamic_viscosity_of_air_derivative(
+    film_temperature: Celsius,
+) -> KilogramPerMeterPerSecondPerKelvin:
+    r"""Derivative of the dynamic viscosity of air with respect to the film temperature.
+
+    Derivative of Equation (19) on page 25 of :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`T_f = 0.5 (T_s + T_a)~\left[^\circ\text{C}\right]`. The temperature of the
+        thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor sufrace temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \mu_f / \partial T_f~\left[\text{kg}~\text{m}^{-1}~\text{s}^{-1}
+        ~\text{K}^{-1}\right]`. The derivative of the dynamic viscosity of air.
+    """
     T_f = film_temperature
-    return 17.239e-6 + 4.635e-8 * T_f - 2.03e-11 * (T_f**2)
+    return 4.635e-8 - 2 * 2.03e-11 * T_f
 
 
 def compute_kinematic_viscosity_of_air(
@@ -167,33 +243,35 @@ def compute_kinematic_viscosity_of_air(
 #############################
 
 
-def _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number, conductor_roughness):
+def _get_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number, conductor_roughness):
+    """Boolean mask of the Reynolds numbers outside the range of the Nusselt number table."""
     Re = reynolds_number
     Rs = conductor_roughness
-    if np.any(Re < 0):
-        raise ValueError("Reynolds number cannot be negative.")
-
     smooth_mask = np.logical_or(Rs == 0, np.isnan(Rs))
     smooth_out_of_bounds = Re > 200_000
     rough_out_of_bounds = np.logical_and(np.logical_not(smooth_mask), Re > 50_000)
-    out_of_bounds = np.logical_or(smooth_out_of_bounds, rough_out_of_bounds)
+    return np.logical_or(Re < 0, np.logical_or(smooth_out_of_bounds, rough_out_of_bounds))
 
+
+def _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number, conductor_roughness):
+    Re = reynolds_number
+    if np.any(Re < 0):
+        raise ValueError("Reynolds number cannot be negative.")
+
+    out_of_bounds = _get_perpendicular_flow_nusseltnumber_out_of_bounds(Re, conductor_roughness)
     if np.any(out_of_bounds):
         warnings.warn("Reynolds number is out of bounds", stacklevel=5)
 
 
-@vectorize(nopython=True)
-def _compute_perpendicular_flow_nusseltnumber(
-    reynolds_number: Unitless,
-    conductor_roughness: Meter,
-) -> Unitless:
+@njit(cache=True)
+def _get_perpendicular_flow_nusseltnumber_coefficients(reynolds_number, conductor_roughness):
     # TODO: Look at references for this table
     Re = reynolds_number
     Rs = conductor_roughness
 
     if Rs == 0 or np.isnan(Rs):
         if Re < 35:
-            B, n = 0, 0
+            B, n = 0.0, 0.0
         elif Re < 5000:
             B, n = 0.583, 0.471
         elif Re < 50_000:
@@ -202,25 +280,46 @@ def _compute_perpendicular_flow_nusseltnumber(
             B, n = 0.0208, 0.814
     elif Rs <= 0.05:
         if Re < 100:
-            B, n = 0, 0
+            B, n = 0.0, 0.0
         elif Re < 2650:
             B, n = 0.641, 0.471
         else:
             B, n = 0.178, 0.633
     else:
         if Re < 100:
-            B, n = 0, 0
+            B, n = 0.0, 0.0
         elif Re < 2650:
             B, n = 0.641, 0.471
         else:
             B, n = 0.048, 0.800
 
+    return B, n
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_perpendicular_flow_nusseltnumber(
+    reynolds_number: Unitless,
+    conductor_roughness: Meter,
+) -> Unitless:
+    Re = reynolds_number
+    B, n = _get_perpendicular_flow_nusseltnumber_coefficients(Re, conductor_roughness)
     return B * Re**n  # type: ignore
 
 
+@vectorize(nopython=True, cache=True)
+def _compute_perpendicular_flow_nusseltnumber_exponent(
+    reynolds_number: Unitless,
+    conductor_roughness: Meter,
+) -> Unitless:
+    return _get_perpendicular_flow_nusseltnumber_coefficients(reynolds_number, conductor_roughness)[
+        1
+    ]
+
+
 def compute_perpendicular_flow_nusseltnumber(
     reynolds_number: Unitless,
     conductor_roughness: Meter,
+    validate: bool = True,
 ) -> Unitless:
     r"""Compute the Nusselt number for perpendicular flow.
 
@@ -237,20 +336,56 @@ def compute_perpendicular_flow_nusseltnumber(
         :math:`\text{Re}`. The Reynolds number.
     conductor_roughness:
         :math:`\text{Rs}`. The roughness number
+    validate:
+        If True, a ValueError is raised for negative Reynolds numbers, and a warning is issued for
+        Reynolds numbers outside the range of the table. If False, the checks are skipped, e.g.
+        because the inputs were already validated (see
+        :py:attr:`linerate.models.thermal_model.ThermalModel.validation`).
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\text{Nu}_{90}`. The perpendicular flow Nusselt number.
     """
-    _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number, conductor_roughness)
+    if validate:
+        _check_perpendicular_flow_nusseltnumber_out_of_bounds(reynolds_number, conductor_roughness)
     return _compute_perpendicular_flow_nusseltnumber(
         reynolds_number,
         conductor_roughness,
     )
 
 
-@vectorize(nopython=True)
+def compute_perpendicular_flow_nusseltnumber_exponent(
+    reynolds_number: Unitless,
+    conductor_roughness: Meter,
+) -> Unitless:
+    r"""Compute the Reynolds number exponent of the perpendicular flow Nusselt number.
+
+    Table 4 on page 26 of :cite:p:`cigre601`. The perpendicular flow Nusselt number is given by
+    :math:`\text{Nu}_{90} = B \text{Re}^n`, where the coefficients :math:`B` and :math:`n` depend
+    on the Reynolds number and the conductor roughness. This function returns :math:`n`, which
+    is also the logarithmic derivative,
+    :math:`\partial \ln \text{Nu}_{90} / \partial \ln \text{Re}`.
+
+    Parameters
+    ----------
+    reynolds_number:
+        :math:`\text{Re}`. The Reynolds number.
+    conductor_roughness:
+        :math:`\text{Rs}`. The roughness number
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`n`. The Reynolds number exponent.
+    """
+    return _compute_perpendicular_flow_nusseltnumber_exponent(
+        reynolds_number,
+        conductor_roughness,
+    )
+
+
+@vectorize(nopython=True, cache=True)
 def _correct_wind_direction_effect_on_nusselt_number(
     perpendicular_flow_nusselt_number: Unitless,
     angle_of_attack: Radian,
@@ -313,6 +448,14 @@ def correct_wind_direction_effect_on_nusselt_number(
 #############################################
 
 
+def _get_horizontal_natural_nusselt_number_out_of_bounds(
+    grashof_number: Unitless, prandtl_number: Unitless
+) -> BoolOrBoolArray:
+    r"""Boolean mask of the :math:`\text{Gr}\text{Pr}` values outside the valid range."""
+    GrPr = grashof_number * prandtl_number
+    return np.logical_or(GrPr < 0, GrPr > 1e12)
+
+
 def _check_horizontal_natural_nusselt_number(
     grashof_number: Unitless, prandtl_number: Unitless
 ) -> None:
@@ -323,28 +466,45 @@ def _check_horizontal_natural_nusselt_number(
         raise ValueError("GrPr out of bounds: Must be < 10^12.")
 
 
-@vectorize(nopython=True)
-def _compute_horizontal_natural_nusselt_number(
-    grashof_number: Unitless,
-    prandtl_number: Unitless,
-) -> Unitless:
-    GrPr = grashof_number * prandtl_number
+@njit(cache=True)
+def _get_horizontal_natural_nusselt_number_coefficients(grashof_prandtl_product):
+    GrPr = grashof_prandtl_product
 
     if GrPr < 1e-1:
-        return 0
+        return 0.0, 0.0
     elif GrPr < 1e2:
-        return 1.020 * GrPr**0.148
+        return 1.020, 0.148
     elif GrPr < 1e4:
-        return 0.850 * GrPr**0.188
+        return 0.850, 0.188
     elif GrPr < 1e7:
-        return 0.480 * GrPr**0.250
+        return 0.480, 0.250
     else:
-        return 0.125 * GrPr**0.333
+        return 0.125, 0.333
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_horizontal_natural_nusselt_number(
+    grashof_number: Unitless,
+    prandtl_number: Unitless,
+) -> Unitless:
+    GrPr = grashof_number * prandtl_number
+    A, m = _get_horizontal_natural_nusselt_number_coefficients(GrPr)
+    return A * GrPr**m
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_horizontal_natural_nusselt_number_exponent(
+    grashof_number: Unitless,
+    prandtl_number: Unitless,
+) -> Unitless:
+    GrPr = grashof_number * prandtl_number
+    return _get_horizontal_natural_nusselt_number_coefficients(GrPr)[1]
 
 
 def compute_horizontal_natural_nusselt_number(
     grashof_number: Unitless,
     prandtl_number: Unitless,
+    validate: bool = True,
 ) -> Unitless:
     r"""The Nusselt number for natural (passive) convection on a horizontal conductor.
 
@@ -363,37 +523,82 @@ def compute_horizontal_natural_nusselt_number(
         :math:`\text{Gr}`. The Grashof number.
     prandtl_number:
         :math:`\text{Pr}`. The Prandtl number.
+    validate:
+        If True, a ValueError is raised if :math:`\text{Gr}\text{Pr}` is negative or greater than
+        :math:`10^{12}`. If False, the check is skipped, e.g. because the inputs were already
+        validated (see :py:attr:`linerate.models.thermal_model.ThermalModel.validation`).
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\text{Nu}_0`. The natural convection nusselt number assuming horizontal conductor.
     """
-    _check_horizontal_natural_nusselt_number(grashof_number, prandtl_number)
+    if validate:
+        _check_horizontal_natural_nusselt_number(grashof_number, prandtl_number)
     return _compute_horizontal_natural_nusselt_number(
         grashof_number,
         prandtl_number,
     )
 
 
-def _check_conductor_inclination(
+def compute_horizontal_natural_nusselt_number_exponent(
+    grashof_number: Unitless,
+    prandtl_number: Unitless,
+) -> Unitless:
+    r"""Compute the exponent of the natural convection Nusselt number.
+
+    Table 5 on page 28 of :cite:p:`cigre601`. The natural convection Nusselt number is given by
+    :math:`\text{Nu}_0 = A (\text{Gr}\text{Pr})^m`, where the coefficients :math:`A` and
+    :math:`m` depend on :math:`\text{Gr}\text{Pr}`. This function returns :math:`m`, which is
+    also the logarithmic derivative,
+    :math:`\partial \ln \text{Nu}_0 / \partial \ln (\text{Gr}\text{Pr})`.
+
+    Parameters
+    ----------
+    grashof_number:
+        :math:`\text{Gr}`. The Grashof number.
+    prandtl_number:
+        :math:`\text{Pr}`. The Prandtl number.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`m`. The exponent of :math:`\text{Gr}\text{Pr}`.
+    """
+    return _compute_horizontal_natural_nusselt_number_exponent(
+        grashof_number,
+        prandtl_number,
+    )
+
+
+def _get_conductor_inclination_out_of_bounds(
     conductor_inclination: Radian,
     conductor_roughness: Unitless,
-) -> None:
+) -> BoolOrBoolArray:
+    """Boolean mask of the inclinations outside the range of the inclination correction."""
     beta = np.degrees(conductor_inclination)
     Rs = conductor_roughness
 
     smooth_mask = np.logical_or(Rs == 0, np.isnan(Rs))
     smooth_out_of_bounds = np.logical_and(smooth_mask, beta > 60)
     rough_out_of_bounds = np.logical_and(np.logical_not(smooth_mask), beta > 80)
-    out_of_bounds = np.logical_or(smooth_out_of_bounds, rough_out_of_bounds)
+    return np.logical_or(smooth_out_of_bounds, rough_out_of_bounds)
+
+
+def _check_conductor_inclination(
+    conductor_inclination: Radian,
+    conductor_roughness: Unitless,
+) -> None:
+    out_of_bounds = _get_conductor_inclination_out_of_bounds(
+        conductor_inclination, conductor_roughness
+    )
     if np.any(out_of_bounds):
         raise ValueError(
             "Inclination must be < 60° for smooth conductors and 80° for stranded conductors"
         )
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _correct_natural_nusselt_number_inclination(
     horizontal_natural_nusselt_number: Unitless,
     conductor_inclination: Radian,
@@ -413,6 +618,7 @@ def correct_natural_nusselt_number_inclination(
     horizontal_natural_nusselt_number: Unitless,
     conductor_inclination: Radian,
     conductor_roughness: Unitless,
+    validate: bool = True,
 ) -> Unitless:
     r"""Correct the natural Nusselt number for the effect of the span inclination.
 
@@ -430,6 +636,11 @@ def correct_natural_nusselt_number_inclination(
         length of the span .
     conductor_roughness:
         :math:`Rs`. The roughness number.
+    validate:
+        If True, a ValueError is raised if the inclination is greater than :math:`60^\circ` for
+        smooth conductors or :math:`80^\circ` for stranded conductors. If False, the check is
+        skipped, e.g. because the inputs were already validated (see
+        :py:attr:`linerate.models.thermal_model.ThermalModel.validation`).
 
     Returns
     -------
@@ -437,7 +648,8 @@ def correct_natural_nusselt_number_inclination(
         :math:`\text{Nu}_\beta`. The natural convection nusselt number where the conductor
         inclination is taken into account.
     """
-    _check_conductor_inclination(conductor_inclination, conductor_roughness)
+    if validate:
+        _check_conductor_inclination(conductor_inclination, conductor_roughness)
     return _correct_natural_nusselt_number_inclination(
         horizontal_natural_nusselt_number,
         conductor_inclination,
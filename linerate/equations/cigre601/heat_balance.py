@@ -0,0 +1,537 @@
+"""
+Fused, compiled evaluation of the full CIGRE 601 heat balance.
+
+The functions in this module evaluate the same equations as the ``joule_heating``,
+``radiative_cooling`` and ``cigre601.convective_cooling`` modules, but element by element in a
+single compiled pass. No intermediate arrays are allocated for the air properties, dimensionless
+numbers or Nusselt numbers, which makes the heat balance considerably cheaper for large arrays.
+
+The module also contains compiled solvers, used by ``Cigre601`` with ``engine="compiled"``, that
+run the root finding for each element separately with the heat balance inlined.
+"""
+
+import numpy as np
+from numba import njit, vectorize
+from scipy.constants import Stefan_Boltzmann as stefan_boltzmann_constant
+
+from ...units import (
+    Ampere,
+    Celsius,
+    Meter,
+    MeterPerSecond,
+    OhmPerMeter,
+    SquareMeter,
+    SquareMeterPerAmpere,
+    Unitless,
+    WattPerMeter,
+)
+from .. import air_properties
+from .convective_cooling import (
+    _get_horizontal_natural_nusselt_number_coefficients,
+    _get_perpendicular_flow_nusseltnumber_coefficients,
+)
+
+_COEFFICIENT_OF_GRAVITY = 9.807
+
+
+@njit(cache=True)
+def _compute_convective_cooling(
+    T_s,
+    T_a,
+    V,
+    y,
+    D,
+    Rs,
+    max_Re,
+    wind_direction_correction_factor,
+    inclination_correction_factor,
+):
+    T_f = 0.5 * (T_s + T_a)
+
+    # Air properties, equations (18)-(20)
+    lambda_f = air_properties.compute_cigre601_thermal_conductivity_of_air(T_f)
+    mu_f = air_properties.compute_cigre601_dynamic_viscosity_of_air(T_f)
+    gamma_f = air_properties.compute_cigre601_air_density(T_f, y)
+    nu_f = mu_f / gamma_f
+
+    # Dimensionless numbers
+    Re = V * D / nu_f
+    if Re > max_Re:
+        Re = max_Re
+    Gr = (D**3) * np.abs(T_s - T_a) * _COEFFICIENT_OF_GRAVITY / ((T_f + 273.15) * (nu_f**2))
+    Pr = air_properties.SPECIFIC_HEAT_CAPACITY_OF_AIR * mu_f / lambda_f
+
+    # Nusselt numbers, equations (21)-(24)
+    B, n = _get_perpendicular_flow_nusseltnumber_coefficients(Re, Rs)
+    Nu_delta = wind_direction_correction_factor * (B * Re**n)
+
+    GrPr = Gr * Pr
+    A, m = _get_horizontal_natural_nusselt_number_coefficients(GrPr)
+    Nu_beta = inclination_correction_factor * (A * GrPr**m)
+
+    # Same NaN-propagation as np.maximum
+    if np.isnan(Nu_delta) or np.isnan(Nu_beta):
+        Nu = np.nan
+    elif Nu_delta >= Nu_beta:
+        Nu = Nu_delta
+    else:
+        Nu = Nu_beta
+
+    return np.pi * lambda_f * (T_s - T_a) * Nu
+
+
+@njit(cache=True)
+def _heat_balance(
+    conductor_temperature,
+    current,
+    air_temperature,
+    wind_speed,
+    height_above_sea_level,
+    conductor_diameter,
+    conductor_roughness,
+    max_reynolds_number,
+    wind_direction_correction_factor,
+    inclination_correction_factor,
+    solar_heating,
+    conductor_emissivity,
+    temperature1,
+    temperature2,
+    resistance_at_temperature1,
+    resistance_at_temperature2,
+    aluminium_cross_section_area,
+    constant_magnetic_effect,
+    current_density_proportional_magnetic_effect,
+    max_relative_increase,
+):
+    T_s = conductor_temperature
+    I = current  # noqa
+    T_a = air_temperature
+    D = conductor_diameter
+
+    # Joule heating
+    a = (resistance_at_temperature2 - resistance_at_temperature1) / (temperature2 - temperature1)
+    b = resistance_at_temperature1 - a * temperature1
+    R = a * T_s + b
+    relative_increase = constant_magnetic_effect
+    if current_density_proportional_magnetic_effect != 0:
+        J = I / aluminium_cross_section_area
+        relative_increase += J * current_density_proportional_magnetic_effect
+    if relative_increase > max_relative_increase:
+        relative_increase = max_relative_increase
+    P_j = I * I * (relative_increase * R)
+
+    P_c = _compute_convective_cooling(
+        T_s,
+        T_a,
+        wind_speed,
+        height_above_sea_level,
+        D,
+        conductor_roughness,
+        max_reynolds_number,
+        wind_direction_correction_factor,
+        inclination_correction_factor,
+    )
+
+    P_r = (
+        np.pi
+        * D
+        * stefan_boltzmann_constant
+        * conductor_emissivity
+        * ((T_s + 273.15) ** 4 - (T_a + 273.15) ** 4)
+    )
+
+    return P_j + solar_heating - P_c - P_r
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_heat_balance(
+    conductor_temperature,
+    current,
+    air_temperature,
+    wind_speed,
+    height_above_sea_level,
+    conductor_diameter,
+    conductor_roughness,
+    max_reynolds_number,
+    wind_direction_correction_factor,
+    inclination_correction_factor,
+    solar_heating,
+    conductor_emissivity,
+    temperature1,
+    temperature2,
+    resistance_at_temperature1,
+    resistance_at_temperature2,
+    aluminium_cross_section_area,
+    constant_magnetic_effect,
+    current_density_proportional_magnetic_effect,
+    max_relative_increase,
+):
+    return _heat_balance(
+        conductor_temperature,
+        current,
+        air_temperature,
+        wind_speed,
+        height_above_sea_level,
+        conductor_diameter,
+        conductor_roughness,
+        max_reynolds_number,
+        wind_direction_correction_factor,
+        inclination_correction_factor,
+        solar_heating,
+        conductor_emissivity,
+        temperature1,
+        temperature2,
+        resistance_at_temperature1,
+        resistance_at_temperature2,
+        aluminium_cross_section_area,
+        constant_magnetic_effect,
+        current_density_proportional_magnetic_effect,
+        max_relative_increase,
+    )
+
+
+def compute_heat_balance(
+    conductor_temperature: Celsius,
+    current: Ampere,
+    air_temperature: Celsius,
+    wind_speed: MeterPerSecond,
+    height_above_sea_level: Meter,
+    conductor_diameter: Meter,
+    conductor_roughness: Unitless,
+    max_reynolds_number: Unitless,
+    wind_direction_correction_factor: Unitless,
+    inclination_correction_factor: Unitless,
+    solar_heating: WattPerMeter,
+    conductor_emissivity: Unitless,
+    temperature1: Celsius,
+    temperature2: Celsius,
+    resistance_at_temperature1: OhmPerMeter,
+    resistance_at_temperature2: OhmPerMeter,
+    aluminium_cross_section_area: SquareMeter,
+    constant_magnetic_effect: Unitless,
+    current_density_proportional_magnetic_effect: SquareMeterPerAmpere,
+    max_relative_increase: Unitless,
+) -> WattPerMeter:
+    r"""Compute the CIGRE 601 heat balance, :math:`P_J + P_s - P_c - P_r`, in one compiled pass.
+
+    Equations (18)-(24) and (27) on pages 24-30 of :cite:p:`cigre601`, combined with the linear
+    resistance model and the ACSR magnetic core correction of
+    :py:func:`linerate.equations.joule_heating.correct_resistance_acsr_magnetic_core_loss`.
+
+    All arguments are broadcast against each other and the heat balance is computed element by
+    element without allocating intermediate arrays. The result is equal to combining the
+    individual equations, with a relative difference of at most a few units in the last place.
+    Unlike the individual equations, no bounds checks are performed on the Reynolds number
+    and :math:`\text{Gr}\text{Pr}`, since that would require intermediate arrays.
+
+    The solar heating and the correction factors for the wind direction and conductor inclination
+    do not depend on the conductor temperature or the current, and are therefore passed as
+    arguments. The wind direction correction factor is given by
+    :py:func:`linerate.equations.cigre601.convective_cooling.correct_wind_direction_effect_on_nusselt_number`
+    with :math:`\text{Nu}_{90} = 1` and the inclination correction factor is given by
+    :py:func:`linerate.equations.cigre601.convective_cooling.correct_natural_nusselt_number_inclination`
+    with :math:`\text{Nu}_0 = 1`.
+
+    Parameters
+    ----------
+    conductor_temperature:
+        :math:`T_s~\left[^\circ\text{C}\right]`. The conductor temperature.
+    current:
+        :math:`I~\left[\text{A}\right]`. The current going through the conductor.
+    air_temperature:
+        :math:`T_a~\left[^\circ\text{C}\right]`. The ambient air temperature.
+    wind_speed:
+        :math:`v~\left[\text{m}~\text{s}^{-1}\right]`. The wind speed.
+    height_above_sea_level:
+        :math:`y~\left[\text{m}\right]`. The conductor's altitude.
+    conductor_diameter:
+        :math:`D~\left[\text{m}\right]`. Outer diameter of the conductor.
+    conductor_roughness:
+        :math:`\text{Rs}`. The roughness number.
+    max_reynolds_number:
+        The Reynolds number is clipped to this value before computing the Nusselt number.
+    wind_direction_correction_factor:
+        :math:`\text{Nu}_\delta / \text{Nu}_{90}`. Correction for the wind's angle-of-attack.
+    inclination_correction_factor:
+        :math:`\text{Nu}_\beta / \text{Nu}_0`. Correction for the conductor inclination.
+    solar_heating:
+        :math:`P_s~\left[\text{W}~\text{m}^{-1}\right]`. The solar heating.
+    conductor_emissivity:
+        :math:`\epsilon_s`. The emissivity of the conductor surface.
+    temperature1:
+        :math:`T_1~\left[^\circ\text{C}\right]`. The first temperature measurement.
+    temperature2:
+        :math:`T_2~\left[^\circ\text{C}\right]`. The second temperature measurement.
+    resistance_at_temperature1:
+        :math:`R_1~\left[\Omega~\text{m}^{-1}\right]`. The resistance at temperature :math:`T=T_1`.
+    resistance_at_temperature2:
+        :math:`R_2~\left[\Omega~\text{m}^{-1}\right]`. The resistance at temperature :math:`T=T_2`.
+    aluminium_cross_section_area:
+        :math:`A_{\text{Al}}~\left[\text{m}^2\right]`. The cross sectional area of the aluminium
+        strands in the conductor.
+    constant_magnetic_effect:
+        :math:`b`. The constant magnetic effect. Use :math:`1` for no correction.
+    current_density_proportional_magnetic_effect:
+        :math:`m`. The current density proportional magnetic effect. Use :math:`0` for no
+        current dependent correction, in which case the aluminium cross section area is not used.
+    max_relative_increase:
+        :math:`c_\text{max}`. Saturation point of the relative increase in conductor resistance.
+        Use :math:`\infty` for no saturation.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`P_J + P_s - P_c - P_r~\left[\text{W}~\text{m}^{-1}\right]`. The heat balance.
+    """
+    return _compute_heat_balance(
+        conductor_temperature,
+        current,
+        air_temperature,
+        wind_speed,
+        height_above_sea_level,
+        conductor_diameter,
+        conductor_roughness,
+        max_reynolds_number,
+        wind_direction_correction_factor,
+        inclination_correction_factor,
+        solar_heating,
+        conductor_emissivity,
+        temperature1,
+        temperature2,
+        resistance_at_temperature1,
+        resistance_at_temperature2,
+        aluminium_cross_section_area,
+        constant_magnetic_effect,
+        current_density_proportional_magnetic_effect,
+        max_relative_increase,
+    )
+
+
+# Compiled root finding
+#######################
+
+#: Root finding methods supported by the compiled solvers, mapped to the codes used in the kernels.
+_ROOT_FINDER_CODES = {"bisect": 0, "chandrupatla": 1}
+
+#: Returned by the compiled solvers if the heat balance has the same sign at both bracket ends.
+_INVALID_BRACKET = np.inf
+
+
+@njit(cache=True)
+def _evaluate_heat_balance(x, other, solve_for_current, parameters):
+    """The heat balance with ``x`` as the current and ``other`` as the conductor temperature if
+    ``solve_for_current``, and the other way around otherwise.
+
+    The unknown is selected with a flag instead of passing the heat balance function to the root
+    finder, since compiled functions that take other compiled functions as arguments cannot be
+    cached on disk. The root finder is inlined into the solver kernels, where the flag is a
+    constant, so the compiler removes the branch.
+    """
+    if solve_for_current:
+        return _heat_balance(other, x, *parameters)
+    return _heat_balance(x, other, *parameters)
+
+
+@njit(error_model="numpy", cache=True, inline="always")
+def _find_root(solve_for_current, other, x_left, x_right, tolerance, method, parameters):
+    """Scalar version of :py:func:`linerate.solver.bisect` and
+    :py:func:`linerate.solver.chandrupatla` for the root of the heat balance as a function of the
+    current or the conductor temperature (see :py:func:`_evaluate_heat_balance`)."""
+    f_left = _evaluate_heat_balance(x_left, other, solve_for_current, parameters)
+    f_right = _evaluate_heat_balance(x_right, other, solve_for_current, parameters)
+    if np.isnan(f_left) or np.isnan(f_right):
+        return np.nan
+    if np.sign(f_left) == np.sign(f_right):
+        return _INVALID_BRACKET
+
+    if method == 0:
+        while abs(x_right - x_left) > tolerance:
+            x_mid = 0.5 * (x_right + x_left)
+            f_mid = _evaluate_heat_balance(x_mid, other, solve_for_current, parameters)
+            if np.isnan(f_mid):
+                return np.nan
+            if f_mid * f_left > 0:  # fast way to check sign(f_mid) == sign(f_left)
+                x_left, f_left = x_mid, f_mid
+            else:
+                x_right = x_mid
+        return 0.5 * (x_right + x_left)
+
+    # x1 is the newest iterate, x2 is the opposite end of the bracket and x3 is the previous
+    # iterate that was discarded from the bracket.
+    x1, x2, f1, f2 = x_left, x_right, f_left, f_right
+    x3, f3 = x2, f2
+    width = abs(x2 - x1)
+    previous_width = np.inf
+    t = 0.5
+    while f1 != 0 and f2 != 0 and width > tolerance:
+        x = x1 + t * (x2 - x1)
+        f_x = _evaluate_heat_balance(x, other, solve_for_current, parameters)
+        if f_x * f1 > 0:  # fast way to check sign(f_x) == sign(f1)
+            x3, f3 = x1, f1
+        else:
+            x3, f3 = x2, f2
+            x2, f2 = x1, f1
+        x1, f1 = x, f_x
+        if np.isnan(f1):
+            return np.nan
+
+        new_width = abs(x2 - x1)
+        stalled = new_width > 0.5 * previous_width
+        previous_width = width
+        width = new_width
+
+        # Use inverse quadratic interpolation where it is well behaved and bisection elsewhere
+        xi = (x1 - x2) / (x3 - x2)
+        phi = (f1 - f2) / (f3 - f2)
+        alpha = (x3 - x1) / (x2 - x1)
+        if phi**2 < xi and (1 - phi) ** 2 < 1 - xi and not stalled:
+            t = f1 / (f1 - f2) * f3 / (f3 - f2) - alpha * f1 / (f3 - f1) * f2 / (f2 - f3)
+        else:
+            t = 0.5
+        t_limit = 0.5 * tolerance / width
+        if t < t_limit:
+            t = t_limit
+        elif t > 1 - t_limit:
+            t = 1 - t_limit
+
+    if f1 == 0:
+        return x1
+    if f2 == 0:
+        return x2
+    return 0.5 * (x1 + x2)
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_conductor_ampacity(
+    max_conductor_temperature,
+    min_ampacity,
+    max_ampacity,
+    tolerance,
+    method,
+    air_temperature,
+    wind_speed,
+    height_above_sea_level,
+    conductor_diameter,
+    conductor_roughness,
+    max_reynolds_number,
+    wind_direction_correction_factor,
+    inclination_correction_factor,
+    solar_heating,
+    conductor_emissivity,
+    temperature1,
+    temperature2,
+    resistance_at_temperature1,
+    resistance_at_temperature2,
+    aluminium_cross_section_area,
+    constant_magnetic_effect,
+    current_density_proportional_magnetic_effect,
+    max_relative_increase,
+):
+    parameters = (
+        air_temperature,
+        wind_speed,
+        height_above_sea_level,
+        conductor_diameter,
+        conductor_roughness,
+        max_reynolds_number,
+        wind_direction_correction_factor,
+        inclination_correction_factor,
+        solar_heating,
+        conductor_emissivity,
+        temperature1,
+        temperature2,
+        resistance_at_temperature1,
+        resistance_at_temperature2,
+        aluminium_cross_section_area,
+        constant_magnetic_effect,
+        current_density_proportional_magnetic_effect,
+        max_relative_increase,
+    )
+    return _find_root(
+        True,
+        max_conductor_temperature,
+        min_ampacity,
+        max_ampacity,
+        tolerance,
+        method,
+        parameters,
+    )
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_conductor_temperature(
+    current,
+    min_temperature,
+    max_temperature,
+    tolerance,
+    method,
+    air_temperature,
+    wind_speed,
+    height_above_sea_level,
+    conductor_diameter,
+    conductor_roughness,
+    max_reynolds_number,
+    wind_direction_correction_factor,
+    inclination_correction_factor,
+    solar_heating,
+    conductor_emissivity,
+    temperature1,
+    temperature2,
+    resistance_at_temperature1,
+    resistance_at_temperature2,
+    aluminium_cross_section_area,
+    constant_magnetic_effect,
+    current_density_proportional_magnetic_effect,
+    max_relative_increase,
+):
+    parameters = (
+        air_temperature,
+        wind_speed,
+        height_above_sea_level,
+        conductor_diameter,
+        conductor_roughness,
+        max_reynolds_number,
+        wind_direction_correction_factor,
+        inclination_correction_factor,
+        solar_heating,
+        conductor_emissivity,
+        temperature1,
+        temperature2,
+        resistance_at_temperature1,
+        resistance_at_temperature2,
+        aluminium_cross_section_area,
+        constant_magnetic_effect,
+        current_density_proportional_magnetic_effect,
+        max_relative_increase,
+    )
+    return _find_root(
+        False,
+        current,
+        min_temperature,
+        max_temperature,
+        tolerance,
+        method,
+        parameters,
+    )
+
+
+def _solve(kernel, other, x_min, x_max, tolerance, method, accept_invalid_values, parameters):
+    """Run a compiled solver kernel with the same validation as :py:func:`linerate.solver.bisect`.
+
+    ``parameters`` are the arguments of :py:func:`compute_heat_balance` after the current, in the
+    same order. Returns the roots (NaN for invalid brackets) and the mask of invalid brackets.
+    """
+    if method not in _ROOT_FINDER_CODES:
+        raise ValueError(
+            f"Unknown root finding method {method!r}, must be one of {list(_ROOT_FINDER_CODES)}."
+        )
+    if not np.all(np.isfinite(x_min)) or not np.all(np.isfinite(x_max)):
+        raise ValueError("xmin and xmax must be finite.")
+
+    out = kernel(other, x_min, x_max, tolerance, _ROOT_FINDER_CODES[method], *parameters)
+    invalid_mask = out == _INVALID_BRACKET
+    if np.any(invalid_mask) and not accept_invalid_values:
+        raise ValueError(
+            "f(xmin) and f(xmax) have the same sign. Consider increasing the search interval."
+        )
+    return np.where(invalid_mask, np.nan, out), invalid_mask
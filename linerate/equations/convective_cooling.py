@@ -1,6 +1,13 @@
 import numpy as np
 
-from linerate.units import Celsius, Unitless, WattPerMeter, WattPerMeterPerKelvin
+from linerate.units import (
+    Celsius,
+    PerKelvin,
+    Unitless,
+    WattPerMeter,
+    WattPerMeterPerKelvin,
+    WattPerMeterPerSquareKelvin,
+)
 
 
 def compute_convective_cooling(
@@ -39,3 +46,60 @@ def compute_convective_cooling(
     Nu = nusselt_number
 
     return pi * lambda_f * (T_s - T_a) * Nu
+
+
+def compute_convective_cooling_derivative(
+    surface_temperature: Celsius,
+    air_temperature: Celsius,
+    nusselt_number: Unitless,
+    nusselt_number_derivative: PerKelvin,
+    thermal_conductivity_of_air: WattPerMeterPerKelvin,
+    thermal_conductivity_of_air_derivative: WattPerMeterPerSquareKelvin,
+) -> WattPerMeterPerKelvin:
+    r"""Compute the derivative of the convective cooling with respect to the surface temperature.
+
+    Derivative of Equation (17) on page 24 of :cite:p:`cigre601` (see
+    :py:func:`compute_convective_cooling`), obtained with the product rule:
+
+    .. math::
+
+        \frac{\partial P_c}{\partial T_s} = \pi \left(
+            \lambda_f \text{Nu}
+            + (T_s - T_a) \text{Nu} \frac{\partial \lambda_f}{\partial T_s}
+            + (T_s - T_a) \lambda_f \frac{\partial \text{Nu}}{\partial T_s}
+        \right).
+
+    Parameters
+    ----------
+    surface_temperature:
+        :math:`T_s~\left[^\circ\text{C}\right]`. The conductor surface temperature.
+    air_temperature:
+        :math:`T_a~\left[^\circ\text{C}\right]`. The ambient air temperature.
+    nusselt_number:
+        :math:`Nu`. The nusselt number.
+    nusselt_number_derivative:
+        :math:`\partial Nu / \partial T_s~\left[\text{K}^{-1}\right]`. The derivative of the
+        nusselt number with respect to the surface temperature.
+    thermal_conductivity_of_air:
+        :math:`\lambda_f~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The thermal
+        conductivity of air at the given temperature.
+    thermal_conductivity_of_air_derivative:
+        :math:`\partial \lambda_f / \partial T_s~\left[\text{W}~\text{m}^{-1}~\text{K}^{-2}\right]`.
+        The derivative of the thermal conductivity of air with respect to the surface temperature
+        (which is half the derivative with respect to the film temperature).
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial P_c / \partial T_s~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`. The
+        derivative of the convective cooling.
+    """
+    pi = np.pi
+    lambda_f = thermal_conductivity_of_air
+    dlambda_f = thermal_conductivity_of_air_derivative
+    T_s = surface_temperature
+    T_a = air_temperature
+    Nu = nusselt_number
+    dNu = nusselt_number_derivative
+
+    return pi * (lambda_f * Nu + (T_s - T_a) * (Nu * dlambda_f + lambda_f * dNu))
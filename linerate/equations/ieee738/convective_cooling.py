@@ -1,16 +1,23 @@
 import numpy as np
+from numba import vectorize
 
+from linerate.equations import air_properties
 from linerate.units import (
     Celsius,
     KilogramPerCubeMeter,
+    KilogramPerCubeMeterPerKelvin,
     KilogramPerMeterPerSecond,
+    KilogramPerMeterPerSecondPerKelvin,
     Meter,
+    MeterPerSecond,
+    PerKelvin,
     Radian,
     SquareMeterPerSecond,
     Unitless,
     WattPerMeter,
     WattPerMeterPerCelsius,
     WattPerMeterPerKelvin,
+    WattPerMeterPerSquareKelvin,
 )
 
 
@@ -63,8 +70,34 @@ def compute_dynamic_viscosity_of_air(  # mu_f
         :math:`\mu_f~\left[\text{kg}~\text{m}^{-1}~\text{s}^{-1}\right]`. The dynamic viscosity
         of air.
     """
+    return air_properties.compute_ieee738_dynamic_viscosity_of_air(
+        air_temperature_at_boundary_layer
+    )
+
+
+def compute_dynamic_viscosity_of_air_derivative(
+    air_temperature_at_boundary_layer: Celsius,
+) -> KilogramPerMeterPerSecondPerKelvin:
+    r"""Derivative of the dynamic viscosity of air with respect to the film temperature.
+
+    Derivative of Equation (13a) on page 17 of :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`(T_s + T_s)/2~\left[^\circ\text{C}\right]`. The temperature at the boundary layer,
+        the thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor surface temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \mu_f / \partial T_\text{film}~\left[\text{kg}~\text{m}^{-1}
+        ~\text{s}^{-1}~\text{K}^{-1}\right]`. The derivative of the dynamic viscosity of air.
+    """
     T_film = air_temperature_at_boundary_layer
-    return (1.458e-6 * (T_film + 273) ** 1.5) / (T_film + 383.4)
+    mu_f = compute_dynamic_viscosity_of_air(T_film)
+    return mu_f * (1.5 / (T_film + 273) - 1 / (T_film + 383.4))
 
 
 def compute_kinematic_viscosity_of_air(  # nu_f
@@ -137,11 +170,35 @@ def compute_thermal_conductivity_of_air(  # k_f
         conductivity of air at the boundary layer temperature.
 
     """
+    return air_properties.compute_ieee738_thermal_conductivity_of_air(
+        air_temperature_at_boundary_layer
+    )
+
+
+def compute_thermal_conductivity_of_air_derivative(
+    air_temperature_at_boundary_layer: Celsius,
+) -> WattPerMeterPerSquareKelvin:
+    r"""Derivative of the thermal conductivity of air with respect to the film temperature.
+
+    Derivative of Equation (15a) on page 18 of :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`(T_s + T_s)/2~\left[^\circ\text{C}\right]`. The temperature at the boundary layer,
+        the thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor surface temperature.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial k_f / \partial T_\text{film}~\left[\text{W}~\text{m}^{-1}
+        ~^\circ\text{C}^{-2}\right]`. The derivative of the thermal conductivity of air.
+    """
     T_film = air_temperature_at_boundary_layer
-    A = 2.424e-2
     B = 7.477e-5
     C = -4.407e-9
-    return np.poly1d([C, B, A])(T_film)
+    return B + 2 * C * T_film
 
 
 def compute_forced_convection(  # q_c1 or q_c2
@@ -190,18 +247,70 @@ def compute_forced_convection(  # q_c1 or q_c2
     q_c1 = K_angle * (1.01 + 1.35 * N_Re**0.52) * k_f * (T_s - T_a)
     q_c2 = K_angle * 0.754 * N_Re**0.6 * k_f * (T_s - T_a)
 
-    if hasattr(q_c1, "__len__"):
-        q_cf = []
-        for i in range(len(q_c1)):
-            if q_c1[i] > q_c2[i]:
-                q_cf.append(q_c1[i])
-            else:
-                q_cf.append(q_c2[i])
-        return np.array(q_cf)
-    else:
-        if q_c1 > q_c2:
-            return q_c1
-        return q_c2
+    # Same as max(q_c1, q_c2) for each element, but q_c2 is used if q_c1 is NaN
+    return np.where(q_c1 > q_c2, q_c1, q_c2)
+
+
+def compute_forced_convection_derivative(
+    wind_direction_factor: Unitless,
+    reynolds_number: Unitless,
+    reynolds_number_derivative: PerKelvin,
+    thermal_conductivity_of_air: WattPerMeterPerKelvin,
+    thermal_conductivity_of_air_derivative: WattPerMeterPerSquareKelvin,
+    temperature_of_conductor_surface: Celsius,
+    temperature_of_ambient_air: Celsius,
+) -> WattPerMeterPerKelvin:
+    r"""Derivative of the forced convection with respect to the conductor surface temperature.
+
+    Derivative of Equation (3a) and (3b) on page 11 of :cite:p:`ieee738`, where the derivative
+    of the larger of the two is used (see :py:func:`compute_forced_convection`).
+
+    Parameters
+    ----------
+    wind_direction_factor:
+        :math: '\text{K_{angle}'. The wind direction factor
+    reynolds_number:
+        :math:`\text{N_{Re}}`. The Reynolds number.
+    reynolds_number_derivative:
+        :math:`\partial \text{N_{Re}} / \partial T_s~\left[\text{K}^{-1}\right]`. The
+        derivative of the Reynolds number with respect to the surface temperature.
+    thermal_conductivity_of_air:
+        :math:`\text{k_f}~\left[\text{W}~\text{m}^{-1}~^\circ\text{C}^{-1}\right]`. The thermal
+        conductivity of air at the boundary layer temperature.
+    thermal_conductivity_of_air_derivative:
+        :math:`\partial \text{k_f} / \partial T_s`. The derivative of the thermal conductivity
+        of air with respect to the surface temperature (which is half the derivative with respect
+        to the film temperature).
+    temperature_of_conductor_surface:
+        :math:'T_s ~left[\circ\text{C}\right]`. The temperature of the surface of the conductor.
+    temperature_of_ambient_air:
+        :math:'T_a ~left[\circ\text{C}\right]`. The temperature of the ambient air.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial q_c / \partial T_s~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`.
+        The derivative of the forced convection.
+    """
+    K_angle = wind_direction_factor
+    N_Re = reynolds_number
+    dN_Re = reynolds_number_derivative
+    k_f = thermal_conductivity_of_air
+    dk_f = thermal_conductivity_of_air_derivative
+    T_s = temperature_of_conductor_surface
+    T_a = temperature_of_ambient_air
+
+    # d(N_Re^n) = n N_Re^(n - 1) dN_Re, which is zero for N_Re = 0 since dN_Re is then zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dN_Re_052 = np.where(N_Re > 0, 0.52 * N_Re**0.52 / N_Re * dN_Re, 0)
+        dN_Re_06 = np.where(N_Re > 0, 0.6 * N_Re**0.6 / N_Re * dN_Re, 0)
+    d_k_f_T = dk_f * (T_s - T_a) + k_f
+
+    q_c1 = K_angle * (1.01 + 1.35 * N_Re**0.52) * k_f * (T_s - T_a)
+    q_c2 = K_angle * 0.754 * N_Re**0.6 * k_f * (T_s - T_a)
+    dq_c1 = K_angle * (1.35 * dN_Re_052 * k_f * (T_s - T_a) + (1.01 + 1.35 * N_Re**0.52) * d_k_f_T)
+    dq_c2 = K_angle * 0.754 * (dN_Re_06 * k_f * (T_s - T_a) + N_Re**0.6 * d_k_f_T)
+    return np.where(q_c1 > q_c2, dq_c1, dq_c2)
 
 
 def compute_air_density(  # rho_f
@@ -229,9 +338,36 @@ def compute_air_density(  # rho_f
         :math:`\rho_{f}`. The air density.
 
     """
+    return air_properties.compute_ieee738_air_density(air_temperature_at_boundary_layer, elevation)
+
+
+def compute_air_density_derivative(
+    air_temperature_at_boundary_layer: Celsius,
+    elevation: Meter,
+) -> KilogramPerCubeMeterPerKelvin:
+    r"""Derivative of the air density with respect to the film temperature.
+
+    Derivative of Equation (14a) on page 17 of :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    film_temperature:
+        :math:`(T_s + T_s)/2~\left[^\circ\text{C}\right]`. The temperature at the boundary layer,
+        the thin air-film surrounding the conductor. Equal to the average of the ambient air
+        temperature and the conductor surface temperature.
+    elevation:
+        :math:`H_e~\left[\text{m}\right]`. The elevation of the conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial \rho_f / \partial T_\text{film}~\left[\text{kg}~\text{m}^{-3}
+        ~\text{K}^{-1}\right]`. The derivative of the air density.
+    """
     T_film = air_temperature_at_boundary_layer
     H_e = elevation
-    return (np.poly1d([6.379e-9, -1.525e-4, 1.293])(H_e)) / (1 + 0.00367 * T_film)
+    sea_level_air_density = (6.379e-9 * H_e - 1.525e-4) * H_e + 1.293
+    return -0.00367 * sea_level_air_density / (1 + 0.00367 * T_film) ** 2
 
 
 def compute_natural_convection(  # q_cn
@@ -269,6 +405,51 @@ def compute_natural_convection(  # q_cn
     return 3.645 * rho_f**0.5 * D_0**0.75 * (T_s - T_a) ** 1.25
 
 
+def compute_natural_convection_derivative(
+    air_density: KilogramPerCubeMeter,
+    air_density_derivative: KilogramPerCubeMeterPerKelvin,
+    conductor_diameter: Meter,
+    temperature_of_conductor_surface: Celsius,
+    temperature_of_ambient_air: Celsius,
+) -> WattPerMeterPerKelvin:
+    r"""Derivative of the natural convection with respect to the conductor surface temperature.
+
+    Derivative of Equation (5a) on page 12 of :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    air_density:
+        :math:`\rho_{f}`. The air density.
+    air_density_derivative:
+        :math:`\partial \rho_f / \partial T_s`. The derivative of the air density with respect
+        to the surface temperature (which is half the derivative with respect to the film
+        temperature).
+    conductor_diameter:
+        :math:`D_0~\left[\text{m}\right]`. Outer diameter of the conductor.
+    temperature_of_conductor_surface:
+        :math:'T_s ~left[\circ\text{C}\right]`. The temperature of the surface of the conductor.
+    temperature_of_ambient_air:
+        :math:'T_a ~left[\circ\text{C}\right]`. The temperature of the ambient air.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial q_{cn} / \partial T_s~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`.
+        The derivative of the natural convection.
+    """
+    rho_f = air_density
+    drho_f = air_density_derivative
+    D_0 = conductor_diameter
+    T_s = temperature_of_conductor_surface
+    T_a = temperature_of_ambient_air
+    return (
+        3.645
+        * D_0**0.75
+        * (T_s - T_a) ** 0.25
+        * (0.5 * rho_f**-0.5 * drho_f * (T_s - T_a) + 1.25 * rho_f**0.5)
+    )
+
+
 def compute_convective_cooling(
     forced_convection: WattPerMeter,
     natural_convection: WattPerMeter,
@@ -295,3 +476,99 @@ def compute_convective_cooling(
     q_cn = natural_convection
 
     return np.maximum(q_cf, q_cn)
+
+
+@vectorize(nopython=True, cache=True)
+def _compute_fused_convective_cooling(T_s, T_a, V, H_e, D_0, D_0_075, max_reynolds_number, K_angle):
+    T_film = 0.5 * (T_s + T_a)
+
+    # Air properties, equations (13a), (14a) and (15a)
+    mu_f = air_properties.compute_ieee738_dynamic_viscosity_of_air(T_film)
+    rho_f = air_properties.compute_ieee738_air_density(T_film, H_e)
+    nu_f = mu_f / rho_f
+    k_f = air_properties.compute_ieee738_thermal_conductivity_of_air(T_film)
+
+    N_Re = V * D_0 / nu_f
+    if N_Re > max_reynolds_number:
+        N_Re = max_reynolds_number
+
+    # Forced convection, equations (3a) and (3b), with both powers of N_Re from one logarithm.
+    # Same as np.where(q_c1 > q_c2, q_c1, q_c2)
+    log_N_Re = np.log(N_Re)
+    q_c1 = K_angle * (1.01 + 1.35 * np.exp(0.52 * log_N_Re)) * k_f * (T_s - T_a)
+    q_c2 = K_angle * 0.754 * np.exp(0.6 * log_N_Re) * k_f * (T_s - T_a)
+    q_cf = q_c1 if q_c1 > q_c2 else q_c2
+
+    # Natural convection, equation (5a), with x^1.25 = x sqrt(sqrt(x)), which is NaN for x < 0
+    temperature_difference = T_s - T_a
+    q_cn = (
+        3.645
+        * np.sqrt(rho_f)
+        * D_0_075
+        * (temperature_difference * np.sqrt(np.sqrt(temperature_difference)))
+    )
+
+    # Same NaN-propagation as np.maximum
+    if np.isnan(q_cf) or np.isnan(q_cn):
+        return np.nan
+    return q_cf if q_cf >= q_cn else q_cn
+
+
+def compute_fused_convective_cooling(
+    temperature_of_conductor_surface: Celsius,
+    temperature_of_ambient_air: Celsius,
+    wind_speed: MeterPerSecond,
+    elevation: Meter,
+    conductor_diameter: Meter,
+    max_reynolds_number: Unitless,
+    wind_direction_factor: Unitless,
+) -> WattPerMeter:
+    r"""Compute the convective cooling of the conductor in one compiled pass.
+
+    Combines :py:func:`compute_dynamic_viscosity_of_air`, :py:func:`compute_air_density`,
+    :py:func:`compute_kinematic_viscosity_of_air`, :py:func:`compute_thermal_conductivity_of_air`,
+    :py:func:`compute_forced_convection`, :py:func:`compute_natural_convection` and
+    :py:func:`compute_convective_cooling`, with the Reynolds number clipped to
+    ``max_reynolds_number``. All arguments are broadcast against each other and the convective
+    cooling is computed element by element, without allocating intermediate arrays. The result
+    is equal to combining the individual equations, with a relative difference of at most a few
+    units in the last place.
+
+    The wind direction factor does not depend on the conductor temperature, and is therefore
+    passed as an argument, so it can be computed once with
+    :py:func:`compute_wind_direction_factor`.
+
+    Parameters
+    ----------
+    temperature_of_conductor_surface:
+        :math:`T_s~\left[^\circ\text{C}\right]`. The temperature of the surface of the conductor.
+    temperature_of_ambient_air:
+        :math:`T_a~\left[^\circ\text{C}\right]`. The temperature of the ambient air.
+    wind_speed:
+        :math:`V_w~\left[\text{m}~\text{s}^{-1}\right]`. The wind speed.
+    elevation:
+        :math:`H_e~\left[\text{m}\right]`. The elevation of the conductor above sea level.
+    conductor_diameter:
+        :math:`D_0~\left[\text{m}\right]`. Outside diameter of the conductor.
+    max_reynolds_number:
+        The Reynolds number is clipped to this value before computing the forced convection.
+    wind_direction_factor:
+        :math:`K_\text{angle}`. The wind direction factor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`q_c~\left[\text{W}~\text{m}^{-1}\right]`. The convective cooling of the conductor.
+    """
+    # D_0^0.75 only depends on the conductor, so it is computed once, outside the compiled pass
+    D_0 = conductor_diameter
+    return _compute_fused_convective_cooling(
+        temperature_of_conductor_surface,
+        temperature_of_ambient_air,
+        wind_speed,
+        elevation,
+        D_0,
+        np.power(D_0, 0.75),
+        max_reynolds_number,
+        wind_direction_factor,
+    )
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Tuple, Union
 
 import numpy as np
 
@@ -6,6 +6,8 @@ from ..units import (
     Ampere,
     Celsius,
     OhmPerMeter,
+    OhmPerMeterPerAmpere,
+    OhmPerMeterPerKelvin,
     SquareMeter,
     SquareMeterPerAmpere,
     Unitless,
@@ -44,12 +46,85 @@ def compute_resistance(
         :math:`R~\left[\Omega\right]`. The resistance at the given temperature.
     """
     T_av = conductor_temperature
+    a, b = compute_resistance_coefficients(
+        temperature1, temperature2, resistance_at_temperature1, resistance_at_temperature2
+    )
+    return a * T_av + b
+
+
+def compute_resistance_coefficients(
+    temperature1: Celsius,
+    temperature2: Celsius,
+    resistance_at_temperature1: OhmPerMeter,
+    resistance_at_temperature2: OhmPerMeter,
+) -> Tuple[OhmPerMeterPerKelvin, OhmPerMeter]:
+    r"""Compute the slope and intercept of the linear resistance model.
+
+    The resistance computed by :py:func:`compute_resistance` is :math:`R = a T + b`, where
+
+    .. math::
+
+        a = \frac{R_2 - R_1}{T_2 - T_1}, \quad b = R_1 - a T_1.
+
+    The coefficients only depend on the conductor, so they can be computed once and reused.
+
+    Parameters
+    ----------
+    temperature1:
+        :math:`T_1~\left[^\circ\text{C}\right]`. The first temperature measurement.
+    temperature2:
+        :math:`T_2~\left[^\circ\text{C}\right]`. The second temperature measurement.
+    resistance_at_temperature1:
+        :math:`R_1~\left[\Omega~\text{m}^{-1}\right]`. The resistance at temperature :math:`T=T_1`.
+    resistance_at_temperature2:
+        :math:`R_2~\left[\Omega~\text{m}^{-1}\right]`. The resistance at temperature :math:`T=T_2`.
+
+    Returns
+    -------
+    Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+        :math:`a~\left[\Omega~\text{m}^{-1}~\text{K}^{-1}\right]` and
+        :math:`b~\left[\Omega~\text{m}^{-1}\right]`. The slope and intercept.
+    """
     T_1, T_2 = temperature1, temperature2
     R_1, R_2 = resistance_at_temperature1, resistance_at_temperature2
 
     a = (R_2 - R_1) / (T_2 - T_1)
     b = R_1 - a * T_1
-    return a * T_av + b
+    return a, b
+
+
+def compute_resistance_temperature_derivative(
+    temperature1: Celsius,
+    temperature2: Celsius,
+    resistance_at_temperature1: OhmPerMeter,
+    resistance_at_temperature2: OhmPerMeter,
+) -> OhmPerMeterPerKelvin:
+    r"""Compute the derivative of the resistance with respect to the conductor temperature.
+
+    Since the resistance is linearly interpolated/extrapolated (see :py:func:`compute_resistance`),
+    the derivative is constant and equal to :math:`(R_2 - R_1) / (T_2 - T_1)`.
+
+    Parameters
+    ----------
+    temperature1:
+        :math:`T_1~\left[^\circ\text{C}\right]`. The first temperature measurement.
+    temperature2:
+        :math:`T_2~\left[^\circ\text{C}\right]`. The second temperature measurement.
+    resistance_at_temperature1:
+        :math:`R_1~\left[\Omega~\text{m}^{-1}\right]`. The resistance at temperature :math:`T=T_1`.
+    resistance_at_temperature2:
+        :math:`R_2~\left[\Omega~\text{m}^{-1}\right]`. The resistance at temperature :math:`T=T_2`.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial R / \partial T~\left[\Omega~\text{m}^{-1}~\text{K}^{-1}\right]`. The
+        derivative of the resistance.
+    """
+    T_1, T_2 = temperature1, temperature2
+    R_1, R_2 = resistance_at_temperature1, resistance_at_temperature2
+
+    return (R_2 - R_1) / (T_2 - T_1)
 
 
 def correct_resistance_acsr_magnetic_core_loss(
@@ -128,7 +203,58 @@ def correct_resistance_acsr_magnetic_core_loss(
         return b * R
 
     J = I / A
-    return np.minimum(b + J * m, max_relative_increase) * R
+    # Elements with m = 0 are not corrected further, even if A is not given (e.g. NaN)
+    return np.where(m == 0, b, np.minimum(b + J * m, max_relative_increase)) * R
+
+
+def compute_acsr_magnetic_core_loss_current_derivative(
+    ac_resistance: OhmPerMeter,
+    current: Ampere,
+    aluminium_cross_section_area: SquareMeter,
+    constant_magnetic_effect: Union[Unitless, None],
+    current_density_proportional_magnetic_effect: Union[SquareMeterPerAmpere, None],
+    max_relative_increase: Unitless,
+) -> OhmPerMeterPerAmpere:
+    r"""Compute the derivative of the corrected resistance with respect to the current.
+
+    Derivative of the correction in :py:func:`correct_resistance_acsr_magnetic_core_loss`. Below
+    the saturation point, the derivative is :math:`R m / A`, and above it, it is zero.
+
+    Parameters
+    ----------
+    ac_resistance:
+        :math:`R~\left[\Omega\right]`. The AC resistance of the conductor.
+    current:
+        :math:`I~\left[\text{A}\right]`. The current going through the conductor.
+    aluminium_cross_section_area:
+        :math:`A_{\text{Al}}~\left[\text{m}^2\right]`. The cross sectional area of the aluminium
+        strands in the conductor.
+    constant_magnetic_effect:
+        :math:`b`. The constant magnetic effect, most likely equal to 1. If ``None``, then no
+        correction is used (useful for non-ACSR cables).
+    current_density_proportional_magnetic_effect:
+        :math:`m`. The current density proportional magnetic effect. If ``None``, then it is
+        assumed equal to 0.
+    max_relative_increase:
+        :math:`c_\text{max}`. Saturation point of the relative increase in conductor resistance.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial R_\text{corrected} / \partial I~\left[\Omega~\text{A}^{-1}\right]`.
+        The derivative of the corrected resistance with respect to the current.
+    """
+    I = current  # noqa
+    R = ac_resistance
+    A = aluminium_cross_section_area
+    b = constant_magnetic_effect
+    m = current_density_proportional_magnetic_effect
+
+    if b is None or m is None or np.all(m == 0):
+        return 0 * R
+
+    J = I / A
+    return np.where((m != 0) & (b + J * m < max_relative_increase), R * m / A, 0)
 
 
 def compute_joule_heating(current: Ampere, resistance: OhmPerMeter) -> WattPerMeter:
@@ -150,3 +276,90 @@ def compute_joule_heating(current: Ampere, resistance: OhmPerMeter) -> WattPerMe
     I = current  # noqa
     R = resistance
     return I * I * R
+
+
+def compute_current_from_joule_heating(
+    joule_heating: WattPerMeter,
+    resistance: OhmPerMeter,
+    aluminium_cross_section_area: SquareMeter,
+    constant_magnetic_effect: Union[Unitless, None],
+    current_density_proportional_magnetic_effect: Union[SquareMeterPerAmpere, None],
+    max_relative_increase: Unitless,
+) -> Ampere:
+    r"""Compute the current that gives the specified Joule heating.
+
+    This inverts the Joule heating, :math:`P_J = I^2 R_\text{corrected}`, where
+    :math:`R_\text{corrected}` is the resistance corrected for magnetic core effects (see
+    :py:func:`correct_resistance_acsr_magnetic_core_loss`). Without correction, or with only the
+    constant magnetic effect, we get :math:`I = \sqrt{P_J / (b R)}`. With current density
+    proportional magnetic effects, the Joule heating is piecewise polynomial in :math:`I`. In the
+    saturated segment, :math:`b + mI/A \geq c_\text{max}`, we get
+    :math:`I = \sqrt{P_J / (c_\text{max} R)}`. Below saturation, :math:`I` is the positive root of
+    the cubic
+
+    .. math::
+
+        \frac{m R}{A} I^3 + b R I^2 - P_J = 0,
+
+    which is found with Newton's method, starting to the right of the root. Since the cubic is
+    increasing and convex for positive :math:`I`, the iterates decrease monotonically to the root.
+
+    Parameters
+    ----------
+    joule_heating:
+        :math:`P_J~\left[\text{W}~\text{m}^{-1}\right]`. The Joule heating of the conductor.
+    resistance:
+        :math:`R~\left[\Omega\right]`. The AC resistance of the conductor, without correcting for
+        magnetic core effects.
+    aluminium_cross_section_area:
+        :math:`A_{\text{Al}}~\left[\text{m}^2\right]`. The cross sectional area of the aluminium
+        strands in the conductor.
+    constant_magnetic_effect:
+        :math:`b`. The constant magnetic effect, most likely equal to 1. If ``None``, then no
+        correction is used (useful for non-ACSR cables).
+    current_density_proportional_magnetic_effect:
+        :math:`m`. The current density proportional magnetic effect. If ``None``, then it is
+        assumed equal to 0.
+    max_relative_increase:
+        :math:`c_\text{max}`. Saturation point of the relative increase in conductor resistance.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`I~\left[\text{A}\right]`. The current that gives the specified Joule heating. NaN
+        if the Joule heating is negative.
+    """
+    P = np.where(np.asarray(joule_heating) >= 0, joule_heating, np.nan)
+    R = resistance
+    A = aluminium_cross_section_area
+    b = constant_magnetic_effect
+    m = current_density_proportional_magnetic_effect
+    c_max = max_relative_increase
+
+    if b is None:
+        return np.sqrt(P / R)
+
+    if m is None or np.all(m == 0):
+        return np.sqrt(P / (b * R))
+
+    saturated_current = np.sqrt(P / (c_max * R))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        saturation_current = (c_max - b) * A / m
+        saturation_joule_heating = saturation_current**2 * c_max * R
+
+        # Newton's method for g(I) = (m R / A) I^3 + b R I^2 - P_J, starting at an upper bound
+        cubic_coefficient = m * R / A
+        quadratic_coefficient = b * R
+        I = np.minimum(saturation_current, np.sqrt(P / quadratic_coefficient))  # noqa
+        I = np.where(np.isnan(I), saturation_current, I)  # noqa
+        for _ in range(100):
+            g = (cubic_coefficient * I + quadratic_coefficient) * I * I - P
+            dg = (3 * cubic_coefficient * I + 2 * quadratic_coefficient) * I
+            step = np.where(g > 0, g / dg, 0)
+            I = I - step  # noqa
+            if not np.any(step > 1e-12 * I):
+                break
+    unsaturated_current = np.where(np.isnan(P), np.nan, I)
+
+    current = np.where(P >= saturation_joule_heating, saturated_current, unsaturated_current)
+    return np.where(m == 0, np.sqrt(P / (b * R)), current)
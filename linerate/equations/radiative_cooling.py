@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.constants import Stefan_Boltzmann as stefan_boltzmann_constant
 
-from ..units import Celsius, Meter, Unitless, WattPerMeter
+from ..units import Celsius, Meter, Unitless, WattPerMeter, WattPerMeterPerKelvin
 
 
 def compute_radiative_cooling(
@@ -38,3 +38,40 @@ def compute_radiative_cooling(
     epsilon_s = conductor_emissivity
 
     return pi * D * sigma_B * epsilon_s * ((T_s + 273.15) ** 4 - (T_a + 273.15) ** 4)  # type: ignore # noqa
+
+
+def compute_radiative_cooling_derivative(
+    surface_temperature: Celsius,
+    conductor_diameter: Meter,
+    conductor_emissivity: Unitless,
+) -> WattPerMeterPerKelvin:
+    r"""Compute the derivative of the radiative cooling with respect to the surface temperature.
+
+    Derivative of Equation (27) on page 30 of :cite:p:`cigre601`,
+
+    .. math::
+
+        \frac{\partial P_r}{\partial T_s} = 4 \pi D \sigma_B \epsilon_s (T_s + 273.15)^3.
+
+    Parameters
+    ----------
+    surface_temperature:
+        :math:`T_s~\left[^\circ\text{C}\right]`. The conductor surface temperature.
+    conductor_diameter:
+        :math:`D~\left[\text{m}\right]`. Outer diameter of the conductor.
+    conductor_emissivity:
+        :math:`\epsilon_s`. The emmisivity of the conductor.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\partial P_r / \partial T_s~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`.
+        The derivative of the radiative cooling.
+    """
+    sigma_B = stefan_boltzmann_constant
+    pi = np.pi
+    D = conductor_diameter
+    T_s = surface_temperature
+    epsilon_s = conductor_emissivity
+
+    return 4 * pi * D * sigma_B * epsilon_s * (T_s + 273.15) ** 3
@@ -1,9 +1,11 @@
+from typing import Tuple, Union
+
 import numpy as np
 from numba import vectorize
 from linerate.equations import math
 
 from ..units import Date, Degrees, Radian, Unitless
-from ..types import Span
+from ..types import Span, TimeIndex
 
 
 def _get_day_of_year(when: Date) -> Unitless:
@@ -26,7 +28,13 @@ def _get_minute_of_hour(when: Date) -> Unitless:
     return (when.astype(MinuteResolutionType) - when.astype(HourResolutionType)).astype(float)
 
 
-def compute_hour_angle_relative_to_noon(when: Date, longitude: Degrees) -> Radian:
+def _get_fractional_hour_of_day(when: Union[Date, TimeIndex]) -> Unitless:
+    if isinstance(when, TimeIndex):
+        return when.hour_of_day
+    return _get_hour_of_day(when) + _get_minute_of_hour(when) / 60
+
+
+def compute_hour_angle_relative_to_noon(when: Union[Date, TimeIndex], longitude: Degrees) -> Radian:
     r"""Compute the hour angle.
 
     Described in the text on p. 18 of :cite:p:`ieee738`. The hour angle is the number of hours
@@ -44,43 +52,43 @@ def compute_hour_angle_relative_to_noon(when: Date, longitude: Degrees) -> Radia
     Parameters
     ----------
     when:
-        The time and date.
+        The time and date, either as ``datetime64`` values or as a
+        :py:class:`linerate.types.TimeIndex`.
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:'\omega~\left[\text{radian}\right]`. The hour angle relative to noon.
     """
-    utc_hour = _get_hour_of_day(when)
-    utc_minute = _get_minute_of_hour(when)
+    utc_hour = _get_fractional_hour_of_day(when)
     pi = np.pi
     # We add longitude/15 since 15 degrees of longitude increases solar hour by 1
-    return np.mod((-12 + utc_hour + utc_minute / 60 + longitude / 15), 24) * (
-        pi / 12
-    )  # pi/12 is 15 degrees
+    return np.mod((-12 + utc_hour + longitude / 15), 24) * (pi / 12)  # pi/12 is 15 degrees
 
 
 def compute_solar_declination(
-    when: Date,
+    when: Union[Date, TimeIndex],
 ) -> Radian:
     r"""Compute the solar declination
 
     Equation (16b) on page 18 of :cite:p:`ieee738`.
 
-    The function takes in a numpy.datetime64 object, and uses the _get_day_of_year
-    function to find the day number of the year to be used to compute the solar declination.
+    The function takes in a numpy.datetime64 object (or a :py:class:`linerate.types.TimeIndex`),
+    and uses the _get_day_of_year function to find the day number of the year to be used to
+    compute the solar declination.
 
     Parameters
     ----------
     when:
-        The time and date.
+        The time and date, either as ``datetime64`` values or as a
+        :py:class:`linerate.types.TimeIndex`.
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`\delta~\left[\text{radian}\right]`. The declination of the earth.
     """
-    N = _get_day_of_year(when)
+    N = when.day_of_year if isinstance(when, TimeIndex) else _get_day_of_year(when)
     return np.radians((23.3) * np.sin((284 + N) * 2 * np.pi / 365))
 
 
@@ -113,7 +121,7 @@ def compute_solar_azimuth_variable(
     return np.sin(omega) / (np.sin(Lat) * np.cos(omega) - np.cos(Lat) * np.tan(delta))
 
 
-@vectorize
+@vectorize(nopython=True, cache=True)
 def _compute_solar_azimuth_constant(
     solar_azimuth_variable: Radian, hour_angle_relative_to_noon: Radian
 ) -> Radian:
@@ -241,7 +249,42 @@ def compute_cos_solar_effective_incidence_angle(
     return np.cos(H_c) * np.cos(Z_c - Z_l)
 
 
-def compute_sin_solar_altitude_for_span(span: Span, time: Date) -> Unitless:
+def compute_solar_position(
+    when: Union[Date, TimeIndex], latitude: Degrees, longitude: Degrees
+) -> Tuple[Unitless, Radian]:
+    r"""Compute the sine of the solar altitude and the solar azimuth.
+
+    Combines :py:func:`compute_sin_solar_altitude` and :py:func:`compute_solar_azimuth`, so the
+    solar declination and the hour angle are only computed once. The position of the sun only
+    depends on the time and location, not on the conductor, so it can be shared between spans
+    and models (see :py:class:`linerate.solar_position.SolarPositionCache`).
+
+    Parameters
+    ----------
+    when:
+        The time and date, either as ``datetime64`` values or as a
+        :py:class:`linerate.types.TimeIndex`.
+    latitude:
+        :math:`Lat~\left[^\circ\right]`. The latitude of the span (center).
+    longitude:
+        :math:`\left[^\circ\right]`. The longitude of the span (center).
+
+    Returns
+    -------
+    Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+        :math:`\sin\left(H_c\right)` and :math:`Z_c~\left[\text{radian}\right]`. The sine of
+        the solar altitude and the solar azimuth.
+    """
+    delta = compute_solar_declination(when)
+    omega = compute_hour_angle_relative_to_noon(when, longitude)
+    sin_H_c = compute_sin_solar_altitude(latitude, delta, omega)
+    chi = compute_solar_azimuth_variable(latitude, delta, omega)
+    C = compute_solar_azimuth_constant(chi, omega)
+    Z_c = compute_solar_azimuth(C, chi)
+    return sin_H_c, Z_c
+
+
+def compute_sin_solar_altitude_for_span(span: Span, time: Union[Date, TimeIndex]) -> Unitless:
     """Compute the sine of the solar altitude for a given span and time.
 
     This function computes the sine of the solar altitude at the midpoint of the span.
@@ -267,7 +310,7 @@ def compute_sin_solar_altitude_for_span(span: Span, time: Date) -> Unitless:
 
 
 def compute_sin_solar_effective_incidence_angle_for_span(
-    span: Span, time: Date, sin_H_s: Unitless
+    span: Span, time: Union[Date, TimeIndex], sin_H_s: Unitless
 ) -> Unitless:
     """Compute the sine of the solar effective incidence angle for a given span and time.
 
@@ -0,0 +1,191 @@
+r"""Vectorized span geometry.
+
+The functions in this module compute the length and azimuth of many spans at once with NumPy,
+either on a sphere (the default) or on the WGS84 ellipsoid. The spherical functions match
+:py:func:`pygeodesy.formy.haversine` and :py:func:`pygeodesy.formy.bearing` to within
+:math:`10^{-8}~\text{m}` and :math:`10^{-8}~\text{radian}`, and the ellipsoidal functions match
+:py:class:`pygeodesy.ellipsoidalVincenty.LatLon` to within :math:`10^{-5}~\text{m}` and
+:math:`10^{-8}~\text{radian}`.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from linerate.units import Degrees, Meter, Radian
+
+__all__ = ["compute_span_length", "compute_bearing", "compute_span_length_and_bearing"]
+
+#: :math:`R~\left[\text{m}\right]`. The mean earth radius, same as ``pygeodesy.R_M``.
+EARTH_RADIUS: Meter = 6371008.771415
+#: :math:`a~\left[\text{m}\right]`. The semi-major axis of the WGS84 ellipsoid.
+WGS84_SEMI_MAJOR_AXIS: Meter = 6378137.0
+#: :math:`f`. The flattening of the WGS84 ellipsoid.
+WGS84_FLATTENING = 1 / 298.257223563
+
+_VINCENTY_TOLERANCE = 1e-12
+_VINCENTY_MAX_ITERATIONS = 200
+
+
+def _compute_spherical_length(lat1, lon1, lat2, lon2) -> Meter:
+    # Haversine formula
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    sin_half_delta_phi = np.sin(0.5 * (phi2 - phi1))
+    sin_half_delta_lambda = np.sin(0.5 * (np.radians(lon2) - np.radians(lon1)))
+    a = sin_half_delta_phi**2 + np.cos(phi1) * np.cos(phi2) * sin_half_delta_lambda**2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1)))
+
+
+def _compute_spherical_bearing(lat1, lon1, lat2, lon2) -> Radian:
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    delta_lambda = np.radians(lon2) - np.radians(lon1)
+    cos_phi2 = np.cos(phi2)
+    bearing = np.arctan2(
+        np.sin(delta_lambda) * cos_phi2,
+        np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * cos_phi2 * np.cos(delta_lambda),
+    )
+    return np.mod(bearing, 2 * np.pi)
+
+
+def _compute_ellipsoidal_length_and_bearing(lat1, lon1, lat2, lon2) -> Tuple[Meter, Radian]:
+    # Vincenty's inverse formula, iterated for all elements until all have converged
+    a = WGS84_SEMI_MAJOR_AXIS
+    f = WGS84_FLATTENING
+    b = (1 - f) * a
+
+    U1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    U2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sin_U1, cos_U1 = np.sin(U1), np.cos(U1)
+    sin_U2, cos_U2 = np.sin(U2), np.cos(U2)
+    L = np.radians(lon2) - np.radians(lon1)
+    L = np.mod(L + np.pi, 2 * np.pi) - np.pi
+
+    lambda_ = L
+    converged = np.zeros(np.shape(L), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(_VINCENTY_MAX_ITERATIONS):
+            sin_lambda, cos_lambda = np.sin(lambda_), np.cos(lambda_)
+            sin_sigma = np.hypot(
+                cos_U2 * sin_lambda, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lambda
+            )
+            cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lambda
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            # Coincident points have sin(sigma) = 0
+            sin_alpha = np.where(sin_sigma == 0, 0, cos_U1 * cos_U2 * sin_lambda / sin_sigma)
+            cos2_alpha = 1 - sin_alpha**2
+            # Points on the equator have cos^2(alpha) = 0
+            cos_2sigma_m = np.where(
+                cos2_alpha == 0, 0, cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha
+            )
+            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            previous_lambda = lambda_
+            lambda_ = L + (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (2 * cos_2sigma_m**2 - 1))
+            )
+            converged = np.abs(lambda_ - previous_lambda) <= _VINCENTY_TOLERANCE
+            if np.all(converged):
+                break
+
+    u2 = cos2_alpha * (a**2 - b**2) / b**2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = (
+        B
+        * sin_sigma
+        * (
+            cos_2sigma_m
+            + B
+            / 4
+            * (
+                cos_sigma * (2 * cos_2sigma_m**2 - 1)
+                - B / 6 * cos_2sigma_m * (4 * sin_sigma**2 - 3) * (4 * cos_2sigma_m**2 - 3)
+            )
+        )
+    )
+    length = b * A * (sigma - delta_sigma)
+
+    bearing = np.arctan2(cos_U2 * sin_lambda, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lambda)
+    bearing = np.mod(bearing, 2 * np.pi)
+    return np.where(converged, length, np.nan), np.where(converged, bearing, np.nan)
+
+
+def compute_span_length_and_bearing(
+    lat1: Degrees,
+    lon1: Degrees,
+    lat2: Degrees,
+    lon2: Degrees,
+    ellipsoidal: bool = False,
+) -> Tuple[Meter, Radian]:
+    r"""Compute the length and initial bearing of the geodesics between two sets of points.
+
+    Parameters
+    ----------
+    lat1:
+        :math:`\left[^\circ\right]`. The latitude of the start points.
+    lon1:
+        :math:`\left[^\circ\right]`. The longitude of the start points.
+    lat2:
+        :math:`\left[^\circ\right]`. The latitude of the end points.
+    lon2:
+        :math:`\left[^\circ\right]`. The longitude of the end points.
+    ellipsoidal:
+        If False, the haversine formula is used for the length and the spherical initial bearing
+        is used (assuming a spherical earth with radius :py:data:`EARTH_RADIUS`). If True,
+        Vincenty's inverse formula for the WGS84 ellipsoid is used. Vincenty's formula may fail to
+        converge for nearly antipodal points, in which case NaN is returned for those points.
+
+    Returns
+    -------
+    Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+        :math:`\left[\text{m}\right]` and :math:`\left[\text{radian}\right]`. The length and the
+        initial bearing (east of north, in :math:`[0, 2\pi)`). The bearing is zero for coincident
+        points.
+    """
+    if ellipsoidal:
+        return _compute_ellipsoidal_length_and_bearing(lat1, lon1, lat2, lon2)
+    return (
+        _compute_spherical_length(lat1, lon1, lat2, lon2),
+        _compute_spherical_bearing(lat1, lon1, lat2, lon2),
+    )
+
+
+def compute_span_length(
+    lat1: Degrees,
+    lon1: Degrees,
+    lat2: Degrees,
+    lon2: Degrees,
+    ellipsoidal: bool = False,
+) -> Meter:
+    r"""Compute the length of the geodesics between two sets of points.
+
+    See :py:func:`compute_span_length_and_bearing` for details.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\left[\text{m}\right]`. The length.
+    """
+    if ellipsoidal:
+        return _compute_ellipsoidal_length_and_bearing(lat1, lon1, lat2, lon2)[0]
+    return _compute_spherical_length(lat1, lon1, lat2, lon2)
+
+
+def compute_bearing(
+    lat1: Degrees,
+    lon1: Degrees,
+    lat2: Degrees,
+    lon2: Degrees,
+    ellipsoidal: bool = False,
+) -> Radian:
+    r"""Compute the initial bearing of the geodesics between two sets of points.
+
+    See :py:func:`compute_span_length_and_bearing` for details.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\left[\text{radian}\right]`. The initial bearing (east of north).
+    """
+    if ellipsoidal:
+        return _compute_ellipsoidal_length_and_bearing(lat1, lon1, lat2, lon2)[1]
+    return _compute_spherical_bearing(lat1, lon1, lat2, lon2)
@@ -9,6 +9,7 @@ temperature. All numerical heavy-lifting is handled by the ``linerate.equations`
 from linerate.models.cigre207 import Cigre207
 from linerate.models.cigre601 import Cigre601
 from linerate.models.ieee738 import IEEE738
+from linerate.models.line import Line
 from linerate.models.thermal_model import ThermalModel
 
-__all__ = ["ThermalModel", "Cigre601", "IEEE738", "Cigre207"]
+__all__ = ["ThermalModel", "Cigre601", "IEEE738", "Cigre207", "Line"]
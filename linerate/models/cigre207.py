@@ -1,23 +1,37 @@
+from typing import Dict, Union
+
+import numpy as np
+
 from linerate.equations import (
+    air_properties,
     cigre207,
     convective_cooling,
     dimensionless,
-    math,
     solar_angles,
     solar_heating,
 )
 from linerate.equations.math import switch_cos_sin
-from linerate.models.thermal_model import ThermalModel, _copy_method_docstring
-from linerate.types import Span, Weather
-from linerate.units import Ampere, Celsius, Date, OhmPerMeter, WattPerMeter
+from linerate.models.thermal_model import ThermalModel, _copy_method_docstring, _invariant
+from linerate.types import Span, TimeIndex, Weather
+from linerate.units import (
+    Ampere,
+    BoolOrBoolArray,
+    Celsius,
+    Date,
+    OhmPerMeter,
+    WattPerMeter,
+    WattPerMeterPerKelvin,
+)
 
 
 class Cigre207(ThermalModel):
+    _has_closed_form_ampacity = True
+
     def __init__(
         self,
         span: Span,
         weather: Weather,
-        time: Date,
+        time: Union[Date, TimeIndex],
         include_diffuse_radiation: bool = True,
         direct_radiation_factor: float = 1.0,
     ):
@@ -35,21 +49,16 @@ class Cigre207(ThermalModel):
         )
 
     @_copy_method_docstring(ThermalModel)
+    @_invariant
     def compute_solar_heating(
         self, conductor_temperature: Celsius, current: Ampere
     ) -> WattPerMeter:
         alpha_s = self.span.conductor.solar_absorptivity
-        phi = self.span.latitude
         gamma_c = self.span.conductor_azimuth
         y = self.span.conductor_altitude
         D = self.span.conductor.conductor_diameter
 
-        omega = solar_angles.compute_hour_angle_relative_to_noon(self.time, self.span.longitude)
-        delta = solar_angles.compute_solar_declination(self.time)
-        sin_H_s = solar_angles.compute_sin_solar_altitude(phi, delta, omega)
-        chi = solar_angles.compute_solar_azimuth_variable(phi, delta, omega)
-        C = solar_angles.compute_solar_azimuth_constant(chi, omega)
-        gamma_s = solar_angles.compute_solar_azimuth(C, chi)  # Z_c in IEEE
+        sin_H_s, gamma_s = self._compute_solar_position()  # gamma_s is Z_c in IEEE
         cos_eta = solar_angles.compute_cos_solar_effective_incidence_angle(
             sin_H_s, gamma_s, gamma_c
         )
@@ -60,7 +69,7 @@ class Cigre207(ThermalModel):
         )
         if self.include_diffuse_radiation:
             I_d = cigre207.solar_heating.compute_diffuse_sky_radiation(I_B, sin_H_s)
-            F = self.span.ground_albedo
+            F = self.weather.ground_albedo
         else:
             I_d = 0
             F = 0
@@ -73,12 +82,17 @@ class Cigre207(ThermalModel):
             D,
         )
 
+    @_invariant
+    def _compute_wind_direction_correction_factor(self):
+        return cigre207.convective_cooling.correct_wind_direction_effect_on_nusselt_number(
+            1.0, self._compute_angle_of_attack()
+        )
+
     @_copy_method_docstring(ThermalModel)
     def compute_convective_cooling(
         self, conductor_temperature: Celsius, current: Ampere
     ) -> WattPerMeter:
         D = self.span.conductor.conductor_diameter
-        d = self.span.conductor.outer_layer_strand_diameter
         V = self.weather.wind_speed
         y = self.span.conductor_altitude
         T_a = self.weather.air_temperature
@@ -86,29 +100,26 @@ class Cigre207(ThermalModel):
         T_f = 0.5 * (T_c + T_a)
 
         # Compute physical quantities
-        lambda_f = cigre207.convective_cooling.compute_thermal_conductivity_of_air(T_f)
-        nu_f = cigre207.convective_cooling.compute_kinematic_viscosity_of_air(T_f)
-        delta = math.compute_angle_of_attack(
-            self.weather.wind_direction, self.span.conductor_azimuth
-        )
+        lambda_f, nu_f, Pr = air_properties.compute_cigre207_air_properties(T_f)
 
         # Compute unitless quantities
         rho_r = cigre207.convective_cooling.compute_relative_air_density(y)
         Re = cigre207.convective_cooling.compute_reynolds_number(V, D, nu_f, rho_r)
         Gr = dimensionless.compute_grashof_number(D, T_c, T_a, nu_f)
-        Pr = cigre207.convective_cooling.compute_prandtl_number(T_f)
-        Rs = dimensionless.compute_conductor_roughness(D, d)
+        Rs = self._compute_conductor_roughness()
 
         # Compute nusselt numbers
         Nu_90 = cigre207.convective_cooling.compute_perpendicular_flow_nusseltnumber(
-            reynolds_number=Re, conductor_roughness=Rs
-        )
-        Nu_delta = cigre207.convective_cooling.correct_wind_direction_effect_on_nusselt_number(
-            Nu_90, delta
+            reynolds_number=Re,
+            conductor_roughness=Rs,
+            validate=self._should_validate("reynolds_number"),
         )
+        Nu_delta = self._compute_wind_direction_correction_factor() * Nu_90
         Nu_cor = cigre207.convective_cooling.compute_low_wind_speed_nusseltnumber(Nu_90)
 
-        Nu_0 = cigre207.convective_cooling.compute_horizontal_natural_nusselt_number(Gr, Pr)
+        Nu_0 = cigre207.convective_cooling.compute_horizontal_natural_nusselt_number(
+            Gr, Pr, validate=self._should_validate("grashof_prandtl_product")
+        )
 
         Nu = cigre207.convective_cooling.compute_nusselt_number(
             forced_convection_nusselt_number=Nu_delta,
@@ -117,6 +128,16 @@ class Cigre207(ThermalModel):
             wind_speed=V,
         )
 
+        self._record_intermediates(
+            film_temperature=T_f,
+            thermal_conductivity_of_air=lambda_f,
+            kinematic_viscosity_of_air=nu_f,
+            relative_air_density=rho_r,
+            reynolds_number=Re,
+            grashof_number=Gr,
+            prandtl_number=Pr,
+            nusselt_number=Nu,
+        )
         return convective_cooling.compute_convective_cooling(
             surface_temperature=conductor_temperature,
             air_temperature=self.weather.air_temperature,
@@ -124,6 +145,88 @@ class Cigre207(ThermalModel):
             thermal_conductivity_of_air=lambda_f,
         )
 
+    @_copy_method_docstring(ThermalModel)
+    def compute_convective_cooling_derivative(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> WattPerMeterPerKelvin:
+        D = self.span.conductor.conductor_diameter
+        V = self.weather.wind_speed
+        y = self.span.conductor_altitude
+        T_a = self.weather.air_temperature
+        T_c = conductor_temperature
+        T_f = 0.5 * (T_c + T_a)
+
+        # Compute physical quantities and their derivatives (dT_f/dT_c = 0.5)
+        lambda_f, nu_f, Pr = air_properties.compute_cigre207_air_properties(T_f)
+        dlambda_f = (
+            0.5 * cigre207.convective_cooling.compute_thermal_conductivity_of_air_derivative(T_f)
+        )
+        dnu_f = 0.5 * cigre207.convective_cooling.compute_kinematic_viscosity_of_air_derivative(T_f)
+        dlog_nu_f = dnu_f / nu_f
+
+        # Compute unitless quantities and their logarithmic derivatives
+        rho_r = cigre207.convective_cooling.compute_relative_air_density(y)
+        Re = cigre207.convective_cooling.compute_reynolds_number(V, D, nu_f, rho_r)
+        Gr = dimensionless.compute_grashof_number(D, T_c, T_a, nu_f)
+        Rs = self._compute_conductor_roughness()
+        dlog_Re = -dlog_nu_f
+        dlog_Pr = 0.5 * cigre207.convective_cooling.compute_prandtl_number_derivative(T_f) / Pr
+
+        # Compute nusselt numbers and their derivatives. The forced convection and low wind
+        # Nusselt numbers are both proportional to the perpendicular flow Nusselt number.
+        Nu_90 = cigre207.convective_cooling.compute_perpendicular_flow_nusseltnumber(
+            reynolds_number=Re,
+            conductor_roughness=Rs,
+            validate=self._should_validate("reynolds_number"),
+        )
+        Nu_delta = self._compute_wind_direction_correction_factor() * Nu_90
+        Nu_cor = cigre207.convective_cooling.compute_low_wind_speed_nusseltnumber(Nu_90)
+        n = cigre207.convective_cooling.compute_perpendicular_flow_nusseltnumber_exponent(Re, Rs)
+
+        Nu_0 = cigre207.convective_cooling.compute_horizontal_natural_nusselt_number(
+            Gr, Pr, validate=self._should_validate("grashof_prandtl_product")
+        )
+        m = cigre207.convective_cooling.compute_horizontal_natural_nusselt_number_exponent(Gr, Pr)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dlog_GrPr = np.divide(1.0, T_c - T_a) - 0.5 / (T_f + 273.15) - 2 * dlog_nu_f + dlog_Pr
+            dNu_0 = np.where(Nu_0 > 0, Nu_0 * m * dlog_GrPr, 0)
+
+        Nu = cigre207.convective_cooling.compute_nusselt_number(
+            forced_convection_nusselt_number=Nu_delta,
+            natural_nusselt_number=Nu_0,
+            low_wind_nusselt_number=Nu_cor,
+            wind_speed=V,
+        )
+        dNu = np.where(Nu == Nu_0, dNu_0, Nu * n * dlog_Re)
+
+        return convective_cooling.compute_convective_cooling_derivative(
+            surface_temperature=conductor_temperature,
+            air_temperature=self.weather.air_temperature,
+            nusselt_number=Nu,
+            nusselt_number_derivative=dNu,
+            thermal_conductivity_of_air=lambda_f,
+            thermal_conductivity_of_air_derivative=dlambda_f,
+        )
+
+    def _compute_out_of_bounds_masks(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> Dict[str, BoolOrBoolArray]:
+        with self._recording_intermediates() as intermediates:
+            self.compute_convective_cooling(conductor_temperature, current)
+        equations = cigre207.convective_cooling
+        return {
+            "reynolds_number_out_of_bounds": (
+                equations._get_perpendicular_flow_nusseltnumber_out_of_bounds(
+                    intermediates["reynolds_number"]
+                )
+            ),
+            "grashof_prandtl_product_out_of_bounds": (
+                equations._get_horizontal_natural_nusselt_number_out_of_bounds(
+                    intermediates["grashof_number"], intermediates["prandtl_number"]
+                )
+            ),
+        }
+
     @_copy_method_docstring(ThermalModel)
     def compute_radiative_cooling(
         self, conductor_temperature: Celsius, current: Ampere
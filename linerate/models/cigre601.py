@@ -1,38 +1,81 @@
+import time
 from numbers import Real
+from typing import Any, Dict, Union
 
 import numpy as np
 
+from linerate import solver
 from linerate.equations import (
+    air_properties,
     cigre601,
     convective_cooling,
     dimensionless,
-    math,
     solar_angles,
     solar_heating,
 )
-from linerate.models.thermal_model import ThermalModel, _copy_method_docstring
-from linerate.types import Span, Weather, WeatherWithSolarRadiation
+from linerate.equations.math import switch_cos_sin
+from linerate.models.thermal_model import (
+    ThermalModel,
+    _copy_method_docstring,
+    _invariant,
+    _record_wall_time,
+)
+from linerate.types import Span, TimeIndex, Weather, WeatherWithSolarRadiation
 from linerate.units import (
     Ampere,
+    BoolOrBoolArray,
     Celsius,
     Date,
-    JoulePerKilogramPerKelvin,
     OhmPerMeter,
     WattPerMeter,
+    WattPerMeterPerKelvin,
 )
 
+_BACKENDS = ("numpy", "numba")
+
 
 class Cigre601(ThermalModel):
+    r"""Thermal model from :cite:p:`cigre601`.
+
+    Parameters
+    ----------
+    span:
+        The span to compute the thermal rating for.
+    weather:
+        The weather parameters.
+    time:
+        The time, used to compute the solar position. Either ``datetime64`` values or a
+        :py:class:`linerate.types.TimeIndex`.
+    max_reynolds_number:
+        The Reynolds number is clipped to this value before computing the Nusselt number.
+    backend:
+        How the heat balance is computed. With ``"numpy"``, each heating and cooling effect is
+        computed equation by equation. With ``"numba"``, the full heat balance is computed element
+        by element in a single compiled pass
+        (see :py:func:`linerate.equations.cigre601.heat_balance.compute_heat_balance`), which avoids
+        allocating intermediate arrays. The two backends agree to within a few units in the last
+        place, but the ``"numba"`` backend does not check the bounds of the Reynolds number and
+        :math:`\text{Gr}\text{Pr}`. The individual heating and cooling effects are always
+        computed equation by equation.
+    """
+
+    _has_closed_form_ampacity = True
+    _has_compiled_solver = True
+
     def __init__(
         self,
         span: Span,
         weather: Weather,
-        time: Date,
+        time: Union[Date, TimeIndex],
         max_reynolds_number: Real = 4000,  # Max value of the angle correction in CIGRE601
+        backend: str = "numpy",
     ):
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, must be one of {list(_BACKENDS)}.")
         super().__init__(span, weather)
         self.time = time
         self.max_reynolds_number = max_reynolds_number
+        self.backend = backend
 
     @_copy_method_docstring(ThermalModel)
     def compute_resistance(self, conductor_temperature: Celsius, current: Ampere) -> OhmPerMeter:
@@ -49,6 +92,7 @@ class Cigre601(ThermalModel):
         )
 
     @_copy_method_docstring(ThermalModel)
+    @_invariant
     def compute_solar_heating(
         self, conductor_temperature: Celsius, current: Ampere
     ) -> WattPerMeter:
@@ -58,11 +102,13 @@ class Cigre601(ThermalModel):
         N_s = self.weather.clearness_ratio
         D = self.span.conductor.conductor_diameter
 
-        sin_H_s = solar_angles.compute_sin_solar_altitude_for_span(self.span, self.time)
+        gamma_c = self.span.conductor_azimuth
 
-        sin_eta = solar_angles.compute_sin_solar_effective_incidence_angle_for_span(
-            self.span, self.time, sin_H_s
+        sin_H_s, gamma_s = self._compute_solar_position()
+        cos_eta = solar_angles.compute_cos_solar_effective_incidence_angle(
+            sin_H_s, gamma_s, gamma_c
         )
+        sin_eta = switch_cos_sin(cos_eta)
 
         I_B = cigre601.solar_heating.compute_direct_solar_radiation(sin_H_s, N_s, y)
         I_d = cigre601.solar_heating.compute_diffuse_sky_radiation(I_B, sin_H_s)
@@ -75,28 +121,34 @@ class Cigre601(ThermalModel):
             D,
         )
 
+    @_invariant
+    def _compute_wind_direction_correction_factor(self):
+        return cigre601.convective_cooling.correct_wind_direction_effect_on_nusselt_number(
+            1.0, self._compute_angle_of_attack(), self._compute_conductor_roughness()
+        )
+
+    @_invariant
+    def _compute_inclination_correction_factor(self):
+        return cigre601.convective_cooling.correct_natural_nusselt_number_inclination(
+            1.0,
+            self.span.inclination,
+            self._compute_conductor_roughness(),
+            validate=self._should_validate("inclination"),
+        )
+
     @_copy_method_docstring(ThermalModel)
     def compute_convective_cooling(
         self, conductor_temperature: Celsius, current: Ampere
     ) -> WattPerMeter:
         D = self.span.conductor.conductor_diameter
-        d = self.span.conductor.outer_layer_strand_diameter
         y = self.span.conductor_altitude
-        beta = self.span.inclination
         V = self.weather.wind_speed
         T_a = self.weather.air_temperature
         T_c = conductor_temperature
         T_f = 0.5 * (T_c + T_a)
 
         # Compute physical quantities
-        lambda_f = cigre601.convective_cooling.compute_thermal_conductivity_of_air(T_f)
-        mu_f = cigre601.convective_cooling.compute_dynamic_viscosity_of_air(T_f)
-        gamma_f = cigre601.convective_cooling.compute_air_density(T_f, y)
-        nu_f = cigre601.convective_cooling.compute_kinematic_viscosity_of_air(mu_f, gamma_f)
-        c_f: JoulePerKilogramPerKelvin = 1005
-        delta = math.compute_angle_of_attack(
-            self.weather.wind_direction, self.span.conductor_azimuth
-        )
+        lambda_f, mu_f, gamma_f, nu_f, Pr = air_properties.compute_cigre601_air_properties(T_f, y)
 
         # Compute unitless quantities
         Re = np.minimum(
@@ -104,26 +156,36 @@ class Cigre601(ThermalModel):
             self.max_reynolds_number,
         )
         Gr = dimensionless.compute_grashof_number(D, T_c, T_a, nu_f)
-        Pr = dimensionless.compute_prandtl_number(lambda_f, mu_f, c_f)
-        Rs = dimensionless.compute_conductor_roughness(D, d)
+        Rs = self._compute_conductor_roughness()
 
         # Compute nusselt numbers
         Nu_90 = cigre601.convective_cooling.compute_perpendicular_flow_nusseltnumber(
-            reynolds_number=Re, conductor_roughness=Rs
-        )
-        Nu_delta = cigre601.convective_cooling.correct_wind_direction_effect_on_nusselt_number(
-            Nu_90, delta, Rs
+            reynolds_number=Re,
+            conductor_roughness=Rs,
+            validate=self._should_validate("reynolds_number"),
         )
+        Nu_delta = self._compute_wind_direction_correction_factor() * Nu_90
 
-        Nu_0 = cigre601.convective_cooling.compute_horizontal_natural_nusselt_number(Gr, Pr)
-        Nu_beta = cigre601.convective_cooling.correct_natural_nusselt_number_inclination(
-            Nu_0, beta, Rs
+        Nu_0 = cigre601.convective_cooling.compute_horizontal_natural_nusselt_number(
+            Gr, Pr, validate=self._should_validate("grashof_prandtl_product")
         )
+        Nu_beta = self._compute_inclination_correction_factor() * Nu_0
 
         Nu = cigre601.convective_cooling.compute_nusselt_number(
             forced_convection_nusselt_number=Nu_delta, natural_nusselt_number=Nu_beta
-        ) # take the max one
+        )  # take the max one
 
+        self._record_intermediates(
+            film_temperature=T_f,
+            thermal_conductivity_of_air=lambda_f,
+            dynamic_viscosity_of_air=mu_f,
+            air_density=gamma_f,
+            kinematic_viscosity_of_air=nu_f,
+            reynolds_number=Re,
+            grashof_number=Gr,
+            prandtl_number=Pr,
+            nusselt_number=Nu,
+        )
         return convective_cooling.compute_convective_cooling(
             surface_temperature=conductor_temperature,
             air_temperature=self.weather.air_temperature,
@@ -131,6 +193,188 @@ class Cigre601(ThermalModel):
             thermal_conductivity_of_air=lambda_f,
         )
 
+    @_copy_method_docstring(ThermalModel)
+    def compute_convective_cooling_derivative(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> WattPerMeterPerKelvin:
+        D = self.span.conductor.conductor_diameter
+        y = self.span.conductor_altitude
+        V = self.weather.wind_speed
+        T_a = self.weather.air_temperature
+        T_c = conductor_temperature
+        T_f = 0.5 * (T_c + T_a)
+
+        # Compute physical quantities and their derivatives (dT_f/dT_c = 0.5)
+        lambda_f, mu_f, gamma_f, nu_f, Pr = air_properties.compute_cigre601_air_properties(T_f, y)
+        dlambda_f = (
+            0.5 * cigre601.convective_cooling.compute_thermal_conductivity_of_air_derivative(T_f)
+        )
+        dmu_f = 0.5 * cigre601.convective_cooling.compute_dynamic_viscosity_of_air_derivative(T_f)
+        dgamma_f = 0.5 * cigre601.convective_cooling.compute_air_density_derivative(T_f, y)
+        dlog_nu_f = dmu_f / mu_f - dgamma_f / gamma_f
+
+        # Compute unitless quantities and their logarithmic derivatives
+        unclipped_Re = dimensionless.compute_reynolds_number(V, D, nu_f)
+        Re = np.minimum(unclipped_Re, self.max_reynolds_number)
+        Gr = dimensionless.compute_grashof_number(D, T_c, T_a, nu_f)
+        Rs = self._compute_conductor_roughness()
+        dlog_Re = np.where(unclipped_Re < self.max_reynolds_number, -dlog_nu_f, 0)
+        dlog_Pr = dmu_f / mu_f - dlambda_f / lambda_f
+
+        # Compute nusselt numbers and their derivatives
+        Nu_90 = cigre601.convective_cooling.compute_perpendicular_flow_nusseltnumber(
+            reynolds_number=Re,
+            conductor_roughness=Rs,
+            validate=self._should_validate("reynolds_number"),
+        )
+        Nu_delta = self._compute_wind_direction_correction_factor() * Nu_90
+        n = cigre601.convective_cooling.compute_perpendicular_flow_nusseltnumber_exponent(Re, Rs)
+        dNu_delta = Nu_delta * n * dlog_Re
+
+        Nu_0 = cigre601.convective_cooling.compute_horizontal_natural_nusselt_number(
+            Gr, Pr, validate=self._should_validate("grashof_prandtl_product")
+        )
+        Nu_beta = self._compute_inclination_correction_factor() * Nu_0
+        m = cigre601.convective_cooling.compute_horizontal_natural_nusselt_number_exponent(Gr, Pr)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dlog_GrPr = np.divide(1.0, T_c - T_a) - 0.5 / (T_f + 273.15) - 2 * dlog_nu_f + dlog_Pr
+            dNu_beta = np.where(Nu_beta > 0, Nu_beta * m * dlog_GrPr, 0)
+
+        Nu = cigre601.convective_cooling.compute_nusselt_number(
+            forced_convection_nusselt_number=Nu_delta, natural_nusselt_number=Nu_beta
+        )
+        dNu = np.where(Nu_delta >= Nu_beta, dNu_delta, dNu_beta)
+
+        return convective_cooling.compute_convective_cooling_derivative(
+            surface_temperature=conductor_temperature,
+            air_temperature=self.weather.air_temperature,
+            nusselt_number=Nu,
+            nusselt_number_derivative=dNu,
+            thermal_conductivity_of_air=lambda_f,
+            thermal_conductivity_of_air_derivative=dlambda_f,
+        )
+
+    def _compute_out_of_bounds_masks(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> Dict[str, BoolOrBoolArray]:
+        with self._recording_intermediates() as intermediates:
+            self.compute_convective_cooling(conductor_temperature, current)
+        Rs = self._compute_conductor_roughness()
+        equations = cigre601.convective_cooling
+        return {
+            "reynolds_number_out_of_bounds": (
+                equations._get_perpendicular_flow_nusseltnumber_out_of_bounds(
+                    intermediates["reynolds_number"], Rs
+                )
+            ),
+            "grashof_prandtl_product_out_of_bounds": (
+                equations._get_horizontal_natural_nusselt_number_out_of_bounds(
+                    intermediates["grashof_number"], intermediates["prandtl_number"]
+                )
+            ),
+            "inclination_out_of_bounds": equations._get_conductor_inclination_out_of_bounds(
+                self.span.inclination, Rs
+            ),
+        }
+
+    def _get_heat_balance_parameters(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> Dict[str, Any]:
+        """Arguments of the fused heat balance, except the temperature and current, in order."""
+        conductor = self.span.conductor
+        b = conductor.constant_magnetic_effect
+        m = conductor.current_density_proportional_magnetic_effect
+        max_increase = conductor.max_magnetic_core_relative_resistance_increase
+        # Mimic the special cases of correct_resistance_acsr_magnetic_core_loss
+        if b is None:
+            b, m, max_increase = 1.0, 0.0, np.inf
+        elif m is None or np.all(m == 0):
+            m, max_increase = 0.0, np.inf
+        else:
+            max_increase = np.where(np.asarray(m) == 0, np.inf, max_increase)
+
+        return dict(
+            air_temperature=self.weather.air_temperature,
+            wind_speed=self.weather.wind_speed,
+            height_above_sea_level=self.span.conductor_altitude,
+            conductor_diameter=conductor.conductor_diameter,
+            conductor_roughness=self._compute_conductor_roughness(),
+            max_reynolds_number=self.max_reynolds_number,
+            wind_direction_correction_factor=self._compute_wind_direction_correction_factor(),
+            inclination_correction_factor=self._compute_inclination_correction_factor(),
+            solar_heating=self.compute_solar_heating(conductor_temperature, current),
+            conductor_emissivity=conductor.emissivity,
+            temperature1=conductor.temperature1,
+            temperature2=conductor.temperature2,
+            resistance_at_temperature1=conductor.resistance_at_temperature1,
+            resistance_at_temperature2=conductor.resistance_at_temperature2,
+            aluminium_cross_section_area=conductor.aluminium_cross_section_area,
+            constant_magnetic_effect=b,
+            current_density_proportional_magnetic_effect=m,
+            max_relative_increase=max_increase,
+        )
+
+    @_copy_method_docstring(ThermalModel)
+    def compute_heat_balance(self, conductor_temperature: Celsius, current: Ampere) -> WattPerMeter:
+        if self.backend == "numpy":
+            return super().compute_heat_balance(conductor_temperature, current)
+
+        start_time = time.perf_counter()
+        heat_balance = cigre601.heat_balance.compute_heat_balance(
+            conductor_temperature=conductor_temperature,
+            current=current,
+            **self._get_heat_balance_parameters(conductor_temperature, current),
+        )
+        if self._stats is not None:
+            _record_wall_time(self._stats, "heat_balance", start_time)
+        return heat_balance
+
+    def _run_compiled_solver(self, kernel, *arguments):
+        start_time = time.perf_counter()
+        out, invalid_mask = cigre601.heat_balance._solve(kernel, *arguments)
+        if self._stats is not None:
+            solver._record_result(self._stats, out, invalid_mask, start_time)
+        return out
+
+    def _compute_compiled_conductor_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        min_ampacity: Ampere,
+        max_ampacity: Ampere,
+        tolerance: float,
+        accept_invalid_values: bool,
+        method: str,
+    ) -> Ampere:
+        return self._run_compiled_solver(
+            cigre601.heat_balance._compute_conductor_ampacity,
+            max_conductor_temperature,
+            min_ampacity,
+            max_ampacity,
+            tolerance,
+            method,
+            accept_invalid_values,
+            self._get_heat_balance_parameters(max_conductor_temperature, min_ampacity).values(),
+        )
+
+    def _compute_compiled_conductor_temperature(
+        self,
+        current: Ampere,
+        min_temperature: Celsius,
+        max_temperature: Celsius,
+        tolerance: float,
+        method: str,
+    ) -> Celsius:
+        return self._run_compiled_solver(
+            cigre601.heat_balance._compute_conductor_temperature,
+            current,
+            min_temperature,
+            max_temperature,
+            tolerance,
+            method,
+            False,
+            self._get_heat_balance_parameters(min_temperature, current).values(),
+        )
+
     @_copy_method_docstring(ThermalModel)
     def compute_radiative_cooling(
         self, conductor_temperature: Celsius, current: Ampere
@@ -173,10 +417,18 @@ class Cigre601WithSolarRadiation(Cigre601):
     """Extension of the Cigre601 model that accepts external solar radiation data for direct and diffuse solar
     radiation."""
 
-    def __init__(self, span: Span, weather: WeatherWithSolarRadiation, time: Date):
-        super().__init__(span, weather, time)
+    def __init__(
+        self,
+        span: Span,
+        weather: WeatherWithSolarRadiation,
+        time: Union[Date, TimeIndex],
+        max_reynolds_number: Real = 4000,
+        backend: str = "numpy",
+    ):
+        super().__init__(span, weather, time, max_reynolds_number, backend)
         self.weather = weather
 
+    @_invariant
     def compute_solar_heating(
         self, conductor_temperature: Celsius, current: Ampere
     ) -> WattPerMeter:
@@ -187,11 +439,13 @@ class Cigre601WithSolarRadiation(Cigre601):
         I_B = self.weather.direct_radiation_intensity
         I_d = self.weather.diffuse_radiation_intensity
 
-        sin_H_s = solar_angles.compute_sin_solar_altitude_for_span(self.span, self.time)
+        gamma_c = self.span.conductor_azimuth
 
-        sin_eta = solar_angles.compute_sin_solar_effective_incidence_angle_for_span(
-            self.span, self.time, sin_H_s
+        sin_H_s, gamma_s = self._compute_solar_position()
+        cos_eta = solar_angles.compute_cos_solar_effective_incidence_angle(
+            sin_H_s, gamma_s, gamma_c
         )
+        sin_eta = switch_cos_sin(cos_eta)
 
         I_T = cigre601.solar_heating.compute_global_radiation_intensity(
             I_B, I_d, F, sin_eta, sin_H_s
@@ -1,24 +1,56 @@
 from numbers import Real
+from typing import Union
 
 import numpy as np
 
-from linerate.equations import dimensionless, ieee738, math, solar_angles
-from linerate.models.thermal_model import ThermalModel, _copy_method_docstring
-from linerate.types import Span, Weather
-from linerate.units import Ampere, Celsius, Date, OhmPerMeter, WattPerMeter
+from linerate.equations import air_properties, dimensionless, ieee738, solar_angles
+from linerate.models.thermal_model import ThermalModel, _copy_method_docstring, _invariant
+from linerate.types import Span, TimeIndex, Weather
+from linerate.units import Ampere, Celsius, Date, OhmPerMeter, WattPerMeter, WattPerMeterPerKelvin
+
+_BACKENDS = ("numpy", "numba")
 
 
 class IEEE738(ThermalModel):
+    r"""Thermal model from :cite:p:`ieee738`.
+
+    Parameters
+    ----------
+    span:
+        The span to compute the thermal rating for.
+    weather:
+        The weather parameters.
+    time:
+        The time, used to compute the solar position. Either ``datetime64`` values or a
+        :py:class:`linerate.types.TimeIndex`.
+    max_reynolds_number:
+        The Reynolds number is clipped to this value before computing the forced convection.
+    backend:
+        How the convective cooling is computed. With ``"numpy"``, it is computed equation by
+        equation. With ``"numba"``, it is computed element by element in a single compiled pass
+        (see
+        :py:func:`linerate.equations.ieee738.convective_cooling.compute_fused_convective_cooling`),
+        which avoids allocating intermediate arrays. The two backends agree to within a few units
+        in the last place. The intermediate quantities of :py:meth:`compute_info` are always
+        computed equation by equation.
+    """
+
+    _has_closed_form_ampacity = True
+
     def __init__(
         self,
         span: Span,
         weather: Weather,
-        time: Date,
+        time: Union[Date, TimeIndex],
         max_reynolds_number: Real = 50_000,  # Max Reynolds number for forced convection
+        backend: str = "numpy",
     ):
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, must be one of {list(_BACKENDS)}.")
         super().__init__(span, weather)
         self.time = time
         self.max_reynolds_number = max_reynolds_number
+        self.backend = backend
 
     @_copy_method_docstring(ThermalModel)
     def compute_resistance(self, conductor_temperature: Celsius, current: Ampere) -> OhmPerMeter:
@@ -35,28 +67,28 @@ class IEEE738(ThermalModel):
         )
 
     @_copy_method_docstring(ThermalModel)
+    @_invariant
     def compute_solar_heating(
         self, conductor_temperature: Celsius, current: Ampere
     ) -> WattPerMeter:
         alpha_s = self.span.conductor.solar_absorptivity  # alpha in IEEE
-        phi = self.span.latitude  # Lat in IEEE
         gamma_c = self.span.conductor_azimuth  # Z_l i IEEE
         y = self.span.conductor_altitude  # H_e in IEEE
         D = self.span.conductor.conductor_diameter  # D_0 in IEEE
 
-        omega = solar_angles.compute_hour_angle_relative_to_noon(self.time, self.span.longitude)
-        delta = solar_angles.compute_solar_declination(self.time)
-        sin_H_c = solar_angles.compute_sin_solar_altitude(phi, delta, omega)
+        sin_H_c, Z_c = self._compute_solar_position()
         Q_s = ieee738.solar_heating.compute_total_heat_flux_density(sin_H_c, True)
         K_solar = ieee738.solar_heating.compute_solar_altitude_correction_factor(y)
         Q_se = ieee738.solar_heating.compute_elevation_correction_factor(K_solar, Q_s)
-        chi = solar_angles.compute_solar_azimuth_variable(phi, delta, omega)
-        C = solar_angles.compute_solar_azimuth_constant(chi, omega)
-        Z_c = solar_angles.compute_solar_azimuth(C, chi)
         cos_theta = solar_angles.compute_cos_solar_effective_incidence_angle(sin_H_c, Z_c, gamma_c)
 
         return ieee738.solar_heating.compute_solar_heating(alpha_s, Q_se, cos_theta, D)
 
+    @_invariant
+    def _compute_wind_direction_factor(self):
+        delta = self._compute_angle_of_attack()  # Phi in IEEE
+        return ieee738.convective_cooling.compute_wind_direction_factor(delta)
+
     @_copy_method_docstring(ThermalModel)
     def compute_convective_cooling(
         self, conductor_temperature: Celsius, current: Ampere
@@ -66,24 +98,65 @@ class IEEE738(ThermalModel):
         V = self.weather.wind_speed  # V_w in IEEE
         T_a = self.weather.air_temperature
         T_c = conductor_temperature
+        if self.backend == "numba" and self._intermediates is None:
+            return ieee738.convective_cooling.compute_fused_convective_cooling(
+                T_c, T_a, V, y, D, self.max_reynolds_number, self._compute_wind_direction_factor()
+            )
         T_f = 0.5 * (T_c + T_a)  # T_film in IEEE
 
-        mu_f = ieee738.convective_cooling.compute_dynamic_viscosity_of_air(T_f)
-        rho_f = ieee738.convective_cooling.compute_air_density(T_f, y)
-        nu_f = ieee738.convective_cooling.compute_kinematic_viscosity_of_air(mu_f, rho_f)
+        k_f, mu_f, rho_f, nu_f = air_properties.compute_ieee738_air_properties(T_f, y)
         Re = np.minimum(
             dimensionless.compute_reynolds_number(V, D, nu_f),  # N_Re in IEEE
             self.max_reynolds_number,
         )
-        delta = math.compute_angle_of_attack(
-            self.weather.wind_direction, self.span.conductor_azimuth
-        )  # Phi in IEEE
-        K_angle = ieee738.convective_cooling.compute_wind_direction_factor(delta)
-        k_f = ieee738.convective_cooling.compute_thermal_conductivity_of_air(T_f)
+        K_angle = self._compute_wind_direction_factor()
         q_cf = ieee738.convective_cooling.compute_forced_convection(K_angle, Re, k_f, T_c, T_a)
         q_cn = ieee738.convective_cooling.compute_natural_convection(rho_f, D, T_c, T_a)
+        self._record_intermediates(
+            film_temperature=T_f,
+            thermal_conductivity_of_air=k_f,
+            dynamic_viscosity_of_air=mu_f,
+            air_density=rho_f,
+            kinematic_viscosity_of_air=nu_f,
+            reynolds_number=Re,
+            forced_convection=q_cf,
+            natural_convection=q_cn,
+        )
         return ieee738.convective_cooling.compute_convective_cooling(q_cf, q_cn)
 
+    @_copy_method_docstring(ThermalModel)
+    def compute_convective_cooling_derivative(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> WattPerMeterPerKelvin:
+        D = self.span.conductor.conductor_diameter  # D_0 in IEEE
+        y = self.span.conductor_altitude  # H_e in IEEE
+        V = self.weather.wind_speed  # V_w in IEEE
+        T_a = self.weather.air_temperature
+        T_c = conductor_temperature
+        T_f = 0.5 * (T_c + T_a)  # T_film in IEEE
+
+        # Compute physical quantities and their derivatives (dT_f/dT_c = 0.5)
+        k_f, mu_f, rho_f, nu_f = air_properties.compute_ieee738_air_properties(T_f, y)
+        dmu_f = 0.5 * ieee738.convective_cooling.compute_dynamic_viscosity_of_air_derivative(T_f)
+        drho_f = 0.5 * ieee738.convective_cooling.compute_air_density_derivative(T_f, y)
+        dlog_nu_f = dmu_f / mu_f - drho_f / rho_f
+
+        unclipped_Re = dimensionless.compute_reynolds_number(V, D, nu_f)  # N_Re in IEEE
+        Re = np.minimum(unclipped_Re, self.max_reynolds_number)
+        dRe = np.where(unclipped_Re < self.max_reynolds_number, -Re * dlog_nu_f, 0)
+        K_angle = self._compute_wind_direction_factor()
+        dk_f = 0.5 * ieee738.convective_cooling.compute_thermal_conductivity_of_air_derivative(T_f)
+
+        q_cf = ieee738.convective_cooling.compute_forced_convection(K_angle, Re, k_f, T_c, T_a)
+        q_cn = ieee738.convective_cooling.compute_natural_convection(rho_f, D, T_c, T_a)
+        dq_cf = ieee738.convective_cooling.compute_forced_convection_derivative(
+            K_angle, Re, dRe, k_f, dk_f, T_c, T_a
+        )
+        dq_cn = ieee738.convective_cooling.compute_natural_convection_derivative(
+            rho_f, drho_f, D, T_c, T_a
+        )
+        return np.where(q_cf >= q_cn, dq_cf, dq_cn)
+
     @_copy_method_docstring(ThermalModel)
     def compute_radiative_cooling(
         self, conductor_temperature: Celsius, current: Ampere
@@ -0,0 +1,146 @@
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from linerate.models.thermal_model import ThermalModel, _get_element_shape, _take_elements
+from linerate.units import Ampere, Celsius
+
+__all__ = ["Line"]
+
+
+class Line:
+    r"""A power line, or corridor, of spans in series.
+
+    The thermal rating of a line is the minimum of the thermal ratings of its spans. The spans are
+    described by a single thermal model whose arrays have a span axis, typically a model of a
+    :py:class:`linerate.types.SpanArray` with weather arrays of shape ``(num_times, num_spans)``
+    and times of shape ``(num_times, 1)``.
+
+    Parameters
+    ----------
+    model:
+        Thermal model of all spans of the line.
+    span_axis:
+        The axis of the model's (broadcast) arrays that corresponds to the spans.
+    """
+
+    def __init__(self, model: ThermalModel, span_axis: int = -1):
+        self.model = model
+        self.span_axis = span_axis
+
+    def compute_steady_state_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        min_ampacity: Ampere = 0,
+        max_ampacity: Ampere = 5000,
+        tolerance: float = 1.0,
+        accept_invalid_values: bool = False,
+        prune: bool = False,
+        prune_tolerance: float = 64.0,
+        **kwargs,
+    ) -> Tuple[Ampere, npt.NDArray[np.intp]]:
+        r"""Compute the steady-state thermal rating of the line and the limiting span.
+
+        Parameters
+        ----------
+        max_conductor_temperature:
+            :math:`T_\text{max}~\left[^\circ\text{C}\right]`. Maximum allowed conductor temperature
+        min_ampacity:
+            :math:`I_\text{min}~\left[\text{A}\right]`. Lower bound for the numerical scheme for
+            computing the ampacity
+        max_ampacity:
+            :math:`I_\text{max}~\left[\text{A}\right]`. Upper bound for the numerical scheme for
+            computing the ampacity
+        tolerance:
+            :math:`\Delta I~\left[\text{A}\right]`. The numerical accuracy of the span ampacities.
+        accept_invalid_values:
+            If True, np.nan is returned whenever the current cannot be found within the provided
+            search interval. If False, a ValueError will be raised instead.
+        prune:
+            If True, the ampacity of all spans is first computed with the tolerance
+            ``prune_tolerance``. This gives a cheap lower and upper bound for the ampacity of each
+            span. Only the spans whose lower bound is below the smallest upper bound of the line
+            can be limiting, so the ampacity is only refined to ``tolerance`` for those spans. The
+            line rating is the same as without pruning, up to the tolerance. Pruning is not useful
+            with ``method="direct"``, which does not use a tolerance.
+        prune_tolerance:
+            :math:`\left[\text{A}\right]`. The tolerance of the initial ampacity bounds if
+            ``prune=True``.
+        **kwargs:
+            Other arguments to :py:meth:`ThermalModel.compute_steady_state_ampacity`, e.g.
+            ``method`` or ``n_jobs``.
+
+        Returns
+        -------
+        Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ndarray[Any, dtype[intp]]]
+            :math:`I~\left[\text{A}\right]`. The thermal rating of the line, and the index of the
+            limiting span (the span with the lowest rating) along the span axis. The arrays have
+            the shape of the model's arrays without the span axis. If the ampacity of any span
+            is NaN, then the line rating is NaN, and the index of the first such span is
+            returned.
+        """
+        solve_kwargs = dict(accept_invalid_values=accept_invalid_values, **kwargs)
+        if prune:
+            ampacity = self._compute_pruned_span_ampacity(
+                max_conductor_temperature,
+                min_ampacity,
+                max_ampacity,
+                tolerance,
+                prune_tolerance,
+                **solve_kwargs,
+            )
+        else:
+            ampacity = self.model.compute_steady_state_ampacity(
+                max_conductor_temperature, min_ampacity, max_ampacity, tolerance, **solve_kwargs
+            )
+
+        shape = np.broadcast_shapes(np.shape(ampacity), _get_element_shape(self.model))
+        ampacity = np.broadcast_to(ampacity, shape)
+        limiting_span = np.argmin(ampacity, axis=self.span_axis)
+        rating = np.take_along_axis(
+            ampacity, np.expand_dims(limiting_span, self.span_axis), axis=self.span_axis
+        )
+        return np.squeeze(rating, axis=self.span_axis), limiting_span
+
+    def _compute_pruned_span_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        min_ampacity: Ampere,
+        max_ampacity: Ampere,
+        tolerance: float,
+        prune_tolerance: float,
+        **solve_kwargs,
+    ) -> Ampere:
+        """Span ampacities, refined to ``tolerance`` only for spans that can be limiting."""
+        model = self.model
+        coarse_ampacity = model.compute_steady_state_ampacity(
+            max_conductor_temperature,
+            min_ampacity,
+            max_ampacity,
+            max(prune_tolerance, tolerance),
+            **solve_kwargs,
+        )
+        shape = np.broadcast_shapes(np.shape(coarse_ampacity), _get_element_shape(model))
+        num_conductors = np.broadcast_to(model.span.num_conductors, shape)
+
+        # The root is within half a tolerance of the coarse estimate. Widen the bracket slightly
+        # so that it still contains the root after rounding.
+        half_width = 0.5 * max(prune_tolerance, tolerance) * (1 + 1e-9)
+        coarse_ampacity = np.broadcast_to(coarse_ampacity, shape) / num_conductors
+        lower = np.maximum(coarse_ampacity - half_width, min_ampacity)
+        upper = np.minimum(coarse_ampacity + half_width, max_ampacity)
+
+        min_upper = np.min(upper * num_conductors, axis=self.span_axis, keepdims=True)
+        can_be_limiting = lower * num_conductors <= min_upper  # False for NaN-values
+        ampacity = np.where(np.isnan(coarse_ampacity), np.nan, np.inf)
+        if np.any(can_be_limiting):
+            subset = _take_elements(model, can_be_limiting)
+            ampacity[can_be_limiting] = subset.compute_steady_state_ampacity(
+                _take_elements(np.asarray(max_conductor_temperature), can_be_limiting),
+                lower[can_be_limiting],
+                upper[can_be_limiting],
+                tolerance,
+                **solve_kwargs,
+            )
+        return ampacity
@@ -1,10 +1,30 @@
+import copy
+import dataclasses
+import functools
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
-from linerate import solver
-from linerate.equations import joule_heating, radiative_cooling
-from linerate.types import Span, Weather
-from linerate.units import Ampere, Celsius, OhmPerMeter, WattPerMeter
+import numpy as np
+import numpy.typing as npt
+
+from linerate import solar_position, solver
+from linerate.equations import dimensionless, joule_heating, math, radiative_cooling
+from linerate.types import CatalogConductor, Conductor, Span, Weather
+from linerate.units import (
+    Ampere,
+    BoolOrBoolArray,
+    Celsius,
+    FloatOrFloatArray,
+    OhmPerMeter,
+    Second,
+    WattPerMeter,
+    WattPerMeterPerAmpere,
+    WattPerMeterPerKelvin,
+)
 
 
 def _copy_method_docstring(parent_class):
@@ -15,14 +35,306 @@ def _copy_method_docstring(parent_class):
     return inner
 
 
+def _invariant(method):
+    """Cache a model method whose value does not depend on the conductor temperature or current.
+
+    The value is only cached while the model is prepared (see :py:meth:`ThermalModel.prepared`),
+    and any arguments are ignored when looking up the cached value.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._invariant_cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        key = method.__qualname__
+        if key not in cache:
+            cache[key] = method(self, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+_ENGINES = ("numpy", "compiled")
+
+_VALIDATION_POLICIES = ("always", "once", "never")
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, must be one of {list(_ENGINES)}.")
+
+
+def _get_num_workers(n_jobs: int) -> int:
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise ValueError(f"n_jobs must be a non-zero integer, not {n_jobs!r}.")
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _get_element_shape(value: Any) -> Tuple[int, ...]:
+    """Broadcast the shapes of all array parameters of a model, dataclass or dictionary."""
+    if isinstance(value, np.ndarray):
+        return value.shape
+    if isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, tuple):
+        items = value
+    elif isinstance(value, ThermalModel) or dataclasses.is_dataclass(value):
+        items = vars(value).values()
+    else:
+        return ()
+    return np.broadcast_shapes(*(_get_element_shape(item) for item in items))
+
+
+def _compute_resistance_coefficients(
+    conductor: Conductor,
+) -> Tuple[FloatOrFloatArray, FloatOrFloatArray]:
+    return joule_heating.compute_resistance_coefficients(
+        temperature1=conductor.temperature1,
+        temperature2=conductor.temperature2,
+        resistance_at_temperature1=conductor.resistance_at_temperature1,
+        resistance_at_temperature2=conductor.resistance_at_temperature2,
+    )
+
+
+def _to_structured_array(values: Dict[str, FloatOrFloatArray]) -> np.ndarray:
+    """Broadcast the values to a common shape and store them as fields of a structured array."""
+    arrays = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values.values()))
+    shape = arrays[0].shape if arrays else ()
+    out = np.empty(shape, dtype=[(key, float) for key in values])
+    for key, array in zip(values, arrays):
+        out[key] = array
+    return out
+
+
+def _record_wall_time(stats: solver.SolverStats, key: str, start_time: float) -> None:
+    elapsed = time.perf_counter() - start_time
+    stats.component_wall_time[key] = stats.component_wall_time.get(key, 0.0) + elapsed
+
+
+#: Attributes of thermal models that are shared by reference with the element subsets, so the
+#: wall times and intermediates recorded by the subsets (e.g. in the active-set solvers) are kept.
+_SHARED_MODEL_ATTRIBUTES = ("_stats", "_intermediates")
+
+
+def _map_elements(value: Any, take: Callable[[np.ndarray], np.ndarray]) -> Any:
+    """Apply ``take`` to all array parameters, recursively.
+
+    ``take`` selects elements from an array, and raises ``ValueError`` if the array does not
+    have the element shape (the array is then left as it is). Scalars are left as they are.
+    Thermal models, dataclasses (e.g. spans and weather) and dictionaries are shallow-copied with
+    all their attributes mapped recursively, except the solver statistics and the recorded
+    intermediates of thermal models, which are shared with the original model.
+    """
+    if isinstance(value, np.ndarray) and value.ndim > 0:
+        try:
+            return take(value)
+        except ValueError:
+            return value
+    if isinstance(value, dict):
+        return {key: _map_elements(item, take) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_map_elements(item, take) for item in value)
+    if isinstance(value, ThermalModel) or dataclasses.is_dataclass(value):
+        subset = copy.copy(value)
+        # Update __dict__ directly, since the dataclasses are frozen. This also subsets already
+        # computed cached properties.
+        for key, item in vars(value).items():
+            if isinstance(value, ThermalModel) and key in _SHARED_MODEL_ATTRIBUTES:
+                continue
+            vars(subset)[key] = _map_elements(item, take)
+        return subset
+    return value
+
+
+def _take_elements(value: Any, where: npt.NDArray[np.bool_]) -> Any:
+    """Select the elements given by the boolean mask ``where`` from all array parameters.
+
+    Arrays that are broadcastable to ``where.shape`` are broadcast and indexed by ``where``,
+    scalars and other arrays are left as they are. Thermal models, dataclasses (e.g. spans and
+    weather) and dictionaries are shallow-copied with all their attributes subset recursively.
+    """
+    return _map_elements(value, lambda array: np.broadcast_to(array, where.shape)[where])
+
+
+def _take_index(value: Any, index: int, axis: int, shape: Tuple[int, ...]) -> Any:
+    """Select the elements with the given index along ``axis`` from all array parameters.
+
+    Like :py:func:`_take_elements`, but arrays that are broadcastable to ``shape`` are sliced
+    along ``axis``, so the result has the shape ``shape`` without ``axis``.
+    """
+    return _map_elements(
+        value, lambda array: np.take(np.broadcast_to(array, shape), index, axis=axis)
+    )
+
+
 class ThermalModel(ABC):
     """Abstract class for a minimal conductor thermal model."""
 
+    #: Whether the current only affects the heat balance through the Joule heating, computed with
+    #: the resistance model of :py:meth:`ThermalModel.compute_resistance`. If so, the steady-state
+    #: ampacity can be computed without a numerical root finder (``method="direct"``).
+    _has_closed_form_ampacity: bool = False
+
+    #: Whether the model implements compiled per-element solvers, used with ``engine="compiled"``.
+    _has_compiled_solver: bool = False
+
+    #: Cached values of the methods decorated with ``_invariant``. ``None`` unless prepared.
+    _invariant_cache: Optional[Dict[str, Any]] = None
+
+    #: Statistics that the heat balance evaluations are recorded in. ``None`` unless instrumented.
+    _stats: Optional[solver.SolverStats] = None
+
+    #: Intermediate quantities recorded by the heating and cooling effects, e.g. the Reynolds
+    #: number. ``None`` unless recorded by :py:meth:`compute_info`.
+    _intermediates: Optional[Dict[str, Any]] = None
+
+    _validation: str = "always"
+
     @abstractmethod
     def __init__(self, span: Span, weather: Weather):
         self.span = span
         self.weather = weather
 
+    @contextmanager
+    def prepared(self) -> Iterator["ThermalModel"]:
+        """Context manager that reuses terms that are independent of the temperature and current.
+
+        Within the context, the terms of the heat balance that do not depend on the conductor
+        temperature or the current (e.g. the solar heating, the wind angle of attack and the
+        conductor roughness) are computed once and reused for all subsequent heat balance
+        evaluations. The results are identical to those computed without preparing the model.
+        The solvers (e.g. :py:meth:`compute_steady_state_ampacity`) always use a prepared model.
+
+        The model parameters (span, weather and time) should not be changed within the context.
+        """
+        if self._invariant_cache is not None:
+            yield self
+            return
+
+        self._invariant_cache = {}
+        try:
+            yield self
+        finally:
+            self._invariant_cache = None
+
+    @property
+    def validation(self) -> str:
+        r"""How often the heat balance equations check that their inputs are within bounds.
+
+        Some equations check that their inputs are within the range where they are valid, e.g. the
+        Reynolds number and :math:`\text{Gr}\text{Pr}` of the Nusselt number correlations of
+        :cite:p:`cigre601` and :cite:p:`cigre207`. The checks are full-array reductions, which
+        are repeated in every iteration of a solver. The validation policy is one of:
+
+        * ``"always"`` (the default): All heat balance evaluations are checked.
+        * ``"once"``: Within a prepared model (see :py:meth:`prepared`), each check is only run in
+          the first heat balance evaluation, so the solvers validate their inputs once, before
+          iterating. The checks only see the conductor temperature of the first evaluation. This
+          is a complete validation for the ampacity, where the conductor temperature is fixed, but
+          not for the conductor temperature, where the later iterations are not checked. Outside
+          a prepared model, all evaluations are checked.
+        * ``"never"``: No heat balance evaluations are checked, for inputs that are known to be
+          valid.
+
+        With ``"once"`` or ``"never"``, pass a :py:class:`linerate.solver.SolverDiagnostics` to
+        the solvers to find the elements that are out of bounds at the solution.
+        """
+        return self._validation
+
+    @validation.setter
+    def validation(self, validation: str) -> None:
+        if validation not in _VALIDATION_POLICIES:
+            raise ValueError(
+                f"Unknown validation policy {validation!r}, must be one of "
+                f"{list(_VALIDATION_POLICIES)}."
+            )
+        self._validation = validation
+
+    def _should_validate(self, check: str) -> bool:
+        """Whether the check with the given name should run, according to the validation policy."""
+        if self._validation == "never":
+            return False
+        if self._validation == "always" or self._invariant_cache is None:
+            return True
+
+        key = f"validated {check}"
+        if key in self._invariant_cache:
+            return False
+        self._invariant_cache[key] = True
+        return True
+
+    @contextmanager
+    def instrumented(self, stats: Optional[solver.SolverStats]) -> Iterator["ThermalModel"]:
+        """Context manager that records the wall time of each heating and cooling effect.
+
+        Within the context, :py:meth:`compute_heat_balance` adds the wall time spent in each
+        heating and cooling effect to ``stats.component_wall_time``, and solves without an explicit
+        ``stats`` argument record their solver statistics in ``stats``. If ``stats`` is ``None``,
+        the model is left as it is, so instrumentation costs nothing unless it is enabled.
+        """
+        if stats is None:
+            yield self
+            return
+
+        previous_stats = self._stats
+        self._stats = stats
+        try:
+            yield self
+        finally:
+            self._stats = previous_stats
+
+    @contextmanager
+    def _recording_intermediates(self) -> Iterator[Dict[str, Any]]:
+        previous_intermediates = self._intermediates
+        self._intermediates = {}
+        try:
+            yield self._intermediates
+        finally:
+            self._intermediates = previous_intermediates
+
+    def _record_intermediates(self, **intermediates: Any) -> None:
+        """Record intermediate quantities, if they are being recorded (see ``compute_info``)."""
+        if self._intermediates is not None:
+            self._intermediates.update(intermediates)
+
+    @_invariant
+    def _compute_angle_of_attack(self):
+        return math.compute_angle_of_attack(
+            self.weather.wind_direction, self.span.conductor_azimuth
+        )
+
+    @_invariant
+    def _compute_resistance_coefficients(self) -> Tuple[FloatOrFloatArray, FloatOrFloatArray]:
+        """Slope and intercept of the resistance, see :py:func:`joule_heating.compute_resistance`.
+
+        For conductors from a :py:class:`linerate.types.ConductorCatalog`, the coefficients are
+        computed once per conductor type.
+        """
+        conductor = self.span.conductor
+        if isinstance(conductor, CatalogConductor):
+            return conductor.gather_derived(
+                "resistance_coefficients", _compute_resistance_coefficients
+            )
+        return _compute_resistance_coefficients(conductor)
+
+    @_invariant
+    def _compute_solar_position(self) -> Tuple[FloatOrFloatArray, FloatOrFloatArray]:
+        """The sine of the solar altitude and the solar azimuth for models with a ``time``
+        attribute, shared between models by :py:data:`linerate.solar_position.default_cache`."""
+        return solar_position.default_cache.compute_solar_position(
+            self.time, self.span.latitude, self.span.longitude
+        )
+
+    @_invariant
+    def _compute_conductor_roughness(self):
+        D = self.span.conductor.conductor_diameter
+        d = self.span.conductor.outer_layer_strand_diameter
+        return dimensionless.compute_conductor_roughness(D, d)
+
     @abstractmethod
     def compute_resistance(self, conductor_temperature: Celsius, current: Ampere) -> OhmPerMeter:
         r"""Compute the conductor resistance, :math:`R~\left[\Omega~\text{m}^{-1}\right]`.
@@ -39,13 +351,8 @@ class ThermalModel(ABC):
         Union[float, float64, ndarray[Any, dtype[float64]]]
             :math:`R~\left[\Omega\right]`. The resistance at the given temperature and current.
         """
-        resistance = joule_heating.compute_resistance(
-            conductor_temperature,
-            temperature1=self.span.conductor.temperature1,
-            temperature2=self.span.conductor.temperature2,
-            resistance_at_temperature1=self.span.conductor.resistance_at_temperature1,
-            resistance_at_temperature2=self.span.conductor.resistance_at_temperature2,
-        )
+        slope, intercept = self._compute_resistance_coefficients()
+        resistance = slope * conductor_temperature + intercept
 
         A = self.span.conductor.aluminium_cross_section_area
         b = self.span.conductor.constant_magnetic_effect
@@ -80,6 +387,7 @@ class ThermalModel(ABC):
             :math:`P_J~\left[\text{W}~\text{m}^{-1}\right]`. The Joule heating.
         """
         resistance = self.compute_resistance(conductor_temperature, current)
+        self._record_intermediates(resistance=resistance)
         return joule_heating.compute_joule_heating(current, resistance)
 
     @abstractmethod
@@ -162,35 +470,271 @@ class ThermalModel(ABC):
         Union[float, float64, ndarray[Any, dtype[float64]]]
             :math:`P_J + P_s - P_c - P_r~\left[\text{W}~\text{m}^{-1}\right]`. The heat balance.
         """
+        if self._stats is not None:
+            return self._compute_instrumented_heat_balance(conductor_temperature, current)
+
         P_j = self.compute_joule_heating(conductor_temperature, current)
         P_s = self.compute_solar_heating(conductor_temperature, current)
         P_c = self.compute_convective_cooling(conductor_temperature, current)
         P_r = self.compute_radiative_cooling(conductor_temperature, current)
         return P_j + P_s - P_c - P_r
 
-    def compute_info(
+    def _compute_instrumented_heat_balance(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> WattPerMeter:
+        components = {}
+        for name, compute in [
+            ("joule_heating", self.compute_joule_heating),
+            ("solar_heating", self.compute_solar_heating),
+            ("convective_cooling", self.compute_convective_cooling),
+            ("radiative_cooling", self.compute_radiative_cooling),
+        ]:
+            start_time = time.perf_counter()
+            components[name] = compute(conductor_temperature, current)
+            _record_wall_time(self._stats, name, start_time)
+
+        P_j = components["joule_heating"]
+        P_s = components["solar_heating"]
+        P_c = components["convective_cooling"]
+        P_r = components["radiative_cooling"]
+        return P_j + P_s - P_c - P_r
+
+    def compute_joule_heating_derivative(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> Tuple[WattPerMeterPerKelvin, WattPerMeterPerAmpere]:
+        r"""Compute the derivatives of the Joule heating with respect to temperature and current.
+
+        Parameters
+        ----------
+        conductor_temperature:
+            :math:`T_\text{av}~\left[^\circ\text{C}\right]`. The average conductor temperature.
+        current:
+            :math:`I~\left[\text{A}\right]`. The current.
+
+        Returns
+        -------
+        Tuple[WattPerMeterPerKelvin, WattPerMeterPerAmpere]
+            :math:`\partial P_J / \partial T~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`
+            and :math:`\partial P_J / \partial I~\left[\text{W}~\text{m}^{-1}~\text{A}^{-1}\right]`.
+        """
+        conductor = self.span.conductor
+        I = current  # noqa
+        correction_kwargs = dict(
+            current=current,
+            aluminium_cross_section_area=conductor.aluminium_cross_section_area,
+            constant_magnetic_effect=conductor.constant_magnetic_effect,
+            current_density_proportional_magnetic_effect=(
+                conductor.current_density_proportional_magnetic_effect
+            ),
+            max_relative_increase=conductor.max_magnetic_core_relative_resistance_increase,
+        )
+        ac_resistance_derivative, intercept = self._compute_resistance_coefficients()
+        ac_resistance = ac_resistance_derivative * conductor_temperature + intercept
+
+        R = self.compute_resistance(conductor_temperature, current)
+        # The magnetic core correction is linear in the uncorrected resistance
+        dR_dT = joule_heating.correct_resistance_acsr_magnetic_core_loss(
+            ac_resistance=ac_resistance_derivative, **correction_kwargs
+        )
+        dR_dI = joule_heating.compute_acsr_magnetic_core_loss_current_derivative(
+            ac_resistance=ac_resistance, **correction_kwargs
+        )
+        return I * I * dR_dT, 2 * I * R + I * I * dR_dI
+
+    def compute_convective_cooling_derivative(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> WattPerMeterPerKelvin:
+        r"""Compute the derivative of the convective cooling with respect to the temperature.
+
+        Parameters
+        ----------
+        conductor_temperature:
+            :math:`T_\text{av}~\left[^\circ\text{C}\right]`. The average conductor temperature.
+        current:
+            :math:`I~\left[\text{A}\right]`. The current.
+
+        Returns
+        -------
+        Union[float, float64, ndarray[Any, dtype[float64]]]
+            :math:`\partial P_c / \partial T~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`.
+            The derivative of the convective cooling.
+        """
+        raise NotImplementedError
+
+    def compute_radiative_cooling_derivative(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> WattPerMeterPerKelvin:
+        r"""Compute the derivative of the radiative cooling with respect to the temperature.
+
+        Parameters
+        ----------
+        conductor_temperature:
+            :math:`T_\text{av}~\left[^\circ\text{C}\right]`. The average conductor temperature.
+        current:
+            :math:`I~\left[\text{A}\right]`. The current.
+
+        Returns
+        -------
+        Union[float, float64, ndarray[Any, dtype[float64]]]
+            :math:`\partial P_r / \partial T~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]`.
+            The derivative of the radiative cooling.
+        """
+        return radiative_cooling.compute_radiative_cooling_derivative(
+            surface_temperature=conductor_temperature,
+            conductor_diameter=self.span.conductor.conductor_diameter,
+            conductor_emissivity=self.span.conductor.emissivity,
+        )
+
+    def compute_heat_balance_derivative(
         self, conductor_temperature: Celsius, current: Ampere
-    ) -> Dict[str, WattPerMeter]:
+    ) -> Tuple[WattPerMeterPerKelvin, WattPerMeterPerAmpere]:
+        r"""Compute the derivatives of the heat balance with respect to temperature and current.
+
+        The derivatives are computed analytically from the heating and cooling equations, which
+        makes it possible to, e.g., use Newton-type solvers or compute sensitivities without
+        finite differences. The solar heating does not depend on the conductor temperature or the
+        current, and only the Joule heating depends on the current. Where the heat balance is not
+        differentiable (e.g. where the model switches between natural and forced convection or
+        between rows in the Nusselt number tables), the one-sided derivative of the active branch
+        is returned.
+
+        Parameters
+        ----------
+        conductor_temperature:
+            :math:`T_\text{av}~\left[^\circ\text{C}\right]`. The average conductor temperature.
+        current:
+            :math:`I~\left[\text{A}\right]`. The current.
+
+        Returns
+        -------
+        Tuple[WattPerMeterPerKelvin, WattPerMeterPerAmpere]
+            :math:`\partial P / \partial T~\left[\text{W}~\text{m}^{-1}~\text{K}^{-1}\right]` and
+            :math:`\partial P / \partial I~\left[\text{W}~\text{m}^{-1}~\text{A}^{-1}\right]`,
+            where :math:`P = P_J + P_s - P_c - P_r` is the heat balance.
+        """
+        dP_j_dT, dP_j_dI = self.compute_joule_heating_derivative(conductor_temperature, current)
+        dP_c_dT = self.compute_convective_cooling_derivative(conductor_temperature, current)
+        dP_r_dT = self.compute_radiative_cooling_derivative(conductor_temperature, current)
+        dP_dT = dP_j_dT - dP_c_dT - dP_r_dT
+        # Broadcast to the same shape, since only the Joule heating depends on the current
+        return dP_dT, dP_j_dI + np.zeros_like(dP_dT)
+
+    def _compute_heat_balance_for_elements(
+        self,
+        conductor_temperature: Celsius,
+        current: Ampere,
+        where: Optional[npt.NDArray[np.bool_]] = None,
+    ) -> WattPerMeter:
+        """Compute the heat balance, optionally only for the elements selected by ``where``.
+
+        Used by the active-set solvers. If ``where`` is given, then ``conductor_temperature`` and
+        ``current`` contain one value per selected element and all array parameters of the model
+        are subset accordingly before the heat balance is computed.
+        """
+        if where is None:
+            return self.compute_heat_balance(conductor_temperature, current)
+        model = _take_elements(self, where)
+        return model.compute_heat_balance(conductor_temperature, current)
+
+    def _compute_out_of_bounds_masks(
+        self, conductor_temperature: Celsius, current: Ampere
+    ) -> Dict[str, BoolOrBoolArray]:
+        """Compute the masks of the elements where the equations of the model are out of bounds.
+
+        The masks are keyed by the names of the fields of
+        :py:class:`linerate.solver.SolverDiagnostics`. Models without bounds return no masks.
+        """
+        return {}
+
+    def _record_diagnostics(
+        self,
+        diagnostics: solver.SolverDiagnostics,
+        conductor_temperature: Celsius,
+        current: Ampere,
+        left: Tuple[Celsius, Ampere],
+        right: Tuple[Celsius, Ampere],
+    ) -> None:
+        """Record the diagnostics of a solve with the solution ``(conductor_temperature, current)``.
+
+        ``left`` and ``right`` are the conductor temperature and current at the ends of the search
+        interval. The bracket is only evaluated for the elements without a solution, so this costs
+        about one heat balance evaluation. The checks of the equations are disabled meanwhile, to
+        not warn or raise about the problems that are recorded.
+        """
+        shape = np.broadcast_shapes(np.shape(conductor_temperature), np.shape(current))
+        unsolved = np.broadcast_to(np.isnan(conductor_temperature) | np.isnan(current), shape)
+        invalid_bracket = np.zeros(shape, dtype=bool)
+
+        previous_validation = self._validation
+        self._validation = "never"
+        try:
+            with self.prepared():
+                if np.any(unsolved):
+                    model = _take_elements(self, unsolved)
+                    f_left = model.compute_heat_balance(*_take_elements(left, unsolved))
+                    f_right = model.compute_heat_balance(*_take_elements(right, unsolved))
+                    invalid_bracket[unsolved] = np.sign(f_left) == np.sign(f_right)
+                masks = self._compute_out_of_bounds_masks(conductor_temperature, current)
+        finally:
+            self._validation = previous_validation
+
+        diagnostics.record("invalid_bracket", invalid_bracket)
+        for name, mask in masks.items():
+            diagnostics.record(name, np.broadcast_to(mask, shape))
+
+    def compute_info(
+        self,
+        conductor_temperature: Celsius,
+        current: Ampere,
+        intermediates: bool = False,
+        structured: bool = False,
+    ) -> Union[Dict[str, FloatOrFloatArray], np.ndarray]:
         r"""Create a dictionary with the different heating and cooling effects.
 
+        All quantities are computed in a single pass: each heating and cooling effect is computed
+        once, and the terms that are independent of the temperature and current are shared (see
+        :py:meth:`prepared`). The heat balance is included, so it does not have to be computed
+        again with :py:meth:`compute_heat_balance`.
+
         Parameters
         ----------
         conductor_temperature:
             :math:`T_\text{av}~\left[^\circ\text{C}\right]`. The average conductor temperature.
         current:
             :math:`I~\left[\text{A}\right]`. The current.
+        intermediates:
+            If True, the intermediate quantities that are computed along the way are also
+            included, e.g. the resistance, the film temperature, the air properties and the
+            Reynolds and Nusselt numbers. Which quantities are available depends on the model.
+        structured:
+            If True, a NumPy structured array with one field per quantity is returned instead of
+            a dictionary. All quantities are then broadcast to the same shape.
 
         Returns
         -------
-        Dict[str, WattPerMeter]
-            A dictionary with the magnitude of the different heating and cooling effects.
+        Union[Dict[str, WattPerMeter], ndarray]
+            The magnitude of the different heating and cooling effects, the heat balance and,
+            optionally, the intermediate quantities.
         """
-        return {
-            "convective_cooling": self.compute_convective_cooling(conductor_temperature, current),
-            "radiative_cooling": self.compute_radiative_cooling(conductor_temperature, current),
-            "joule_heating": self.compute_joule_heating(conductor_temperature, current),
-            "solar_heating": self.compute_solar_heating(conductor_temperature, current),
-        }
+        T, I = conductor_temperature, current  # noqa
+        with self.prepared(), self._recording_intermediates() as recorded_intermediates:
+            info = {
+                "convective_cooling": self.compute_convective_cooling(T, I),
+                "radiative_cooling": self.compute_radiative_cooling(T, I),
+                "joule_heating": self.compute_joule_heating(T, I),
+                "solar_heating": self.compute_solar_heating(T, I),
+            }
+        info["heat_balance"] = (
+            info["joule_heating"]
+            + info["solar_heating"]
+            - info["convective_cooling"]
+            - info["radiative_cooling"]
+        )
+        if intermediates:
+            info.update(recorded_intermediates)
+        if structured:
+            return _to_structured_array(info)
+        return info
 
     def compute_steady_state_ampacity(
         self,
@@ -199,6 +743,12 @@ class ThermalModel(ABC):
         max_ampacity: Ampere = 5000,
         tolerance: float = 1.0,
         accept_invalid_values: bool = False,
+        method: str = "bisect",
+        active_set: bool = False,
+        engine: str = "numpy",
+        n_jobs: int = 1,
+        stats: Optional[solver.SolverStats] = None,
+        diagnostics: Optional[solver.SolverDiagnostics] = None,
     ) -> Ampere:
         r"""Use the bisection method to compute the steady-state thermal rating (ampacity).
 
@@ -220,22 +770,235 @@ class ThermalModel(ABC):
         accept_invalid_values:
             If True, np.nan is returned whenever the current cannot be found within the provided
             search interval. If False, a ValueError will be raised instead.
+        method:
+            The root finder to use, either ``"bisect"`` or ``"chandrupatla"``. See
+            :py:func:`linerate.solver.compute_conductor_ampacity`. Alternatively, ``"direct"``
+            solves the heat balance equation for the current in closed form, which only needs one
+            evaluation of the heating and cooling effects. This is possible since only the Joule
+            heating depends on the current. The tolerance is then not used. Models where the
+            closed form is not available fall back to ``"bisect"``.
+        active_set:
+            If True, the heat balance is only evaluated for elements that have not yet converged.
+            Only supported with ``method="bisect"``. See :py:func:`linerate.solver.bisect`.
+        engine:
+            Either ``"numpy"``, where the root finder iterates over the whole array and evaluates
+            the heat balance with NumPy, or ``"compiled"``, where a compiled kernel runs the root
+            finder for each element separately with the heat balance inlined. With the compiled
+            engine, each element stops as soon as its own bracket has converged and
+            ``active_set`` is not used. Models without a compiled kernel fall back to
+            ``"numpy"``.
+        n_jobs:
+            The number of threads to use. The span-time elements are split into ``n_jobs``
+            contiguous chunks that are solved concurrently. Both NumPy and the compiled kernels
+            release the GIL, so the chunks run on separate cores. The result is identical to the
+            result with ``n_jobs=1``. A negative value, :math:`-k`, uses
+            :math:`\text{cpu\_count} + 1 - k` threads, so ``n_jobs=-1`` uses all cores.
+        stats:
+            If given, solver statistics and the wall time of each heating and cooling effect are
+            added to it (see :py:class:`linerate.solver.SolverStats`). With the ``"compiled"``
+            engine or ``method="direct"``, only the wall time and the number of invalid and
+            NaN-valued elements are recorded. With ``n_jobs > 1``, the statistics of the chunks
+            are combined with :py:meth:`linerate.solver.SolverStats.update`.
+        diagnostics:
+            If given, the elements without a root in the search interval and the elements where
+            the equations of the model are out of bounds are recorded in it (see
+            :py:class:`linerate.solver.SolverDiagnostics`). The bounds are checked once, at the
+            solution, after the solve.
 
         Returns
         -------
         Union[float, float64, ndarray[Any, dtype[float64]]]
             :math:`I~\left[\text{A}\right]`. The thermal rating.
         """
-        I = solver.compute_conductor_ampacity(  # noqa
-            self.compute_heat_balance,
-            max_conductor_temperature=max_conductor_temperature,
-            min_ampacity=min_ampacity,
-            max_ampacity=max_ampacity,
-            tolerance=tolerance,
-            accept_invalid_values=accept_invalid_values,
-        )
+        _check_engine(engine)
+        num_workers = _get_num_workers(n_jobs)
+        if stats is None:
+            stats = self._stats
         n = self.span.num_conductors
-        return I * n
+        if num_workers > 1:
+            I = self._solve_in_chunks(  # noqa
+                functools.partial(
+                    type(self).compute_steady_state_ampacity,
+                    tolerance=tolerance,
+                    accept_invalid_values=accept_invalid_values,
+                    method=method,
+                    active_set=active_set,
+                    engine=engine,
+                ),
+                num_workers,
+                stats,
+                max_conductor_temperature,
+                min_ampacity,
+                max_ampacity,
+            )
+        else:
+            I = n * self._compute_conductor_ampacity(  # noqa
+                max_conductor_temperature=max_conductor_temperature,
+                min_ampacity=min_ampacity,
+                max_ampacity=max_ampacity,
+                tolerance=tolerance,
+                accept_invalid_values=accept_invalid_values,
+                method=method,
+                active_set=active_set,
+                engine=engine,
+                stats=stats,
+            )
+
+        if diagnostics is not None:
+            T = max_conductor_temperature
+            self._record_diagnostics(
+                diagnostics, T, I / n, left=(T, min_ampacity), right=(T, max_ampacity)
+            )
+        return I
+
+    def _compute_conductor_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        min_ampacity: Ampere,
+        max_ampacity: Ampere,
+        tolerance: float,
+        accept_invalid_values: bool,
+        method: str,
+        active_set: bool,
+        engine: str,
+        stats: Optional[solver.SolverStats],
+    ) -> Ampere:
+        """Compute the ampacity of a single conductor with the given method and engine."""
+        with self.prepared(), self.instrumented(stats):
+            if method == "direct" and self._has_closed_form_ampacity:
+                I = self._compute_direct_conductor_ampacity(  # noqa
+                    max_conductor_temperature=max_conductor_temperature,
+                    min_ampacity=min_ampacity,
+                    max_ampacity=max_ampacity,
+                    accept_invalid_values=accept_invalid_values,
+                )
+            elif engine == "compiled" and self._has_compiled_solver:
+                I = self._compute_compiled_conductor_ampacity(  # noqa
+                    max_conductor_temperature=max_conductor_temperature,
+                    min_ampacity=min_ampacity,
+                    max_ampacity=max_ampacity,
+                    tolerance=tolerance,
+                    accept_invalid_values=accept_invalid_values,
+                    method="bisect" if method == "direct" else method,
+                )
+            else:
+                I = solver.compute_conductor_ampacity(  # noqa
+                    self._compute_heat_balance_for_elements,
+                    max_conductor_temperature=max_conductor_temperature,
+                    min_ampacity=min_ampacity,
+                    max_ampacity=max_ampacity,
+                    tolerance=tolerance,
+                    accept_invalid_values=accept_invalid_values,
+                    method="bisect" if method == "direct" else method,
+                    active_set=active_set,
+                    stats=stats,
+                )
+        return I
+
+    def _compute_direct_conductor_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        min_ampacity: Ampere,
+        max_ampacity: Ampere,
+        accept_invalid_values: bool,
+    ) -> Ampere:
+        """Solve :math:`P_J(I) = P_c + P_r - P_s` for the current of a single conductor."""
+        start_time = time.perf_counter()
+        T = max_conductor_temperature
+        P_s = self.compute_solar_heating(T, min_ampacity)
+        P_c = self.compute_convective_cooling(T, min_ampacity)
+        P_r = self.compute_radiative_cooling(T, min_ampacity)
+        P_j = P_c + P_r - P_s
+
+        conductor = self.span.conductor
+        slope, intercept = self._compute_resistance_coefficients()
+        resistance = slope * T + intercept
+        I = joule_heating.compute_current_from_joule_heating(  # noqa
+            joule_heating=P_j,
+            resistance=resistance,
+            aluminium_cross_section_area=conductor.aluminium_cross_section_area,
+            constant_magnetic_effect=conductor.constant_magnetic_effect,
+            current_density_proportional_magnetic_effect=(
+                conductor.current_density_proportional_magnetic_effect
+            ),
+            max_relative_increase=conductor.max_magnetic_core_relative_resistance_increase,
+        )
+
+        # NaN-valued heating or cooling gives NaN without being invalid, like for the solvers
+        invalid_mask = (P_j < 0) | (I < min_ampacity) | (I > max_ampacity)
+        if np.any(invalid_mask) and not accept_invalid_values:
+            raise ValueError(
+                "The ampacity is outside the interval [min_ampacity, max_ampacity]. Consider "
+                "increasing the search interval."
+            )
+        I = np.where(invalid_mask, np.nan, I)  # noqa
+        if self._stats is not None:
+            solver._record_result(self._stats, I, invalid_mask, start_time)
+        return I
+
+    def _solve_in_chunks(
+        self,
+        solve: Callable[..., FloatOrFloatArray],
+        num_workers: int,
+        stats: Optional[solver.SolverStats],
+        *arguments: FloatOrFloatArray,
+    ) -> FloatOrFloatArray:
+        """Split the elements into contiguous chunks and call ``solve(model, *arguments)`` for
+        each chunk in a thread pool.
+
+        The model parameters and the arguments are subset to each chunk. Since all computations
+        are element-wise, each element is solved exactly as it would have been without chunking.
+        If ``stats`` is given, each chunk records its statistics separately, and these are added
+        to ``stats`` in order once all chunks are solved.
+        """
+        shape = np.broadcast_shapes(
+            _get_element_shape(self), *(np.shape(argument) for argument in arguments)
+        )
+        size = int(np.prod(shape))
+        if size <= 1:
+            return solve(self, *arguments, stats=stats)
+
+        chunks = []
+        for index in np.array_split(np.arange(size), min(num_workers, size)):
+            where = np.zeros(size, dtype=bool)
+            where[index] = True
+            where = where.reshape(shape)
+            model = _take_elements(self, where)
+            chunk_stats = None if stats is None else solver.SolverStats()
+            arguments_ = [solver._select(a, where) for a in arguments]
+            chunks.append((index, model, arguments_, chunk_stats))
+
+        out = np.empty(size)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            results = executor.map(lambda chunk: solve(chunk[1], *chunk[2], stats=chunk[3]), chunks)
+            for (index, _, _, chunk_stats), result in zip(chunks, results):
+                out[index] = result
+                if stats is not None:
+                    stats.update(chunk_stats)
+        return out.reshape(shape)
+
+    def _compute_compiled_conductor_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        min_ampacity: Ampere,
+        max_ampacity: Ampere,
+        tolerance: float,
+        accept_invalid_values: bool,
+        method: str,
+    ) -> Ampere:
+        """Compute the ampacity of a single conductor with a compiled per-element solver."""
+        raise NotImplementedError
+
+    def _compute_compiled_conductor_temperature(
+        self,
+        current: Ampere,
+        min_temperature: Celsius,
+        max_temperature: Celsius,
+        tolerance: float,
+        method: str,
+    ) -> Celsius:
+        """Compute the conductor temperature with a compiled per-element solver."""
+        raise NotImplementedError
 
     def compute_conductor_temperature(
         self,
@@ -243,6 +1006,12 @@ class ThermalModel(ABC):
         min_temperature: Celsius = -30,
         max_temperature: Celsius = 150,
         tolerance: float = 0.5,
+        method: str = "bisect",
+        active_set: bool = False,
+        engine: str = "numpy",
+        n_jobs: int = 1,
+        stats: Optional[solver.SolverStats] = None,
+        diagnostics: Optional[solver.SolverDiagnostics] = None,
     ) -> Celsius:
         r"""Use the bisection method to compute the steady state conductor temperature.
 
@@ -263,18 +1032,344 @@ class ThermalModel(ABC):
             temperature. The bisection iterations will stop once the numerical temperature
             uncertainty is below :math:`\Delta T`. The bisection method will run for
             :math:`\left\lceil\frac{T_\text{min} - T_\text{min}}{\Delta T}\right\rceil` iterations.
+        method:
+            The root finder to use, either ``"bisect"`` or ``"chandrupatla"``. See
+            :py:func:`linerate.solver.compute_conductor_temperature`.
+        active_set:
+            If True, the heat balance is only evaluated for elements that have not yet converged.
+            Only supported with ``method="bisect"``. See :py:func:`linerate.solver.bisect`.
+        engine:
+            Either ``"numpy"``, where the root finder iterates over the whole array and evaluates
+            the heat balance with NumPy, or ``"compiled"``, where a compiled kernel runs the root
+            finder for each element separately with the heat balance inlined. With the compiled
+            engine, each element stops as soon as its own bracket has converged and
+            ``active_set`` is not used. Models without a compiled kernel fall back to
+            ``"numpy"``.
+        n_jobs:
+            The number of threads to use. The span-time elements are split into ``n_jobs``
+            contiguous chunks that are solved concurrently. Both NumPy and the compiled kernels
+            release the GIL, so the chunks run on separate cores. The result is identical to the
+            result with ``n_jobs=1``. A negative value, :math:`-k`, uses
+            :math:`\text{cpu\_count} + 1 - k` threads, so ``n_jobs=-1`` uses all cores.
+        stats:
+            If given, solver statistics and the wall time of each heating and cooling effect are
+            added to it (see :py:class:`linerate.solver.SolverStats`). With the ``"compiled"``
+            engine or ``method="direct"``, only the wall time and the number of invalid and
+            NaN-valued elements are recorded. With ``n_jobs > 1``, the statistics of the chunks
+            are combined with :py:meth:`linerate.solver.SolverStats.update`.
+        diagnostics:
+            If given, the elements without a root in the search interval and the elements where
+            the equations of the model are out of bounds are recorded in it (see
+            :py:class:`linerate.solver.SolverDiagnostics`). The bounds are checked once, at the
+            solution, after the solve.
 
         Returns
         -------
         Union[float, float64, ndarray[Any, dtype[float64]]]
             :math:`I~\left[\text{A}\right]`. The thermal rating.
         """
+        _check_engine(engine)
+        num_workers = _get_num_workers(n_jobs)
+        if stats is None:
+            stats = self._stats
         n = self.span.num_conductors
-        T = solver.compute_conductor_temperature(
-            self.compute_heat_balance,
-            current=current / n,
-            min_temperature=min_temperature,
-            max_temperature=max_temperature,
-            tolerance=tolerance,
-        )
+        if num_workers > 1:
+            T = self._solve_in_chunks(
+                functools.partial(
+                    type(self).compute_conductor_temperature,
+                    tolerance=tolerance,
+                    method=method,
+                    active_set=active_set,
+                    engine=engine,
+                ),
+                num_workers,
+                stats,
+                current,
+                min_temperature,
+                max_temperature,
+            )
+        else:
+            with self.prepared(), self.instrumented(stats):
+                if engine == "compiled" and self._has_compiled_solver:
+                    T = self._compute_compiled_conductor_temperature(
+                        current=current / n,
+                        min_temperature=min_temperature,
+                        max_temperature=max_temperature,
+                        tolerance=tolerance,
+                        method=method,
+                    )
+                else:
+                    T = solver.compute_conductor_temperature(
+                        self._compute_heat_balance_for_elements,
+                        current=current / n,
+                        min_temperature=min_temperature,
+                        max_temperature=max_temperature,
+                        tolerance=tolerance,
+                        method=method,
+                        active_set=active_set,
+                        stats=stats,
+                    )
+
+        if diagnostics is not None:
+            I = current / n  # noqa
+            self._record_diagnostics(
+                diagnostics, T, I, left=(min_temperature, I), right=(max_temperature, I)
+            )
         return T
+
+    def compute_transient_conductor_temperature(
+        self,
+        initial_temperature: Celsius,
+        current: Ampere,
+        time_step: Second,
+        time_axis: int = -2,
+        num_substeps: int = 1,
+        tolerance: float = 1e-6,
+        max_iterations: int = 20,
+        accept_invalid_values: bool = False,
+    ) -> Celsius:
+        r"""Integrate the conductor temperature over a time series of currents and weather.
+
+        The transient conductor temperature is given by the heat balance
+
+        .. math::
+
+            m c \frac{dT_\text{av}}{dt} = P_J + P_s - P_c - P_r,
+
+        where :math:`m c` is the heat capacity per unit length of the conductor (see
+        :py:attr:`linerate.types.Conductor.heat_capacity`) :cite:p:`cigre601`. The equation is
+        integrated with the implicit (backward) Euler method, which is stable for any time step,
+        so the time series can be as coarse as the weather data. Each step is solved with
+        Newton's method, using :py:meth:`compute_heat_balance` and
+        :py:meth:`compute_heat_balance_derivative`.
+
+        The model parameters and the current are time series along ``time_axis``, e.g. weather
+        arrays of shape ``(num_times, num_spans)`` with the default layout of
+        :py:mod:`linerate.axes`. All spans (and other elements) are integrated at once, and each
+        time step is vectorised over all elements. The temperature at index :math:`k` is computed
+        with the weather and current at index :math:`k`, which are kept constant over the time
+        step from index :math:`k - 1` to :math:`k`.
+
+        Parameters
+        ----------
+        initial_temperature:
+            :math:`T_0~\left[^\circ\text{C}\right]`. The conductor temperature at the first index
+            along the time axis. Should broadcast against the model's arrays without the time
+            axis.
+        current:
+            :math:`I~\left[\text{A}\right]`. The current flowing through the conductor. NOTE that
+            the current is the total current for all conductors in the span. When computing the
+            temperature, the current is divided by the number of conductors.
+        time_step:
+            :math:`\Delta t~\left[\text{s}\right]`. The time between consecutive indices along the
+            time axis. Either a scalar or an array that broadcasts against the model's arrays,
+            where the value at index :math:`k` is the time from index :math:`k - 1` to :math:`k`
+            (the value at the first index is not used).
+        time_axis:
+            The axis of the model's (broadcast) arrays that corresponds to time.
+        num_substeps:
+            The number of implicit Euler steps per time step. More substeps reduce the time
+            discretisation error, which is first order in the step length.
+        tolerance:
+            :math:`\Delta T~\left[^\circ\text{C}\right]`. The Newton iterations of each step stop
+            once the temperature update is below :math:`\Delta T` for all elements.
+        max_iterations:
+            The maximum number of Newton iterations per step.
+        accept_invalid_values:
+            If True, np.nan is returned for elements where the Newton iterations do not converge,
+            e.g. due to thermal runaway, where the Joule heating increases faster with the
+            temperature than the cooling. If False, a ValueError will be raised instead.
+
+        Returns
+        -------
+        Union[float, float64, ndarray[Any, dtype[float64]]]
+            :math:`T_\text{av}~\left[^\circ\text{C}\right]`. The conductor temperature at each
+            index along the time axis, with the shape of the broadcast model arrays and current.
+        """
+        self._check_heat_capacity()
+        if num_substeps < 1:
+            raise ValueError(f"num_substeps must be a positive integer, got {num_substeps}.")
+        if max_iterations < 1:
+            raise ValueError(f"max_iterations must be a positive integer, got {max_iterations}.")
+        shape = np.broadcast_shapes(
+            _get_element_shape(self), np.shape(current), np.shape(time_step)
+        )
+        if not -len(shape) <= time_axis < len(shape):
+            raise ValueError(f"The time axis {time_axis} is out of bounds for the shape {shape}.")
+        time_axis = time_axis % len(shape)
+        current = np.asarray(current, dtype=float)
+        time_step = np.asarray(time_step, dtype=float)
+
+        out = np.empty(shape)
+        out_along_time = np.moveaxis(out, time_axis, 0)
+        out_along_time[0] = initial_temperature
+        for index in range(1, shape[time_axis]):
+            model = _take_index(self, index, time_axis, shape)
+            step_current = _take_index(current, index, time_axis, shape)
+            step_length = _take_index(time_step, index, time_axis, shape) / num_substeps
+            T = out_along_time[index - 1]  # noqa
+            with model.prepared():
+                for _ in range(num_substeps):
+                    T, converged = model._compute_implicit_euler_step(  # noqa
+                        T,
+                        step_current / model.span.num_conductors,
+                        step_length,
+                        tolerance,
+                        max_iterations,
+                    )
+                    if np.any(~converged) and not accept_invalid_values:
+                        raise ValueError(
+                            "The transient conductor temperature did not converge, either due to "
+                            "thermal runaway or too few iterations. Consider increasing "
+                            "max_iterations or num_substeps."
+                        )
+            out_along_time[index] = T
+        return out
+
+    def compute_transient_ampacity(
+        self,
+        max_conductor_temperature: Celsius,
+        initial_temperature: Celsius,
+        duration: Second,
+        min_ampacity: Ampere = 0,
+        max_ampacity: Ampere = 5000,
+        tolerance: float = 1.0,
+        num_steps: int = 30,
+        accept_invalid_values: bool = False,
+        method: str = "bisect",
+        stats: Optional[solver.SolverStats] = None,
+        step_tolerance: float = 1e-6,
+        max_iterations: int = 50,
+    ) -> Ampere:
+        r"""Compute the short-time (emergency) thermal rating.
+
+        The short-time rating is the constant current that, starting at the pre-load temperature
+        ``initial_temperature``, heats the conductor to exactly ``max_conductor_temperature`` at
+        the end of the time window ``duration``, e.g. 15 or 30 minutes. The weather is assumed
+        constant during the time window, and each element of the model's arrays (e.g. each span
+        and time) is an independent time window.
+
+        The current is found with a vectorized bracketing root finder (see
+        :py:func:`linerate.solver.compute_conductor_ampacity`). For each candidate current, the
+        conductor temperature at the end of the time window is computed with ``num_steps``
+        implicit Euler steps, like in :py:meth:`compute_transient_conductor_temperature`. Since
+        the end temperature increases with the current, the root is unique.
+
+        Parameters
+        ----------
+        max_conductor_temperature:
+            :math:`T_\text{max}~\left[^\circ\text{C}\right]`. Maximum allowed conductor temperature
+        initial_temperature:
+            :math:`T_0~\left[^\circ\text{C}\right]`. The conductor temperature at the start of
+            the time window, e.g. the steady-state temperature for the pre-load current.
+        duration:
+            :math:`t~\left[\text{s}\right]`. The length of the time window.
+        min_ampacity:
+            :math:`I_\text{min}~\left[\text{A}\right]`. Lower bound for the numerical scheme for
+            computing the ampacity
+        max_ampacity:
+            :math:`I_\text{max}~\left[\text{A}\right]`. Upper bound for the numerical scheme for
+            computing the ampacity
+        tolerance:
+            :math:`\Delta I~\left[\text{A}\right]`. The numerical accuracy of the ampacity.
+        num_steps:
+            The number of implicit Euler steps for the time window. More steps reduce the time
+            discretisation error, which is first order in the step length.
+        accept_invalid_values:
+            If True, np.nan is returned whenever the current cannot be found within the provided
+            search interval. If False, a ValueError will be raised instead.
+        method:
+            The root finder to use, either ``"bisect"`` or ``"chandrupatla"``. Since each
+            evaluation integrates the temperature over the time window, ``"chandrupatla"``, which
+            usually needs far fewer evaluations, is often much faster.
+        stats:
+            If given, solver statistics and the wall time of each heating and cooling effect are
+            added to it (see :py:class:`linerate.solver.SolverStats`).
+        step_tolerance:
+            :math:`\Delta T~\left[^\circ\text{C}\right]`. The Newton iterations of each implicit
+            Euler step stop once the temperature update is below :math:`\Delta T` for all
+            elements.
+        max_iterations:
+            The maximum number of Newton iterations per implicit Euler step. Elements where the
+            iterations do not converge, typically due to thermal runaway, are treated as if they
+            exceed the maximum temperature, so too few iterations bias the rating low.
+
+        Returns
+        -------
+        Union[float, float64, ndarray[Any, dtype[float64]]]
+            :math:`I~\left[\text{A}\right]`. The short-time thermal rating.
+        """
+        self._check_heat_capacity()
+        if num_steps < 1:
+            raise ValueError(f"num_steps must be a positive integer, got {num_steps}.")
+        if max_iterations < 1:
+            raise ValueError(f"max_iterations must be a positive integer, got {max_iterations}.")
+        root_finder = solver._get_root_finder(method)
+        if stats is None:
+            stats = self._stats
+        step_length = np.asarray(duration, dtype=float) / num_steps
+
+        def compute_temperature_excess(current: Ampere) -> Celsius:
+            T = initial_temperature  # noqa
+            # Elements where Newton's method does not converge, typically due to thermal runaway,
+            # exceed any maximum temperature
+            exceeded = False
+            for _ in range(num_steps):
+                T, converged = self._compute_implicit_euler_step(  # noqa
+                    T, current, step_length, step_tolerance, max_iterations
+                )
+                exceeded = exceeded | ~converged
+            return np.where(exceeded, np.inf, T - max_conductor_temperature)
+
+        with self.prepared(), self.instrumented(stats):
+            I = root_finder(  # noqa
+                compute_temperature_excess,
+                min_ampacity,
+                max_ampacity,
+                tolerance,
+                accept_invalid_values=accept_invalid_values,
+                stats=stats,
+            )
+        n = self.span.num_conductors
+        return I * n
+
+    def _check_heat_capacity(self) -> None:
+        if self.span.conductor.heat_capacity is None:
+            raise ValueError("The conductor heat capacity is required for transient computations.")
+
+    def _compute_implicit_euler_step(
+        self,
+        conductor_temperature: Celsius,
+        current: Ampere,
+        time_step: Second,
+        tolerance: float,
+        max_iterations: int,
+    ) -> Tuple[Celsius, BoolOrBoolArray]:
+        """Solve :math:`m c (T - T_\\text{prev}) / \\Delta t = P(T, I)` for the temperature of a
+        single conductor with Newton's method, starting at the previous temperature.
+
+        Since the Joule heating is linear in the temperature and the cooling is convex, the
+        residual is convex, and the Newton iterates approach the root from above after the first
+        iteration. If the derivative of the residual is not positive, then the Joule heating
+        increases faster with the temperature than the cooling (thermal runaway), and the element
+        is not updated further. Returns the temperature and a mask that is False for elements that
+        did not converge. NaN-valued heating or cooling gives NaN without being unconverged, like
+        for the solvers.
+        """
+        previous_T = conductor_temperature
+        heat_capacity_per_time = self.span.conductor.heat_capacity / time_step
+        T = previous_T  # noqa
+        runaway = np.zeros(np.shape(T), dtype=bool)
+        for _ in range(max_iterations):
+            P = self.compute_heat_balance(T, current)
+            dP_dT, _ = self.compute_heat_balance_derivative(T, current)
+            residual = heat_capacity_per_time * (T - previous_T) - P
+            residual_derivative = heat_capacity_per_time - dP_dT
+            runaway = runaway | (residual_derivative <= 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                update = np.where(runaway, 0.0, residual / residual_derivative)
+            T = T - update  # noqa
+            converged = ~runaway & ~(np.abs(update) > tolerance)
+            if np.all(converged | runaway):
+                break
+        return np.where(converged, T, np.nan), converged
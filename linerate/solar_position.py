@@ -0,0 +1,177 @@
+r"""Cache for the position of the sun.
+
+The solar heating of all models depends on the position of the sun, which only depends on the
+time and the location of the span, not on the conductor or the weather. With many spans, models
+and evaluations, the same solar positions are therefore computed again and again. The
+:py:class:`SolarPositionCache` stores the solar positions, so they are computed once and shared
+between models:
+
+>>> import numpy as np
+>>> from linerate.solar_position import SolarPositionCache
+>>> cache = SolarPositionCache(resolution=0.01)
+>>> time = np.datetime64("2024-06-01T12:00")
+>>> latitude, longitude = np.array([59.911, 59.912, 63.43]), np.array([10.752, 10.753, 10.39])
+>>> sin_solar_altitude, solar_azimuth = cache.compute_solar_position(time, latitude, longitude)
+>>> cache.compute_solar_position(time, latitude.copy(), longitude)[0] is sin_solar_altitude
+True
+>>> cache.hits, cache.misses
+(1, 1)
+
+All thermal models use :py:data:`default_cache`, which uses the exact span locations.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple, Union
+
+import numpy as np
+
+from linerate.equations import solar_angles
+from linerate.types import TimeIndex
+from linerate.units import Date, Degrees, Radian, Unitless
+
+__all__ = ["SolarPositionCache", "default_cache"]
+
+
+def _get_array_key(value: np.ndarray) -> Hashable:
+    data = np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+    return value.dtype.str, value.shape, hashlib.blake2b(data).digest()
+
+
+def _get_time_key(when: Union[np.ndarray, TimeIndex]) -> Hashable:
+    if isinstance(when, TimeIndex):
+        day_of_year = np.asarray(when.day_of_year, dtype=float)
+        hour_of_day = np.asarray(when.hour_of_day, dtype=float)
+        return TimeIndex, _get_array_key(day_of_year), _get_array_key(hour_of_day)
+    return _get_array_key(when)
+
+
+class SolarPositionCache:
+    r"""Least recently used (LRU) cache of solar positions.
+
+    Each cache entry contains the solar positions for one combination of time and location
+    arrays, e.g. for all spans of a fleet at all times of a forecast. The entries are keyed by the
+    contents of the arrays, so models of the same spans and times share entries, also if the
+    arrays are different objects. Within an entry, spans with the same (quantized) location
+    share the computation of the solar position, if the locations are one-dimensional (e.g.
+    the spans of a :py:class:`linerate.types.SpanArray`) and the times are constant along the
+    span axis (e.g. have shape ``(num_times, 1)``).
+
+    Parameters
+    ----------
+    max_bytes:
+        The maximum total size of the cached arrays. The least recently used entries are evicted
+        when the cache is full. If zero, nothing is cached.
+    resolution:
+        :math:`\left[^\circ\right]`. If given, the latitudes and longitudes are rounded to a
+        multiple of ``resolution`` before the solar position is computed, so nearby spans share
+        the solar position. E.g. a resolution of :math:`0.01^\circ` changes the hour angle by at
+        most :math:`0.005^\circ` (about one second). If ``None``, the exact locations are used
+        and the results are identical to computing the solar position directly.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, resolution: Optional[Degrees] = None):
+        self.max_bytes = max_bytes
+        self.resolution = resolution
+        #: The number of lookups that were found in the cache.
+        self.hits = 0
+        #: The number of lookups that were not found in the cache.
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached arrays."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit and miss counts."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def compute_solar_position(
+        self, when: Union[Date, TimeIndex], latitude: Degrees, longitude: Degrees
+    ) -> Tuple[Unitless, Radian]:
+        r"""Get the sine of the solar altitude and the solar azimuth, computing them if not cached.
+
+        See :py:func:`linerate.equations.solar_angles.compute_solar_position`. The returned arrays
+        are shared with the cache and therefore read-only.
+
+        Parameters
+        ----------
+        when:
+            The time and date, either as ``datetime64`` values or as a
+            :py:class:`linerate.types.TimeIndex`.
+        latitude:
+            :math:`Lat~\left[^\circ\right]`. The latitude of the span (center).
+        longitude:
+            :math:`\left[^\circ\right]`. The longitude of the span (center).
+
+        Returns
+        -------
+        Tuple[Union[float, float64, ndarray[Any, dtype[float64]]], ...]
+            :math:`\sin\left(H_c\right)` and :math:`Z_c~\left[\text{radian}\right]`. The sine
+            of the solar altitude and the solar azimuth.
+        """
+        if not isinstance(when, TimeIndex):
+            when = np.asarray(when)
+        latitude = np.asarray(latitude, dtype=float)
+        longitude = np.asarray(longitude, dtype=float)
+        if self.resolution is not None:
+            latitude = np.round(latitude / self.resolution) * self.resolution
+            longitude = np.round(longitude / self.resolution) * self.resolution
+
+        key = (_get_time_key(when), _get_array_key(latitude), _get_array_key(longitude))
+        with self._lock:
+            position = self._entries.get(key)
+            if position is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return position
+            self.misses += 1
+
+        position = _compute_unique_solar_position(when, latitude, longitude)
+        for array in position:
+            array.setflags(write=False)
+        nbytes = sum(array.nbytes for array in position)
+        with self._lock:
+            if key not in self._entries and nbytes <= self.max_bytes:
+                self._entries[key] = position
+                self._nbytes += nbytes
+                while self._nbytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._nbytes -= sum(array.nbytes for array in evicted)
+        return position
+
+
+def _compute_unique_solar_position(
+    when: Union[np.ndarray, TimeIndex], latitude: np.ndarray, longitude: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the solar position once per unique location, if the times are the same for all
+    locations, and otherwise for all elements."""
+    latitude, longitude = np.broadcast_arrays(latitude, longitude)
+    if latitude.ndim == 1 and (when.ndim == 0 or when.shape[-1] == 1):
+        locations, inverse = np.unique(
+            np.stack([latitude, longitude], axis=-1), axis=0, return_inverse=True
+        )
+        if len(locations) < len(latitude):
+            sin_H_c, Z_c = solar_angles.compute_solar_position(
+                when, locations[:, 0], locations[:, 1]
+            )
+            return sin_H_c[..., inverse.ravel()], Z_c[..., inverse.ravel()]
+
+    sin_H_c, Z_c = solar_angles.compute_solar_position(when, latitude, longitude)
+    return np.asarray(sin_H_c, dtype=float), np.asarray(Z_c, dtype=float)
+
+
+#: The cache used by the thermal models.
+default_cache = SolarPositionCache()
@@ -1,11 +1,201 @@
+import dataclasses
+import functools
+import time
+import tracemalloc
+from dataclasses import dataclass, field
 from functools import partial
-from typing import Callable
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 import numpy as np
+import numpy.typing as npt
 
 from .units import Ampere, Celsius, FloatOrFloatArray, WattPerMeter
 
-__all__ = ["bisect", "compute_conductor_temperature", "compute_conductor_ampacity"]
+__all__ = [
+    "BisectWorkspace",
+    "SolverDiagnostics",
+    "SolverStats",
+    "bisect",
+    "chandrupatla",
+    "compute_conductor_temperature",
+    "compute_conductor_ampacity",
+]
+
+
+@dataclass
+class SolverStats:
+    """Counters and timings collected by the solvers.
+
+    Instrumentation is opt-in: pass an instance as the ``stats`` argument of a solver (e.g.
+    :py:func:`bisect`, :py:func:`compute_conductor_ampacity` or
+    :py:meth:`linerate.model.ThermalModel.compute_steady_state_ampacity`) and it is updated in
+    place. The same instance can be passed to several solves to accumulate statistics. When no
+    instance is passed, nothing is recorded.
+    """
+
+    #: Number of root finding iterations.
+    iterations: int = 0
+    #: Number of calls to the function whose roots we wish to find (e.g. the heat balance).
+    function_evaluations: int = 0
+    #: Total number of elements evaluated over all function calls.
+    evaluated_elements: int = 0
+    #: Number of elements without a root in the search interval.
+    invalid_elements: int = 0
+    #: Number of elements where the function returned NaN.
+    nan_elements: int = 0
+    #: Wall time in seconds spent in the solvers.
+    wall_time: float = 0.0
+    #: Peak memory in bytes allocated during a solve, relative to the memory allocated when the
+    #: solve started. Only recorded if :py:mod:`tracemalloc` is tracing memory allocations, which
+    #: also includes NumPy arrays. Note that recording the peak memory resets the
+    #: :py:mod:`tracemalloc` peak.
+    peak_memory: int = 0
+    #: Wall time in seconds spent in each heating and cooling effect, keyed by the names used in
+    #: :py:meth:`linerate.model.ThermalModel.compute_info`. Only recorded by the thermal models.
+    component_wall_time: Dict[str, float] = field(default_factory=dict)
+
+    def update(self, other: "SolverStats") -> None:
+        """Add the statistics of a solve that ran concurrently with this one.
+
+        All counters and timings are summed, except the number of iterations and the peak memory,
+        which are the maximum of the two.
+        """
+        self.iterations = max(self.iterations, other.iterations)
+        self.function_evaluations += other.function_evaluations
+        self.evaluated_elements += other.evaluated_elements
+        self.invalid_elements += other.invalid_elements
+        self.nan_elements += other.nan_elements
+        self.wall_time += other.wall_time
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+        for key, value in other.component_wall_time.items():
+            self.component_wall_time[key] = self.component_wall_time.get(key, 0.0) + value
+
+
+@dataclass
+class SolverDiagnostics:
+    """Per-element flags for the problems found in a solve.
+
+    The equations of some thermal models are only valid within bounds, e.g. the Nusselt number
+    correlations of :cite:p:`cigre601` and :cite:p:`cigre207`, and they warn or raise when their
+    inputs are out of bounds. For batch jobs, it is often more useful to know *which* elements are
+    problematic. Pass an instance as the ``diagnostics`` argument of
+    :py:meth:`linerate.model.ThermalModel.compute_steady_state_ampacity` or
+    :py:meth:`linerate.model.ThermalModel.compute_conductor_temperature`, and the checks are
+    evaluated once, at the solution, and stored as boolean masks with the shape of the result.
+    Combined with :py:attr:`linerate.model.ThermalModel.validation` set to ``"once"`` or
+    ``"never"``, the solver iterations are free of checks and the problems are reported once.
+
+    Each mask is ``None`` until it is recorded, e.g. models without inclination bounds never
+    record :py:attr:`inclination_out_of_bounds`. If the same instance is passed to several
+    solves of the same shape, the masks of the solves are combined with logical or.
+    """
+
+    #: Elements without a root in the search interval, i.e. where the heat balance has the same
+    #: sign at both ends of the interval.
+    invalid_bracket: Optional[np.ndarray] = None
+    #: Elements where the Reynolds number is outside the range of the forced convection Nusselt
+    #: number correlation.
+    reynolds_number_out_of_bounds: Optional[np.ndarray] = None
+    #: Elements where :math:`\text{Gr}\text{Pr}` is outside the range of the natural convection
+    #: Nusselt number correlation.
+    grashof_prandtl_product_out_of_bounds: Optional[np.ndarray] = None
+    #: Elements where the conductor inclination is outside the range of the inclination
+    #: correction of the natural convection Nusselt number.
+    inclination_out_of_bounds: Optional[np.ndarray] = None
+
+    def record(self, name: str, mask: npt.ArrayLike) -> None:
+        """Combine ``mask`` with the mask called ``name`` with logical or."""
+        if name not in {item.name for item in dataclasses.fields(self)}:
+            raise ValueError(f"Unknown diagnostic {name!r}.")
+        previous = getattr(self, name)
+        mask = np.asarray(mask, dtype=bool)
+        setattr(self, name, mask.copy() if previous is None else previous | mask)
+
+    def counts(self) -> Dict[str, int]:
+        """The number of flagged elements for each recorded mask."""
+        return {
+            item.name: int(np.count_nonzero(getattr(self, item.name)))
+            for item in dataclasses.fields(self)
+            if getattr(self, item.name) is not None
+        }
+
+    def report(self) -> str:
+        """A summary with one line per recorded mask, e.g. for logging after a batch job."""
+        lines = []
+        for name, count in self.counts().items():
+            size = np.size(getattr(self, name))
+            lines.append(f"{name}: {count} of {size} elements")
+        return "\n".join(lines)
+
+
+def _count_evaluations(f: Callable[..., FloatOrFloatArray], stats: SolverStats):
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        value = f(*args, **kwargs)
+        stats.function_evaluations += 1
+        stats.evaluated_elements += int(np.size(value))
+        return value
+
+    return wrapper
+
+
+def _start_memory_recording() -> Optional[int]:
+    """Reset the :py:mod:`tracemalloc` peak and return the currently traced memory, if tracing."""
+    if not tracemalloc.is_tracing():
+        return None
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _record_result(
+    stats: SolverStats,
+    out: FloatOrFloatArray,
+    invalid_mask: npt.ArrayLike,
+    start_time: float,
+    start_memory: Optional[int] = None,
+) -> None:
+    """Record the number of invalid and NaN-valued elements, the wall time and the peak memory of
+    a solve."""
+    if start_memory is not None and tracemalloc.is_tracing():
+        peak_memory = tracemalloc.get_traced_memory()[1] - start_memory
+        stats.peak_memory = max(stats.peak_memory, peak_memory)
+    num_invalid = int(np.count_nonzero(np.broadcast_to(invalid_mask, np.shape(out))))
+    stats.invalid_elements += num_invalid
+    stats.nan_elements += int(np.count_nonzero(np.isnan(out))) - num_invalid
+    stats.wall_time += time.perf_counter() - start_time
+
+
+class BisectWorkspace:
+    r"""Preallocated buffers for the in-place bisection method.
+
+    Passing a workspace to :py:func:`bisect` avoids allocating new arrays in every bisection
+    iteration. The same workspace can be reused for several solves of the same shape, for example
+    for consecutive time steps.
+
+    Parameters
+    ----------
+    shape:
+        The shape of the problem, i.e. of :math:`f(x_\min)` broadcast with :math:`x_\min` and
+        :math:`x_\max`.
+    """
+
+    def __init__(self, shape: Sequence[int]):
+        self.shape = tuple(shape)
+        self.x_left = np.empty(self.shape)
+        self.x_right = np.empty(self.shape)
+        self.x_mid = np.empty(self.shape)
+        self.f_left = np.empty(self.shape)
+        self.product = np.empty(self.shape)
+        self.mask = np.empty(self.shape, dtype=bool)
+        self.nan_mask = np.empty(self.shape, dtype=bool)
+        self.right_nan_mask = np.empty(self.shape, dtype=bool)
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the buffers in bytes."""
+        return sum(
+            buffer.nbytes for buffer in vars(self).values() if isinstance(buffer, np.ndarray)
+        )
 
 
 def bisect(
@@ -14,9 +204,20 @@ def bisect(
     xmax: FloatOrFloatArray,
     tolerance: float,
     accept_invalid_values: bool = False,
+    active_set: bool = False,
+    stats: Optional[SolverStats] = None,
+    in_place: bool = False,
+    workspace: Optional[BisectWorkspace] = None,
 ) -> FloatOrFloatArray:
     r"""Compute the roots of a function using a vectorized bisection method.
 
+    By default, all elements are bisected until the widest bracket has converged, and :math:`f`
+    is evaluated for all elements in every iteration. With ``active_set=True``, each element
+    instead stops as soon as its own bracket has converged, and elements that have converged, are
+    invalid or have NaN-valued :math:`f` are removed from the working set. Then, :math:`f` is only
+    evaluated for the remaining (active) elements, and the results are scattered back into the
+    full output array. For brackets of equal width, the two modes give identical results.
+
     Parameters
     ----------
     f:
@@ -36,6 +237,26 @@ def bisect(
         If True, np.nan is returned whenever
         :math:`\text{sign}(f(\mathbf{x}_\min)) = \text{sign}(f(\mathbf{x}_\max))`
         If False, a ValueError will be raised.
+    active_set:
+        If True, use per-element convergence and only evaluate :math:`f` for the active elements.
+        In that case, :math:`f` is first called as ``f(xmin)`` and ``f(xmax)`` to evaluate the
+        full bracket, and then as ``f(x, where)``, where ``where`` is a boolean array with the
+        shape of the full problem and ``x`` is a one-dimensional array with one value for each
+        ``True`` element of ``where`` (in C-order). ``f(x, where)`` must return the function value
+        for these elements only, for example by evaluating :math:`f` with all other parameters
+        indexed by ``where``.
+    stats:
+        If given, the number of iterations, function evaluations and evaluated elements, the
+        number of invalid and NaN-valued elements, the wall time and the peak memory are added to
+        ``stats``.
+    in_place:
+        If True, the brackets are updated in place in preallocated buffers (see
+        :py:class:`BisectWorkspace`), so no arrays are allocated in the bisection iterations,
+        except by :math:`f`. The result is identical to the result with ``in_place=False``. Not
+        supported with ``active_set=True``.
+    workspace:
+        Buffers to use with ``in_place=True``. If given, ``in_place`` is implied, and if not
+        given, a workspace is allocated for this solve. The shape must match the problem shape.
 
     Returns
     -------
@@ -44,11 +265,33 @@ def bisect(
         there is a root :math:`x_i \in [\tilde{x}_i - 0.5 \Delta x, \tilde{x}_i + 0.5 \Delta x]`
         so :math:`f_i(x_i) = 0`.
     """
+    in_place = in_place or workspace is not None
+    if in_place and active_set:
+        raise ValueError("in_place=True is not supported with active_set=True.")
+    args = (tolerance, accept_invalid_values, active_set, in_place, workspace)
+    if stats is None:
+        return _bisect(f, xmin, xmax, *args, None)[0]
+
+    start_time = time.perf_counter()
+    start_memory = _start_memory_recording()
+    f = _count_evaluations(f, stats)
+    out, invalid_mask = _bisect(f, xmin, xmax, *args, stats)
+    _record_result(stats, out, invalid_mask, start_time, start_memory)
+    return out
+
+
+def _bisect(
+    f, xmin, xmax, tolerance, accept_invalid_values, active_set, in_place, workspace, stats
+):
     _invalid_value = np.nan
 
     if not np.all(np.isfinite(xmin)) or not np.all(np.isfinite(xmax)):
         raise ValueError("xmin and xmax must be finite.")
     interval = np.max(np.abs(xmax - xmin))
+    if in_place:
+        return _bisect_in_place(
+            f, xmin, xmax, interval, tolerance, accept_invalid_values, workspace, stats
+        )
 
     f_left = f(xmin)
     f_right = f(xmax)
@@ -59,13 +302,21 @@ def bisect(
             "f(xmin) and f(xmax) have the same sign. Consider increasing the search interval."
         )
     elif isinstance(invalid_mask, bool) and invalid_mask:
-        return _invalid_value
+        return _invalid_value, invalid_mask
 
     nan_mask = np.isnan(f_left) | np.isnan(f_right)
+    if active_set:
+        out, nan_mask = _bisect_active_set(
+            f, xmin, xmax, f_left, tolerance, skip=invalid_mask | nan_mask, stats=stats
+        )
+        out = np.where(invalid_mask, _invalid_value, out)
+        return np.where(nan_mask, np.nan, out), invalid_mask
     while interval > tolerance and not np.all(nan_mask):
         xmid = 0.5 * (xmax + xmin)
         interval *= 0.5
         f_mid = f(xmid)
+        if stats is not None:
+            stats.iterations += 1
 
         mask = f_mid * f_left > 0  # fast way to check sign(f_mid) == sign(f_left)
         xmin = np.where(mask, xmid, xmin)
@@ -77,17 +328,284 @@ def bisect(
 
     out = np.where(invalid_mask, _invalid_value, 0.5 * (xmax + xmin))
     out = np.where(nan_mask, np.nan, out)
+    return out, invalid_mask
+
+
+def _bisect_in_place(
+    f: Callable[[FloatOrFloatArray], FloatOrFloatArray],
+    xmin: FloatOrFloatArray,
+    xmax: FloatOrFloatArray,
+    interval: float,
+    tolerance: float,
+    accept_invalid_values: bool,
+    workspace: Optional[BisectWorkspace],
+    stats: Optional[SolverStats],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    r"""Same iterations as in :py:func:`bisect`, but with all arrays updated in place.
+
+    Only :math:`f(x_\min)` is stored for the left end point. For the right end point, it is
+    sufficient to know whether :math:`f(x_\max)` is NaN, since NaN-valued left end points are
+    never moved.
+    """
+    f_left = f(xmin)
+    shape = np.broadcast_shapes(np.shape(xmin), np.shape(xmax), np.shape(f_left))
+    if workspace is None:
+        workspace = BisectWorkspace(shape)
+    elif workspace.shape != shape:
+        raise ValueError(f"The workspace shape {workspace.shape} does not match {shape}.")
+    ws = workspace
+
+    np.copyto(ws.f_left, f_left)
+    del f_left
+    f_right = f(xmax)
+    np.sign(ws.f_left, out=ws.x_mid)
+    np.sign(f_right, out=ws.product)
+    invalid_mask = np.equal(ws.x_mid, ws.product)
+    if np.any(invalid_mask) and not accept_invalid_values:
+        raise ValueError(
+            "f(xmin) and f(xmax) have the same sign. Consider increasing the search interval."
+        )
+    np.isnan(f_right, out=ws.right_nan_mask)
+    del f_right
+
+    np.copyto(ws.x_left, xmin)
+    np.copyto(ws.x_right, xmax)
+    np.logical_or(np.isnan(ws.f_left, out=ws.nan_mask), ws.right_nan_mask, out=ws.nan_mask)
+    while interval > tolerance and not np.all(ws.nan_mask):
+        np.add(ws.x_right, ws.x_left, out=ws.x_mid)
+        np.multiply(ws.x_mid, 0.5, out=ws.x_mid)
+        interval *= 0.5
+        f_mid = f(ws.x_mid)
+        if stats is not None:
+            stats.iterations += 1
+
+        # fast way to check sign(f_mid) == sign(f_left)
+        np.greater(np.multiply(f_mid, ws.f_left, out=ws.product), 0, out=ws.mask)
+        np.copyto(ws.x_left, ws.x_mid, where=ws.mask)
+        np.copyto(ws.f_left, f_mid, where=ws.mask)
+        np.logical_not(ws.mask, out=ws.mask)
+        np.copyto(ws.x_right, ws.x_mid, where=ws.mask)
+        np.copyto(ws.right_nan_mask, np.isnan(f_mid), where=ws.mask)
+        del f_mid
+
+        np.logical_or(np.isnan(ws.f_left, out=ws.nan_mask), ws.right_nan_mask, out=ws.nan_mask)
+
+    out = np.add(ws.x_right, ws.x_left, out=np.empty(shape))
+    np.multiply(out, 0.5, out=out)
+    np.copyto(out, np.nan, where=invalid_mask)
+    np.copyto(out, np.nan, where=ws.nan_mask)
+    return out, invalid_mask
+
+
+def _select(value: FloatOrFloatArray, where: npt.NDArray[np.bool_]) -> FloatOrFloatArray:
+    """Select the elements of ``value``, broadcast to ``where.shape``, where ``where`` is True."""
+    if np.ndim(value) == 0:
+        return value
+    return np.broadcast_to(value, where.shape)[where]
+
+
+def _bisect_active_set(
+    f: Callable[..., FloatOrFloatArray],
+    xmin: FloatOrFloatArray,
+    xmax: FloatOrFloatArray,
+    f_left: FloatOrFloatArray,
+    tolerance: float,
+    skip: npt.NDArray[np.bool_],
+    stats: Optional[SolverStats] = None,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    shape = np.broadcast_shapes(np.shape(xmin), np.shape(xmax), np.shape(f_left), np.shape(skip))
+    xmin = np.broadcast_to(xmin, shape).astype(float).ravel()
+    xmax = np.broadcast_to(xmax, shape).astype(float).ravel()
+    f_left = np.broadcast_to(f_left, shape).ravel()
+    nan_mask = np.broadcast_to(skip, shape).copy().ravel()
+    out = 0.5 * (xmax + xmin)
+
+    # The working set stores the (sorted) flat indices of the active elements and their brackets
+    index = np.flatnonzero(~nan_mask & (np.abs(xmax - xmin) > tolerance))
+    x_left, x_right, f_left = xmin[index], xmax[index], f_left[index]
+    where = np.zeros(out.size, dtype=bool)
+    while index.size:
+        where[:] = False
+        where[index] = True
+
+        xmid = 0.5 * (x_right + x_left)
+        f_mid = f(xmid, where.reshape(shape))
+        if stats is not None:
+            stats.iterations += 1
+
+        mask = f_mid * f_left > 0  # fast way to check sign(f_mid) == sign(f_left)
+        x_left = np.where(mask, xmid, x_left)
+        x_right = np.where(mask, x_right, xmid)
+        f_left = np.where(mask, f_mid, f_left)
+
+        is_nan = np.isnan(f_mid)
+        nan_mask[index[is_nan]] = True
+        out[index] = 0.5 * (x_right + x_left)
+
+        keep = ~is_nan & (np.abs(x_right - x_left) > tolerance)
+        index, x_left, x_right, f_left = index[keep], x_left[keep], x_right[keep], f_left[keep]
+
+    return out.reshape(shape), nan_mask.reshape(shape)
+
+
+def chandrupatla(
+    f: Callable[[FloatOrFloatArray], FloatOrFloatArray],
+    xmin: FloatOrFloatArray,
+    xmax: FloatOrFloatArray,
+    tolerance: float,
+    accept_invalid_values: bool = False,
+    stats: Optional[SolverStats] = None,
+) -> FloatOrFloatArray:
+    r"""Compute the roots of a function using a vectorized, bracket-preserving Brent-type method.
+
+    This is Chandrupatla's method :cite:p:`chandrupatla1997new`, which, like Brent's method,
+    combines inverse quadratic interpolation with bisection. Each element keeps a bracket
+    :math:`[a_i, b_i]` with :math:`\text{sign}(f_i(a_i)) \neq \text{sign}(f_i(b_i))`, and
+    inverse quadratic interpolation is only used where the last three iterates indicate that it is
+    well behaved. Otherwise, the element falls back to bisection. For smooth heat balances, the
+    method usually converges in 3-5 function evaluations instead of the
+    :math:`\left\lceil\log_2\frac{x_\max - x_\min}{\Delta x}\right\rceil` evaluations
+    required by :py:func:`bisect`.
+
+    To guarantee convergence, an element is forced to bisect whenever its bracket did not shrink
+    to at most half its size over the last two iterations, so the method never needs more than
+    about twice as many iterations as the bisection method.
+
+    Parameters
+    ----------
+    f:
+        :math:`f: \mathbb{R}^n \to \mathbb{R}^n`. Function whose roots we wish to find.
+    xmin:
+        :math:`x_\min`. Minimum value for the free parameter, :math:`\mathbf{x}`. It is required
+        that :math:`\text{sign}(f_i(x_\min)) \neq \text{sign}(f_i(x_\max))`. for all :math:`i`.
+    xmax:
+        :math:`x_\max`. Maximum value for the free parameter, :math:`\mathbf{x}`. It is required
+        that :math:`\text{sign}(f_i(x_\min)) \neq \text{sign}(f_i(x_\max))`. for all :math:`i`.
+    tolerance:
+        :math:`\Delta x`. The iterations will terminate once all :math:`x_i`-s are bounded within
+        an interval of size :math:`\Delta x` or less.
+    accept_invalid_values:
+        If True, np.nan is returned whenever
+        :math:`\text{sign}(f(\mathbf{x}_\min)) = \text{sign}(f(\mathbf{x}_\max))`
+        If False, a ValueError will be raised.
+    stats:
+        If given, the number of iterations, function evaluations and evaluated elements, the
+        number of invalid and NaN-valued elements and the wall time are added to ``stats``.
+
+    Returns
+    -------
+    Union[float, float64, ndarray[Any, dtype[float64]]]
+        :math:`\tilde{\mathbf{x}}`. Estimate for the roots of :math:`f`. For each :math:`f_i`,
+        there is a root :math:`x_i \in [\tilde{x}_i - 0.5 \Delta x, \tilde{x}_i + 0.5 \Delta x]`
+        so :math:`f_i(x_i) = 0`.
+    """
+    _invalid_value = np.nan
+    if stats is not None:
+        start_time = time.perf_counter()
+        start_memory = _start_memory_recording()
+        f = _count_evaluations(f, stats)
+
+    if not np.all(np.isfinite(xmin)) or not np.all(np.isfinite(xmax)):
+        raise ValueError("xmin and xmax must be finite.")
+
+    f_left = f(xmin)
+    f_right = f(xmax)
+
+    invalid_mask = np.sign(f_left) == np.sign(f_right)
+    if np.any(invalid_mask) and not accept_invalid_values:
+        raise ValueError(
+            "f(xmin) and f(xmax) have the same sign. Consider increasing the search interval."
+        )
+
+    shape = np.broadcast_shapes(np.shape(f_left), np.shape(f_right), np.shape(xmin), np.shape(xmax))
+    # x1 is the newest iterate, x2 is the opposite end of the bracket and x3 is the previous
+    # iterate that was discarded from the bracket.
+    x1 = np.broadcast_to(np.asarray(xmin, dtype=float), shape)
+    x2 = np.broadcast_to(np.asarray(xmax, dtype=float), shape)
+    f1 = np.broadcast_to(f_left, shape)
+    f2 = np.broadcast_to(f_right, shape)
+    x3, f3 = x2, f2
+
+    nan_mask = np.isnan(f1) | np.isnan(f2)
+    width = np.abs(x2 - x1)
+    previous_width = np.full(shape, np.inf)
+    done = invalid_mask | nan_mask | (f1 == 0) | (f2 == 0) | (width <= tolerance)
+    t = np.where(done, 0.0, 0.5)
+    while not np.all(done):
+        x = x1 + t * (x2 - x1)
+        f_x = np.broadcast_to(f(x), shape)
+        if stats is not None:
+            stats.iterations += 1
+
+        # Update the bracket of all elements that have not converged yet
+        active = ~done
+        same_sign = f_x * f1 > 0  # fast way to check sign(f_x) == sign(f1)
+        x3 = np.where(active, np.where(same_sign, x1, x2), x3)
+        f3 = np.where(active, np.where(same_sign, f1, f2), f3)
+        x2 = np.where(active & ~same_sign, x1, x2)
+        f2 = np.where(active & ~same_sign, f1, f2)
+        x1 = np.where(active, x, x1)
+        f1 = np.where(active, f_x, f1)
+
+        nan_mask = nan_mask | np.isnan(f1)
+        new_width = np.abs(x2 - x1)
+        stalled = new_width > 0.5 * previous_width
+        previous_width = width
+        width = new_width
+        done = done | nan_mask | (f1 == 0) | (width <= tolerance)
+
+        # Use inverse quadratic interpolation where it is well behaved and bisection elsewhere
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            alpha = (x3 - x1) / (x2 - x1)
+            t_interpolation = f1 / (f1 - f2) * f3 / (f3 - f2) - alpha * f1 / (f3 - f1) * f2 / (
+                f2 - f3
+            )
+            t_limit = 0.5 * tolerance / width
+        use_interpolation = (phi**2 < xi) & ((1 - phi) ** 2 < 1 - xi) & ~stalled
+        t = np.where(use_interpolation, t_interpolation, 0.5)
+        t = np.where(done, 0.0, np.clip(t, t_limit, 1 - t_limit))
+
+    out = np.where(f1 == 0, x1, np.where(f2 == 0, x2, 0.5 * (x1 + x2)))
+    out = np.where(invalid_mask, _invalid_value, out)
+    out = np.where(nan_mask, np.nan, out)
+    if stats is not None:
+        _record_result(stats, out, invalid_mask, start_time, start_memory)
     return out
 
 
+_ROOT_FINDERS = {
+    "bisect": bisect,
+    "chandrupatla": chandrupatla,
+}
+
+
+def _get_root_finder(method: str) -> Callable[..., FloatOrFloatArray]:
+    try:
+        return _ROOT_FINDERS[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown root finding method {method!r}, must be one of {list(_ROOT_FINDERS)}."
+        ) from None
+
+
+def _check_active_set(method: str, active_set: bool) -> None:
+    if active_set and method != "bisect":
+        raise ValueError(f"active_set=True is only supported with method='bisect', not {method!r}.")
+
+
 def compute_conductor_temperature(
     heat_balance: Callable[[Celsius, Ampere], WattPerMeter],
     current: Ampere,
     min_temperature: Celsius = -30,
     max_temperature: Celsius = 150,
     tolerance: float = 0.5,  # Celsius
+    method: str = "bisect",
+    active_set: bool = False,
+    stats: Optional[SolverStats] = None,
 ) -> Celsius:
-    r"""Use the bisection method to compute the steady state conductor temperature.
+    r"""Use a bracketing root finder to compute the steady state conductor temperature.
 
     Parameters
     ----------
@@ -108,15 +626,34 @@ def compute_conductor_temperature(
         temperature. The bisection iterations will stop once the numerical temperature
         uncertainty is below :math:`\Delta T`. The bisection method will run for
         :math:`\left\lceil\frac{T_\text{min} - T_\text{min}}{\Delta T}\right\rceil` iterations.
+    method:
+        The root finder to use, either ``"bisect"`` (:py:func:`bisect`) or ``"chandrupatla"``
+        (:py:func:`chandrupatla`), which usually needs far fewer heat balance evaluations.
+    active_set:
+        If True, converged elements are removed from the bisection working set (see
+        :py:func:`bisect`). The heat balance is then also called as ``heat_balance(T, I, where)``,
+        where ``T`` and ``I`` only contain the elements selected by the boolean mask ``where``.
+        Only supported with ``method="bisect"``.
+    stats:
+        If given, solver statistics are added to it (see :py:class:`SolverStats`).
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`I~\left[\text{A}\right]`. The thermal rating.
     """
-    f = partial(heat_balance, current=current)
+    root_finder = _get_root_finder(method)
+    _check_active_set(method, active_set)
+    if not active_set:
+        f = partial(heat_balance, current=current)
+        return root_finder(f, min_temperature, max_temperature, tolerance, stats=stats)
+
+    def f(temperature, where=None):
+        if where is None:
+            return heat_balance(temperature, current)
+        return heat_balance(temperature, _select(current, where), where)
 
-    return bisect(f, min_temperature, max_temperature, tolerance)
+    return bisect(f, min_temperature, max_temperature, tolerance, active_set=True, stats=stats)
 
 
 def compute_conductor_ampacity(
@@ -126,8 +663,11 @@ def compute_conductor_ampacity(
     max_ampacity: Ampere = 5_000,
     tolerance: float = 1,  # Ampere
     accept_invalid_values: bool = False,
+    method: str = "bisect",
+    active_set: bool = False,
+    stats: Optional[SolverStats] = None,
 ) -> Ampere:
-    r"""Use the bisection method to compute the steady-state thermal rating (ampacity).
+    r"""Use a bracketing root finder to compute the steady-state thermal rating (ampacity).
 
     Parameters
     ----------
@@ -151,14 +691,46 @@ def compute_conductor_ampacity(
     accept_invalid_values:
         If True, np.nan is returned whenever the current cannot be found within the provided
         search interval. If False, a ValueError will be raised instead.
+    method:
+        The root finder to use, either ``"bisect"`` (:py:func:`bisect`) or ``"chandrupatla"``
+        (:py:func:`chandrupatla`), which usually needs far fewer heat balance evaluations.
+    active_set:
+        If True, converged elements are removed from the bisection working set (see
+        :py:func:`bisect`). The heat balance is then also called as ``heat_balance(T, I, where)``,
+        where ``T`` and ``I`` only contain the elements selected by the boolean mask ``where``.
+        Only supported with ``method="bisect"``.
+    stats:
+        If given, solver statistics are added to it (see :py:class:`SolverStats`).
 
     Returns
     -------
     Union[float, float64, ndarray[Any, dtype[float64]]]
         :math:`I~\left[\text{A}\right]`. The thermal rating.
     """
-    f = partial(heat_balance, max_conductor_temperature)
+    root_finder = _get_root_finder(method)
+    _check_active_set(method, active_set)
+    if not active_set:
+        f = partial(heat_balance, max_conductor_temperature)
+        return root_finder(
+            f,
+            min_ampacity,
+            max_ampacity,
+            tolerance,
+            accept_invalid_values=accept_invalid_values,
+            stats=stats,
+        )
+
+    def f(current, where=None):
+        if where is None:
+            return heat_balance(max_conductor_temperature, current)
+        return heat_balance(_select(max_conductor_temperature, where), current, where)
 
     return bisect(
-        f, min_ampacity, max_ampacity, tolerance, accept_invalid_values=accept_invalid_values
+        f,
+        min_ampacity,
+        max_ampacity,
+        tolerance,
+        accept_invalid_values=accept_invalid_values,
+        active_set=True,
+        stats=stats,
     )
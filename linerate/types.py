@@ -1,13 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass, fields, replace
 from functools import cached_property
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
 
 import numpy as np
-import pygeodesy
+import numpy.typing as npt
 
+from . import geodesy
 from .units import (
     Celsius,
+    Date,
     Degrees,
+    JoulePerMeterPerKelvin,
     Meter,
     MeterPerSecond,
     OhmPerMeter,
@@ -19,7 +22,17 @@ from .units import (
     WattPerSquareMeter,
 )
 
-__all__ = ["Conductor", "Weather", "Tower", "Span", "WeatherWithSolarRadiation"]
+__all__ = [
+    "Conductor",
+    "ConductorCatalog",
+    "CatalogConductor",
+    "Weather",
+    "Tower",
+    "Span",
+    "SpanArray",
+    "WeatherWithSolarRadiation",
+    "TimeIndex",
+]
 
 
 @dataclass(frozen=True)
@@ -74,6 +87,13 @@ class Conductor:
     #: with aluminium strands under a tension of at least 40 N :cite:p:`cigre601`.
     thermal_conductivity: Optional[WattPerMeterPerKelvin] = None
 
+    #: :math:`m c~\left[\text{J}~\text{m}^{-1}~\text{K}^{-1}\right]`. The heat capacity per unit
+    #: length of the conductor, i.e. the sum of the mass per unit length times the specific heat
+    #: capacity of each material, e.g. :math:`m_\text{Al} c_\text{Al} + m_\text{St} c_\text{St}`
+    #: for ACSR conductors :cite:p:`cigre601`. Only used for transient (dynamic) computations, see
+    #: :py:meth:`linerate.model.ThermalModel.compute_transient_conductor_temperature`.
+    heat_capacity: Optional[JoulePerMeterPerKelvin] = None
+
 
 @dataclass(frozen=True)
 class Tower:
@@ -108,6 +128,10 @@ class Span:
     #: Number of conductors in the span. 1 for simplex, 2 for duplex and 3 for triplex.
     num_conductors: Unitless
 
+    #: If True, the span length and conductor azimuth are computed on the WGS84 ellipsoid instead
+    #: of on a sphere. See :py:mod:`linerate.geodesy`.
+    ellipsoidal: bool = False
+
     @cached_property
     def latitude(self) -> Degrees:
         r""":math:`\phi~\left[^\circ\right]`. The latitude of the span midpoint."""
@@ -127,32 +151,30 @@ class Span:
         delta_y = np.abs(self.end_tower.altitude - self.start_tower.altitude)
         return np.arctan2(delta_y, self.span_length)
 
+    @cached_property
+    def _span_length_and_bearing(self) -> Tuple[Meter, Radian]:
+        # Shared by span_length and conductor_azimuth, so the geodesics are only solved once
+        return geodesy.compute_span_length_and_bearing(
+            lat1=self.start_tower.latitude,
+            lon1=self.start_tower.longitude,
+            lat2=self.end_tower.latitude,
+            lon2=self.end_tower.longitude,
+            ellipsoidal=self.ellipsoidal,
+        )
+
     @cached_property
     def conductor_azimuth(self) -> Radian:
         r""":math:`\gamma_c~\left[\text{radian}\right]`. Angle (east of north) the span is facing"""
-        bearing = np.vectorize(pygeodesy.formy.bearing)
-        return np.radians(  # type: ignore
-            bearing(
-                lat1=self.start_tower.latitude,
-                lon1=self.start_tower.longitude,
-                lat2=self.end_tower.latitude,
-                lon2=self.end_tower.longitude,
-            )
-        )
+        return self._span_length_and_bearing[1]
 
     @cached_property
     def span_length(self) -> Meter:
-        r""":math:`\left[\text{km}\right]`. The span length.
+        r""":math:`\left[\text{m}\right]`. The span length.
 
-        The span length is computed with the haversine formula (assuming spherical earth).
+        The span length is computed with the haversine formula (assuming spherical earth), or with
+        Vincenty's formula on the WGS84 ellipsoid if :py:attr:`ellipsoidal` is True.
         """
-        haversine = np.vectorize(pygeodesy.formy.haversine)
-        return haversine(  # type: ignore
-            lat1=self.start_tower.latitude,
-            lon1=self.start_tower.longitude,
-            lat2=self.end_tower.latitude,
-            lon2=self.end_tower.longitude,
-        )
+        return self._span_length_and_bearing[0]
 
     @cached_property
     def conductor_altitude(self) -> Meter:
@@ -163,6 +185,294 @@ class Span:
         return 0.5 * (self.start_tower.altitude + self.end_tower.altitude)
 
 
+#: Conductor parameters that may be ``None`` and their replacement values if only some of the
+#: spans in a :py:class:`SpanArray` specify them. The replacement values disable the correction.
+_NEUTRAL_CONDUCTOR_VALUES = {
+    "constant_magnetic_effect": 1.0,
+    "current_density_proportional_magnetic_effect": 0.0,
+}
+
+
+def _stack_column(name: str, values: Sequence) -> Optional[np.ndarray]:
+    """Stack one span parameter, keeping ``None`` if it is ``None`` for all spans."""
+    is_none = [value is None for value in values]
+    if all(is_none):
+        return None
+    if any(is_none):
+        if name not in _NEUTRAL_CONDUCTOR_VALUES:
+            raise ValueError(f"{name} must be specified for either all or none of the spans.")
+        neutral_value = _NEUTRAL_CONDUCTOR_VALUES[name]
+        values = [neutral_value if value is None else value for value in values]
+    return np.array(values, dtype=float)
+
+
+def _as_column(value, num_spans: int) -> Optional[np.ndarray]:
+    """Convert a span parameter to a contiguous float array with one element per span."""
+    if value is None:
+        return None
+    return np.ascontiguousarray(np.broadcast_to(np.asarray(value, dtype=float), (num_spans,)))
+
+
+def _get_conductor_key(conductor: Conductor) -> Tuple:
+    """Hashable key that is equal for conductors with equal parameters, also if some are NaN."""
+    return tuple("nan" if value != value else value for value in astuple(conductor))
+
+
+class ConductorCatalog:
+    """Table of conductor types.
+
+    A fleet typically has many spans but only a few conductor types. Instead of storing all
+    conductor parameters per span, the catalog stores them once per type, and the spans refer to
+    their type with an integer code (see :py:meth:`take`). Parameters that are derived from the
+    conductor parameters, like the resistance coefficients, are also computed once per type (see
+    :py:meth:`get_derived`).
+
+    Parameters
+    ----------
+    conductors:
+        The conductor types. The code of a conductor type is its index in this sequence.
+    names:
+        Optional names of the conductor types, e.g. ``"Drake"``.
+    """
+
+    def __init__(self, conductors: Sequence[Conductor], names: Optional[Sequence[str]] = None):
+        if not conductors:
+            raise ValueError("At least one conductor type is required.")
+        if names is not None and len(names) != len(conductors):
+            raise ValueError("There must be one name per conductor type.")
+        self.conductors = tuple(conductors)
+        self.names = None if names is None else tuple(names)
+        #: The parameters of all conductor types, with one array element per type.
+        self.parameters = Conductor(
+            **{
+                field.name: _stack_column(
+                    field.name, [getattr(conductor, field.name) for conductor in conductors]
+                )
+                for field in fields(Conductor)
+            }
+        )
+        self._derived: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def from_conductors(
+        cls, conductors: Sequence[Conductor]
+    ) -> Tuple["ConductorCatalog", np.ndarray]:
+        """Create a catalog of the unique conductors in a sequence of (per-span) conductors.
+
+        Returns
+        -------
+        Tuple[ConductorCatalog, ndarray[Any, dtype[intp]]]
+            The catalog and the code of each conductor in ``conductors``.
+        """
+        codes_by_key: Dict[Tuple, int] = {}
+        unique_conductors = []
+        codes = np.empty(len(conductors), dtype=np.intp)
+        for i, conductor in enumerate(conductors):
+            key = _get_conductor_key(conductor)
+            if key not in codes_by_key:
+                codes_by_key[key] = len(unique_conductors)
+                unique_conductors.append(conductor)
+            codes[i] = codes_by_key[key]
+        return cls(unique_conductors), codes
+
+    def __len__(self) -> int:
+        return len(self.conductors)
+
+    def get_codes(self, names: Union[str, Sequence[str]]) -> Union[int, np.ndarray]:
+        """Get the code(s) of the conductor type(s) with the given name(s)."""
+        if self.names is None:
+            raise ValueError("The conductor types have no names.")
+        code_by_name = {name: code for code, name in enumerate(self.names)}
+        if isinstance(names, str):
+            return code_by_name[names]
+        return np.array([code_by_name[name] for name in names], dtype=np.intp)
+
+    def take(self, codes: npt.ArrayLike) -> "CatalogConductor":
+        """Get the conductor parameters for the conductor types given by ``codes``."""
+        return CatalogConductor(self, codes)
+
+    def get_derived(self, key: Hashable, function: Callable[[Conductor], Any]) -> Any:
+        """Compute a quantity derived from the conductor parameters once per conductor type.
+
+        Parameters
+        ----------
+        key:
+            Identifies the quantity. The value is computed the first time a key is used, and
+            reused afterwards.
+        function:
+            Function that computes the quantity from :py:attr:`parameters`. It must return an
+            array, or a tuple of arrays, with one element per conductor type.
+        """
+        if key not in self._derived:
+            self._derived[key] = function(self.parameters)
+        return self._derived[key]
+
+
+_CONDUCTOR_FIELD_NAMES = frozenset(field.name for field in fields(Conductor))
+
+
+@dataclass(frozen=True)
+class CatalogConductor:
+    """The conductor parameters of spans given by codes into a :py:class:`ConductorCatalog`.
+
+    The parameters have the same names as for :py:class:`Conductor`, but they are gathered from
+    the catalog lazily, when they are first used, and cached.
+    """
+
+    #: The catalog of conductor types
+    catalog: ConductorCatalog
+    #: The conductor type of each span
+    codes: npt.NDArray[np.intp]
+
+    def __post_init__(self):
+        codes = np.asarray(self.codes, dtype=np.intp)
+        if np.any((codes < 0) | (codes >= len(self.catalog))):
+            raise ValueError(f"The codes must be between 0 and {len(self.catalog) - 1}.")
+        object.__setattr__(self, "codes", codes)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not yet gathered
+        if name not in _CONDUCTOR_FIELD_NAMES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = getattr(self.catalog.parameters, name)
+        if value is not None:
+            value = value[self.codes]
+        vars(self)[name] = value
+        return value
+
+    def gather_derived(self, key: Hashable, function: Callable[[Conductor], Any]) -> Any:
+        """Gather a quantity that is computed once per conductor type.
+
+        See :py:meth:`ConductorCatalog.get_derived` for a description of the parameters. Tuples are
+        gathered elementwise.
+        """
+        gathered_key = ("derived", key)
+        if gathered_key not in vars(self):
+            value = self.catalog.get_derived(key, function)
+            if isinstance(value, tuple):
+                value = tuple(item[self.codes] for item in value)
+            else:
+                value = value[self.codes]
+            vars(self)[gathered_key] = value
+        return vars(self)[gathered_key]
+
+
+@dataclass(frozen=True)
+class SpanArray(Span):
+    """Columnar container for many spans.
+
+    The spans are stored as a struct of arrays: each tower coordinate, altitude and conductor
+    parameter of :py:attr:`start_tower`, :py:attr:`end_tower` and :py:attr:`conductor` is a
+    contiguous one-dimensional array with one element per span, and so is
+    :py:attr:`num_conductors`. Scalar parameters are broadcast to all spans. Since a span array
+    is a :py:class:`Span`, it can be passed to all thermal models directly, and the span geometry
+    (:py:attr:`latitude`, :py:attr:`span_length`, etc.) is computed once for all spans.
+
+    Span arrays are typically created with :py:meth:`from_spans`. Other arrays used together with
+    a span array, e.g. the weather, must broadcast with the shape ``(len(span_array),)``.
+    """
+
+    def __post_init__(self):
+        is_catalog_conductor = isinstance(self.conductor, CatalogConductor)
+        objects = (self.start_tower, self.end_tower)
+        if not is_catalog_conductor:
+            objects += (self.conductor,)
+        columns = [getattr(obj, field.name) for obj in objects for field in fields(obj)]
+        if is_catalog_conductor:
+            columns.append(self.conductor.codes)
+        shapes = [np.shape(column) for column in columns if column is not None]
+        shape = np.broadcast_shapes(np.shape(self.num_conductors), *shapes)
+        if len(shape) > 1:
+            raise ValueError(f"The span parameters must be one-dimensional, got shape {shape}.")
+        num_spans = shape[0] if shape else 1
+
+        for name in ("conductor", "start_tower", "end_tower"):
+            obj = getattr(self, name)
+            if isinstance(obj, CatalogConductor):
+                codes = np.ascontiguousarray(np.broadcast_to(obj.codes, (num_spans,)))
+                obj = CatalogConductor(obj.catalog, codes)
+            else:
+                obj = replace(
+                    obj,
+                    **{f.name: _as_column(getattr(obj, f.name), num_spans) for f in fields(obj)},
+                )
+            object.__setattr__(self, name, obj)
+        object.__setattr__(self, "num_conductors", _as_column(self.num_conductors, num_spans))
+
+    @classmethod
+    def from_spans(cls, spans: Sequence[Span], use_catalog: bool = False) -> "SpanArray":
+        """Create a span array from a sequence of spans.
+
+        Conductor parameters that are ``None`` for all spans are kept as ``None``. If only some
+        spans have ``None`` for the magnetic core effects, then the correction is disabled for
+        those spans. Other parameters must be given for either all or none of the spans.
+
+        If ``use_catalog`` is True, then the unique conductors are stored in a
+        :py:class:`ConductorCatalog` and the spans store the code of their conductor type instead
+        of all the conductor parameters.
+        """
+        if not spans:
+            raise ValueError("At least one span is required.")
+
+        def stack(attribute: str):
+            objects = [getattr(span, attribute) for span in spans]
+            return replace(
+                objects[0],
+                **{
+                    field.name: _stack_column(field.name, [getattr(o, field.name) for o in objects])
+                    for field in fields(objects[0])
+                },
+            )
+
+        ellipsoidal = {span.ellipsoidal for span in spans}
+        if len(ellipsoidal) > 1:
+            raise ValueError("All spans must have the same value for ellipsoidal.")
+
+        if use_catalog:
+            catalog, codes = ConductorCatalog.from_conductors([span.conductor for span in spans])
+            conductor = catalog.take(codes)
+        else:
+            conductor = stack("conductor")
+
+        return cls(
+            conductor=conductor,
+            start_tower=stack("start_tower"),
+            end_tower=stack("end_tower"),
+            num_conductors=_stack_column("num_conductors", [span.num_conductors for span in spans]),
+            ellipsoidal=ellipsoidal.pop(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.num_conductors)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Span:
+        """Get a single span (for integer indices) or a span array (for other indices)."""
+
+        def take(obj):
+            if isinstance(obj, CatalogConductor):
+                codes = obj.codes[index]
+                if np.ndim(codes) == 0:
+                    return obj.catalog.conductors[codes]
+                return obj.catalog.take(codes)
+            return replace(
+                obj,
+                **{
+                    field.name: None if value is None else value[index]
+                    for field in fields(obj)
+                    for value in [getattr(obj, field.name)]
+                },
+            )
+
+        span_type = Span if np.ndim(self.num_conductors[index]) == 0 else SpanArray
+        return span_type(
+            conductor=take(self.conductor),
+            start_tower=take(self.start_tower),
+            end_tower=take(self.end_tower),
+            num_conductors=self.num_conductors[index],
+            ellipsoidal=self.ellipsoidal,
+        )
+
+
 @dataclass()
 class Weather:
     #: :math:`T_a~\left[^\circ C\right]`. The ambient air temperature.
@@ -194,3 +504,41 @@ class WeatherWithSolarRadiation(Weather):
                 "Both 'diffuse_radiation_intensity' and 'direct_radiation_intensity' must be provided. For weather"
                 " data without solar radiation, use the 'Weather' class instead.",
             )
+
+
+@dataclass(frozen=True)
+class TimeIndex:
+    """Container for times decomposed into the day of the year and the hour of the day.
+
+    The solar angles only depend on the time through the day of the year and the (UTC) hour of the
+    day. Decomposing ``datetime64`` arrays requires several (slow) conversions between datetime
+    units, so for long time series that are used many times, e.g. by several models, it is faster
+    to decompose them once with :py:meth:`from_datetime64`. A time index can be used instead of
+    ``datetime64`` values for the ``time`` of the thermal models and in
+    :py:mod:`linerate.equations.solar_angles`, and gives identical results.
+    """
+
+    #: :math:`N`. The day of the year, starting at 1 for January 1st.
+    day_of_year: Unitless
+    #: The UTC hour of the day, with the minutes as a fraction of an hour (e.g. 13.5 for 13:30).
+    #: Seconds are ignored.
+    hour_of_day: Unitless
+
+    @classmethod
+    def from_datetime64(cls, when: Date) -> "TimeIndex":
+        """Decompose ``datetime64`` values (interpreted as UTC)."""
+        minutes = np.asarray(when).astype("datetime64[m]")
+        days = minutes.astype("datetime64[D]")
+        day_of_year = (days - days.astype("datetime64[Y]")).astype(float) + 1
+        hour, minute = np.divmod((minutes - days).astype(np.int64), 60)
+        return cls(day_of_year=day_of_year, hour_of_day=hour.astype(float) + minute / 60)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The shape of the times."""
+        return np.broadcast_shapes(np.shape(self.day_of_year), np.shape(self.hour_of_day))
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the times."""
+        return len(self.shape)
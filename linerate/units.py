@@ -12,24 +12,34 @@ FloatOrFloatArray = Union[float, np.float64, npt.NDArray[np.float64]]
 BoolOrBoolArray = Union[bool, np.bool_, npt.NDArray[np.bool_]]
 
 OhmPerMeter = Annotated[FloatOrFloatArray, "Ω/m"]
+OhmPerMeterPerKelvin = Annotated[FloatOrFloatArray, "Ω/(m K)"]
+OhmPerMeterPerAmpere = Annotated[FloatOrFloatArray, "Ω/(m A)"]
 Ampere = Annotated[FloatOrFloatArray, "A"]
 Radian = Annotated[FloatOrFloatArray, "rad"]
 Degrees = Annotated[FloatOrFloatArray, "°"]
 Kelvin = Annotated[FloatOrFloatArray, "K"]
+PerKelvin = Annotated[FloatOrFloatArray, "1/K"]
 Celsius = Annotated[FloatOrFloatArray, "°C"]
 Meter = Annotated[FloatOrFloatArray, "m"]
 MeterPerSecond = Annotated[FloatOrFloatArray, "m/s"]
 MeterPerSquareSecond = Annotated[FloatOrFloatArray, "m/s²"]
+Second = Annotated[FloatOrFloatArray, "s"]
 SquareMeterPerAmpere = Annotated[FloatOrFloatArray, "m²/A"]
 SquareMeter = Annotated[FloatOrFloatArray, "m²"]
 Unitless = Annotated[FloatOrFloatArray, ""]
 JoulePerKilogramPerKelvin = Annotated[FloatOrFloatArray, "J/(kg K)"]
+JoulePerMeterPerKelvin = Annotated[FloatOrFloatArray, "J/(m K)"]
 WattPerSquareMeter = Annotated[FloatOrFloatArray, "W/m²"]
 WattPerMeter = Annotated[FloatOrFloatArray, "W/m"]
 WattPerMeterPerKelvin = Annotated[FloatOrFloatArray, "W/(m K)"]
 WattPerMeterPerCelsius = Annotated[FloatOrFloatArray, "W/(m °C)"]
+WattPerMeterPerSquareKelvin = Annotated[FloatOrFloatArray, "W/(m K²)"]
+WattPerMeterPerAmpere = Annotated[FloatOrFloatArray, "W/(m A)"]
 SquareMeterPerSecond = Annotated[FloatOrFloatArray, "m²/s"]
 KilogramPerMeterPerSecond = Annotated[FloatOrFloatArray, "kg/(m s)"]
+KilogramPerMeterPerSecondPerKelvin = Annotated[FloatOrFloatArray, "kg/(m s K)"]
 KilogramPerCubeMeter = Annotated[FloatOrFloatArray, "kg/m³"]
+KilogramPerCubeMeterPerKelvin = Annotated[FloatOrFloatArray, "kg/(m³ K)"]
+SquareMeterPerSecondPerKelvin = Annotated[FloatOrFloatArray, "m²/(s K)"]
 
 Date = Union[np.datetime64, npt.NDArray[np.datetime64]]
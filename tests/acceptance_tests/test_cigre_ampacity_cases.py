@@ -113,3 +113,11 @@ def test_example_b_ampacity(example_model_b):
     assert example_model_b.compute_steady_state_ampacity(100, tolerance=1e-8) == approx(
         1504, abs=1.5
     )
+
+
+@pytest.mark.parametrize("method", ["bisect", "chandrupatla"])
+def test_example_a_ampacity_with_method(example_model_1_conductors, method):
+    ampacity = example_model_1_conductors.compute_steady_state_ampacity(
+        100, tolerance=1e-8, method=method
+    )
+    assert ampacity == approx(976, abs=1.5)
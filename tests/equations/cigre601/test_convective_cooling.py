@@ -495,3 +495,30 @@ def test_compute_nusselt_number(forced_convection_nusselt_number, natural_nussel
     Nu_est = convective_cooling.compute_nusselt_number(Nu_delta, Nu_beta)
 
     assert Nu == Nu_est
+
+
+@pytest.mark.parametrize("conductor_roughness", [0, 0.03, 0.1])
+@pytest.mark.parametrize("reynolds_number", [50, 150, 1000, 3000, 10_000, 60_000])
+def test_perpendicular_flow_nusseltnumber_exponent_is_logarithmic_derivative(
+    reynolds_number, conductor_roughness
+):
+    Re = np.array([reynolds_number * 0.999, reynolds_number * 1.001])
+    Nu = convective_cooling.compute_perpendicular_flow_nusseltnumber(Re, conductor_roughness)
+    n = convective_cooling.compute_perpendicular_flow_nusseltnumber_exponent(
+        reynolds_number, conductor_roughness
+    )
+    if Nu[0] == 0:
+        assert n == 0
+    else:
+        assert n == approx(np.diff(np.log(Nu))[0] / np.diff(np.log(Re))[0])
+
+
+@pytest.mark.parametrize("grashof_number", [0.01, 1, 1e3, 1e5, 1e9])
+def test_horizontal_natural_nusselt_number_exponent_is_logarithmic_derivative(grashof_number):
+    Gr = np.array([grashof_number * 0.999, grashof_number * 1.001])
+    Nu = convective_cooling.compute_horizontal_natural_nusselt_number(Gr, 1)
+    m = convective_cooling.compute_horizontal_natural_nusselt_number_exponent(grashof_number, 1)
+    if Nu[0] == 0:
+        assert m == 0
+    else:
+        assert m == approx(np.diff(np.log(Nu))[0] / np.diff(np.log(Gr))[0])
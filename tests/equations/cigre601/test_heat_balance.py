@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+import linerate.equations.cigre601.convective_cooling as convective_cooling
+from linerate.equations import dimensionless, joule_heating, radiative_cooling
+from linerate.equations.cigre601 import heat_balance
+
+
+@pytest.mark.parametrize("current_density_proportional_magnetic_effect", [0.0, 4e-8])
+def test_fused_heat_balance_matches_equations(rng, current_density_proportional_magnetic_effect):
+    n = 1000
+    T_s = rng.uniform(-20, 150, n)
+    I = rng.uniform(0, 3000, n)  # noqa
+    T_a = rng.uniform(-20, 40, n)
+    V = rng.uniform(0, 10, n)
+    y = rng.uniform(0, 1000, n)
+    P_s = rng.uniform(0, 20, n)
+    delta = rng.uniform(0, 0.5 * np.pi, n)
+    beta = np.radians(10)
+    D, d = 28.1e-3, 4.4e-3
+    A, b, m, c_max = 4e-4, 1.0, current_density_proportional_magnetic_effect, 1.06
+    max_Re = 4000
+
+    Rs = dimensionless.compute_conductor_roughness(D, d)
+    wind_direction_correction_factor = (
+        convective_cooling.correct_wind_direction_effect_on_nusselt_number(1.0, delta, Rs)
+    )
+    inclination_correction_factor = convective_cooling.correct_natural_nusselt_number_inclination(
+        1.0, beta, Rs
+    )
+
+    T_f = 0.5 * (T_s + T_a)
+    lambda_f = convective_cooling.compute_thermal_conductivity_of_air(T_f)
+    mu_f = convective_cooling.compute_dynamic_viscosity_of_air(T_f)
+    gamma_f = convective_cooling.compute_air_density(T_f, y)
+    nu_f = convective_cooling.compute_kinematic_viscosity_of_air(mu_f, gamma_f)
+    Re = np.minimum(dimensionless.compute_reynolds_number(V, D, nu_f), max_Re)
+    Gr = dimensionless.compute_grashof_number(D, T_s, T_a, nu_f)
+    Pr = dimensionless.compute_prandtl_number(lambda_f, mu_f, 1005)
+    Nu_delta = wind_direction_correction_factor * (
+        convective_cooling.compute_perpendicular_flow_nusseltnumber(Re, Rs)
+    )
+    Nu_beta = inclination_correction_factor * (
+        convective_cooling.compute_horizontal_natural_nusselt_number(Gr, Pr)
+    )
+    Nu = convective_cooling.compute_nusselt_number(Nu_delta, Nu_beta)
+    P_c = np.pi * lambda_f * (T_s - T_a) * Nu
+    P_r = radiative_cooling.compute_radiative_cooling(T_s, T_a, D, 0.8)
+    R = joule_heating.correct_resistance_acsr_magnetic_core_loss(
+        joule_heating.compute_resistance(T_s, 25, 75, 7.283e-5, 8.688e-5), I, A, b, m, c_max
+    )
+    P_j = joule_heating.compute_joule_heating(I, R)
+    expected = P_j + P_s - P_c - P_r
+
+    fused = heat_balance.compute_heat_balance(
+        conductor_temperature=T_s,
+        current=I,
+        air_temperature=T_a,
+        wind_speed=V,
+        height_above_sea_level=y,
+        conductor_diameter=D,
+        conductor_roughness=Rs,
+        max_reynolds_number=max_Re,
+        wind_direction_correction_factor=wind_direction_correction_factor,
+        inclination_correction_factor=inclination_correction_factor,
+        solar_heating=P_s,
+        conductor_emissivity=0.8,
+        temperature1=25,
+        temperature2=75,
+        resistance_at_temperature1=7.283e-5,
+        resistance_at_temperature2=8.688e-5,
+        aluminium_cross_section_area=A,
+        constant_magnetic_effect=b,
+        current_density_proportional_magnetic_effect=m,
+        max_relative_increase=c_max,
+    )
+    assert fused.shape == expected.shape
+    np.testing.assert_allclose(fused, expected, rtol=1e-12, atol=1e-10)
+
+
+def test_fused_heat_balance_propagates_nan():
+    kwargs = dict(
+        wind_speed=1.0,
+        height_above_sea_level=0.0,
+        conductor_diameter=28.1e-3,
+        conductor_roughness=0.1,
+        max_reynolds_number=4000,
+        wind_direction_correction_factor=1.0,
+        inclination_correction_factor=1.0,
+        solar_heating=10.0,
+        conductor_emissivity=0.8,
+        temperature1=25,
+        temperature2=75,
+        resistance_at_temperature1=7.283e-5,
+        resistance_at_temperature2=8.688e-5,
+        aluminium_cross_section_area=4e-4,
+        constant_magnetic_effect=1,
+        current_density_proportional_magnetic_effect=0,
+        max_relative_increase=np.inf,
+    )
+    assert np.isnan(heat_balance.compute_heat_balance(np.nan, 1000.0, 20.0, **kwargs))
+    assert np.isnan(heat_balance.compute_heat_balance(80.0, 1000.0, np.nan, **kwargs))
+    assert np.isfinite(heat_balance.compute_heat_balance(80.0, 1000.0, 20.0, **kwargs))
@@ -5,6 +5,7 @@ from pytest import approx
 from scipy.interpolate import lagrange
 
 import linerate.equations.ieee738.convective_cooling as convective_cooling
+from linerate.equations import dimensionless
 
 
 @hypothesis.given(
@@ -280,3 +281,31 @@ def test_natural_convection_with_example():
     assert convective_cooling.compute_natural_convection(rho_f, D_0, T_s, T_a) == approx(
         1030.96168697
     )
+
+
+def test_fused_convective_cooling_matches_equations(rng):
+    T_s = rng.uniform(-20, 150, (50, 1))
+    T_a = rng.uniform(-20, 40, (50, 1))
+    V = rng.uniform(0, 20, 40)
+    H_e = rng.uniform(0, 2000, 40)
+    D_0 = 0.0281
+    K_angle = convective_cooling.compute_wind_direction_factor(rng.uniform(0, np.pi, 40))
+    max_reynolds_number = 20_000
+
+    T_film = convective_cooling.compute_air_temperature_at_boundary_layer(T_s, T_a)
+    mu_f = convective_cooling.compute_dynamic_viscosity_of_air(T_film)
+    rho_f = convective_cooling.compute_air_density(T_film, H_e)
+    nu_f = convective_cooling.compute_kinematic_viscosity_of_air(mu_f, rho_f)
+    k_f = convective_cooling.compute_thermal_conductivity_of_air(T_film)
+    N_Re = np.minimum(dimensionless.compute_reynolds_number(V, D_0, nu_f), max_reynolds_number)
+    expected = convective_cooling.compute_convective_cooling(
+        convective_cooling.compute_forced_convection(K_angle, N_Re, k_f, T_s, T_a),
+        convective_cooling.compute_natural_convection(rho_f, D_0, T_s, T_a),
+    )
+
+    fused = convective_cooling.compute_fused_convective_cooling(
+        T_s, T_a, V, H_e, D_0, max_reynolds_number, K_angle
+    )
+    assert fused.shape == expected.shape
+    np.testing.assert_allclose(fused, expected, rtol=1e-13, atol=1e-12)
+    np.testing.assert_array_equal(np.isnan(fused), np.isnan(expected))
@@ -0,0 +1,98 @@
+import hypothesis
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from pytest import approx
+
+from linerate.equations import air_properties
+
+
+@hypothesis.given(film_temperature=st.floats(min_value=-50, max_value=300, allow_nan=False))
+def test_cigre601_air_properties_match_equations(film_temperature):
+    T_f = film_temperature
+    y = 500
+
+    assert air_properties.compute_cigre601_thermal_conductivity_of_air(T_f) == approx(
+        2.368e-2 + 7.23e-5 * T_f - 2.763e-8 * T_f**2
+    )
+    assert air_properties.compute_cigre601_dynamic_viscosity_of_air(T_f) == approx(
+        17.239e-6 + 4.635e-8 * T_f - 2.03e-11 * T_f**2
+    )
+    assert air_properties.compute_cigre601_air_density(T_f, y) == approx(
+        (1.293 - 1.525e-4 * y + 6.379e-9 * y**2) / (1 + 0.00367 * T_f)
+    )
+
+
+@hypothesis.given(film_temperature=st.floats(min_value=-50, max_value=300, allow_nan=False))
+def test_ieee738_air_properties_match_equations(film_temperature):
+    T_film = film_temperature
+    H_e = 500
+
+    assert air_properties.compute_ieee738_thermal_conductivity_of_air(T_film) == approx(
+        2.424e-2 + 7.477e-5 * T_film - 4.407e-9 * T_film**2
+    )
+    assert air_properties.compute_ieee738_dynamic_viscosity_of_air(T_film) == approx(
+        1.458e-6 * (T_film + 273) ** 1.5 / (T_film + 383.4)
+    )
+    assert air_properties.compute_ieee738_air_density(T_film, H_e) == approx(
+        (1.293 - 1.525e-4 * H_e + 6.379e-9 * H_e**2) / (1 + 0.00367 * T_film)
+    )
+
+
+def test_cigre207_air_properties_with_example():
+    assert air_properties.compute_cigre207_thermal_conductivity_of_air(40) == approx(0.02708)
+    assert air_properties.compute_cigre207_kinematic_viscosity_of_air(40) == approx(1.70e-5)
+    assert air_properties.compute_cigre207_prandtl_number(40) == approx(0.705)
+    assert air_properties.compute_cigre207_relative_air_density(0) == approx(1)
+
+
+@pytest.mark.parametrize(
+    "compute_air_properties, compute_properties",
+    [
+        (
+            air_properties.compute_cigre601_air_properties,
+            lambda T_f, y: (
+                air_properties.compute_cigre601_thermal_conductivity_of_air(T_f),
+                air_properties.compute_cigre601_dynamic_viscosity_of_air(T_f),
+                air_properties.compute_cigre601_air_density(T_f, y),
+                air_properties.compute_cigre601_dynamic_viscosity_of_air(T_f)
+                / air_properties.compute_cigre601_air_density(T_f, y),
+                air_properties.compute_cigre601_prandtl_number(T_f),
+            ),
+        ),
+        (
+            air_properties.compute_ieee738_air_properties,
+            lambda T_f, y: (
+                air_properties.compute_ieee738_thermal_conductivity_of_air(T_f),
+                air_properties.compute_ieee738_dynamic_viscosity_of_air(T_f),
+                air_properties.compute_ieee738_air_density(T_f, y),
+                air_properties.compute_ieee738_dynamic_viscosity_of_air(T_f)
+                / air_properties.compute_ieee738_air_density(T_f, y),
+            ),
+        ),
+        (
+            lambda T_f, y: air_properties.compute_cigre207_air_properties(T_f),
+            lambda T_f, y: (
+                air_properties.compute_cigre207_thermal_conductivity_of_air(T_f),
+                air_properties.compute_cigre207_kinematic_viscosity_of_air(T_f),
+                air_properties.compute_cigre207_prandtl_number(T_f),
+            ),
+        ),
+    ],
+)
+def test_fused_air_properties_match_individual_properties(
+    rng, compute_air_properties, compute_properties
+):
+    film_temperature = rng.uniform(-20, 100, (10, 1))
+    height_above_sea_level = rng.uniform(0, 2000, 5)
+    film_temperature[0, 0] = np.nan
+
+    properties = compute_air_properties(film_temperature, height_above_sea_level)
+    expected_properties = compute_properties(film_temperature, height_above_sea_level)
+
+    assert len(properties) == len(expected_properties)
+    shape = np.broadcast_shapes(*(np.shape(value) for value in expected_properties))
+    for value, expected_value in zip(properties, expected_properties):
+        expected_value = np.broadcast_to(expected_value, shape)
+        assert value.shape == expected_value.shape
+        np.testing.assert_allclose(value, expected_value, rtol=1e-15)
@@ -1,6 +1,7 @@
 import hypothesis
 import hypothesis.strategies as st
 import numpy as np
+import pytest
 from pytest import approx
 from scipy.interpolate import lagrange
 
@@ -130,3 +131,70 @@ def test_joule_heating(current, resistance):
     R = resistance
 
     assert joule_heating.compute_joule_heating(I, R) == approx(R * (I**2))
+
+
+@hypothesis.given(
+    current=st.floats(min_value=0, max_value=1e4, allow_nan=False),
+    linear_magnetic_effect=st.sampled_from([None, 0, 1e-8, 4e-8, 1e-6]),
+)
+def test_current_from_joule_heating_inverts_joule_heating(current, linear_magnetic_effect):
+    I = current  # noqa
+    R = 7.283e-5
+    A = 4e-4
+    b = 1.01
+    m = linear_magnetic_effect
+    c_max = 1.06
+
+    R_corrected = joule_heating.correct_resistance_acsr_magnetic_core_loss(R, I, A, b, m, c_max)
+    P = joule_heating.compute_joule_heating(I, R_corrected)
+
+    current_estimate = joule_heating.compute_current_from_joule_heating(P, R, A, b, m, c_max)
+    assert current_estimate == approx(I, rel=1e-10, abs=1e-10)
+
+
+def test_current_from_joule_heating_is_nan_for_negative_joule_heating():
+    current = joule_heating.compute_current_from_joule_heating(
+        np.array([-1.0, np.nan]), 7e-5, 4e-4, 1, 4e-8, 1.06
+    )
+    assert np.all(np.isnan(current))
+
+
+def test_resistance_coefficients_give_resistance():
+    slope, intercept = joule_heating.compute_resistance_coefficients(25, 75, 7e-5, 8e-5)
+    resistance = joule_heating.compute_resistance(50, 25, 75, 7e-5, 8e-5)
+    assert slope * 50 + intercept == approx(resistance)
+
+
+def test_resistance_temperature_derivative_is_slope():
+    derivative = joule_heating.compute_resistance_temperature_derivative(25, 75, 7e-5, 8e-5)
+    assert derivative == approx(2e-7)
+
+
+@pytest.mark.parametrize("current", [0, 100, 499, 501, 1000])
+def test_acsr_magnetic_core_loss_current_derivative_matches_finite_difference(current):
+    R, A, b, m, c_max = 7e-5, 1, 1, 1e-4, 1.05  # Saturates at 500 A
+    h = 1e-3
+
+    def corrected_resistance(current):
+        return joule_heating.correct_resistance_acsr_magnetic_core_loss(R, current, A, b, m, c_max)
+
+    finite_difference = (corrected_resistance(current + h) - corrected_resistance(current - h)) / (
+        2 * h
+    )
+    derivative = joule_heating.compute_acsr_magnetic_core_loss_current_derivative(
+        R, current, A, b, m, c_max
+    )
+    assert derivative == approx(finite_difference, rel=1e-6)
+
+
+def test_acsr_magnetic_core_loss_is_elementwise_for_mixed_magnetic_effect():
+    R, I, b, c_max = 7e-5, 1000, 1, 1.05  # noqa
+    A = np.array([np.nan, 4e-4])
+    m = np.array([0, 1e-8])
+
+    R_corrected = joule_heating.correct_resistance_acsr_magnetic_core_loss(R, I, A, b, m, c_max)
+    np.testing.assert_allclose(R_corrected, [R, R * (1 + 1e-8 * I / 4e-4)])
+
+    P = joule_heating.compute_joule_heating(I, R_corrected)
+    current = joule_heating.compute_current_from_joule_heating(P, R, A, b, m, c_max)
+    np.testing.assert_allclose(current, I)
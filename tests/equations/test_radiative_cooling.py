@@ -96,3 +96,19 @@ def test_cooling_matches_cigre207_examples(surface_temperature, expected_cooling
     epsilon = 0.5
     cooling = radiative_cooling.compute_radiative_cooling(surface_temperature, T_a, D, epsilon)
     assert cooling == approx(expected_cooling, rel=2e-3)
+
+
+@hypothesis.given(surface_temperature=st.floats(allow_nan=False, min_value=-50, max_value=300))
+def test_radiative_cooling_derivative_matches_finite_difference(surface_temperature):
+    T_s = surface_temperature
+    T_a = 20
+    D = 0.03
+    epsilon = 0.8
+    h = 1e-3
+
+    finite_difference = (
+        radiative_cooling.compute_radiative_cooling(T_s + h, T_a, D, epsilon)
+        - radiative_cooling.compute_radiative_cooling(T_s - h, T_a, D, epsilon)
+    ) / (2 * h)
+    derivative = radiative_cooling.compute_radiative_cooling_derivative(T_s, D, epsilon)
+    assert derivative == approx(finite_difference, rel=1e-6)
@@ -6,6 +6,7 @@ import numpy as np
 from pytest import approx
 
 import linerate.equations.solar_angles as solar_angles
+from linerate.types import TimeIndex
 
 
 def test_get_day_of_year_with_example():
@@ -261,3 +262,33 @@ def test_compute_sin_solar_effective_incidence_angle_for_span(example_span_1_con
             0.9711465571624637,
         ]
     )
+
+
+def test_solar_position_matches_individual_angles():
+    when = np.arange("2022-06-01T00:00", "2022-06-02T00:00", 90, dtype="datetime64[m]")
+    latitude, longitude = 59.9, 10.75
+
+    sin_H_c, Z_c = solar_angles.compute_solar_position(when, latitude, longitude)
+
+    omega = solar_angles.compute_hour_angle_relative_to_noon(when, longitude)
+    delta = solar_angles.compute_solar_declination(when)
+    chi = solar_angles.compute_solar_azimuth_variable(latitude, delta, omega)
+    C = solar_angles.compute_solar_azimuth_constant(chi, omega)
+    np.testing.assert_array_equal(
+        sin_H_c, solar_angles.compute_sin_solar_altitude(latitude, delta, omega)
+    )
+    np.testing.assert_array_equal(Z_c, solar_angles.compute_solar_azimuth(C, chi))
+
+
+def test_solar_angles_with_time_index():
+    when = np.arange("2022-01-01T00:00", "2023-01-01T00:00", 37, dtype="datetime64[m]")
+    time_index = TimeIndex.from_datetime64(when)
+
+    np.testing.assert_array_equal(
+        solar_angles.compute_solar_declination(time_index),
+        solar_angles.compute_solar_declination(when),
+    )
+    np.testing.assert_array_equal(
+        solar_angles.compute_hour_angle_relative_to_noon(time_index, 10.75),
+        solar_angles.compute_hour_angle_relative_to_noon(when, 10.75),
+    )
@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+import pytest
+
+import linerate
+
+NUM_ELEMENTS = 10**6
+
+
+def _get_best_time(function, repeat=3):
+    function()
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_ieee738_heat_balance_throughput_in_line_with_cigre601(
+    rng, example_span_1_conductor, backend
+):
+    weather = linerate.Weather(
+        air_temperature=rng.uniform(0, 30, NUM_ELEMENTS),
+        wind_direction=rng.uniform(0, 2 * np.pi, NUM_ELEMENTS),
+        wind_speed=rng.uniform(0, 10, NUM_ELEMENTS),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    time_of_day = np.datetime64("2016-06-10 11:00")
+    temperature = rng.uniform(40, 100, NUM_ELEMENTS)
+    cigre601 = linerate.Cigre601(example_span_1_conductor, weather, time_of_day)
+    ieee738 = linerate.IEEE738(example_span_1_conductor, weather, time_of_day, backend=backend)
+
+    with cigre601.prepared(), ieee738.prepared():
+        cigre601_time = _get_best_time(lambda: cigre601.compute_heat_balance(temperature, 1000.0))
+        ieee738_time = _get_best_time(lambda: ieee738.compute_heat_balance(temperature, 1000.0))
+
+    # A Python loop over the elements is orders of magnitude slower than this
+    assert ieee738_time < 2 * cigre601_time
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+import linerate
+
+
+@pytest.fixture
+def line_model(drake_conductor_a, rng):
+    num_times, num_spans = 24, 30
+    latitude = 50 + np.cumsum(rng.uniform(0, 0.003, num_spans + 1))
+    spans = linerate.SpanArray(
+        conductor=drake_conductor_a,
+        start_tower=linerate.Tower(latitude=latitude[:-1], longitude=10, altitude=0),
+        end_tower=linerate.Tower(latitude=latitude[1:], longitude=10.001, altitude=0),
+        num_conductors=rng.integers(1, 3, num_spans),
+    )
+    weather = linerate.Weather(
+        air_temperature=rng.uniform(0, 30, (num_times, num_spans)),
+        wind_direction=rng.uniform(0, 2 * np.pi, (num_times, num_spans)),
+        wind_speed=rng.uniform(0.5, 5, (num_times, num_spans)),
+        ground_albedo=0.1,
+    )
+    time = np.datetime64("2022-06-01T00:00") + np.arange(num_times)[:, None] * np.timedelta64(
+        1, "h"
+    )
+    return linerate.Cigre601(spans, weather, time)
+
+
+def test_line_rating_is_minimum_over_spans(line_model):
+    rating, limiting_span = linerate.Line(line_model).compute_steady_state_ampacity(90)
+
+    span_ampacity = line_model.compute_steady_state_ampacity(90)
+    np.testing.assert_array_equal(rating, span_ampacity.min(axis=1))
+    np.testing.assert_array_equal(limiting_span, span_ampacity.argmin(axis=1))
+
+
+def test_line_rating_with_pruning_matches_full_solve(line_model):
+    line = linerate.Line(line_model)
+    rating, limiting_span = line.compute_steady_state_ampacity(90, tolerance=1e-3)
+    pruned_rating, pruned_limiting_span = line.compute_steady_state_ampacity(
+        90, tolerance=1e-3, prune=True
+    )
+    # The ampacity is multiplied by the number of conductors (at most two)
+    np.testing.assert_allclose(pruned_rating, rating, atol=2e-3)
+    np.testing.assert_array_equal(pruned_limiting_span, limiting_span)
+
+
+def test_line_rating_with_pruning_solves_fewer_elements(line_model):
+    line = linerate.Line(line_model)
+    stats = linerate.SolverStats()
+    line.compute_steady_state_ampacity(90, tolerance=1e-3, stats=stats)
+    pruned_stats = linerate.SolverStats()
+    line.compute_steady_state_ampacity(90, tolerance=1e-3, prune=True, stats=pruned_stats)
+    assert pruned_stats.evaluated_elements < 0.75 * stats.evaluated_elements
+
+
+def test_line_rating_along_first_axis(line_model):
+    span = line_model.span
+    transposed_span = linerate.Span(
+        conductor=span[0].conductor,
+        start_tower=linerate.Tower(
+            latitude=span.start_tower.latitude[:, None],
+            longitude=span.start_tower.longitude[:, None],
+            altitude=0,
+        ),
+        end_tower=linerate.Tower(
+            latitude=span.end_tower.latitude[:, None],
+            longitude=span.end_tower.longitude[:, None],
+            altitude=0,
+        ),
+        num_conductors=span.num_conductors[:, None],
+    )
+    weather = line_model.weather
+    transposed_weather = linerate.Weather(
+        air_temperature=weather.air_temperature.T,
+        wind_direction=weather.wind_direction.T,
+        wind_speed=weather.wind_speed.T,
+        ground_albedo=0.1,
+    )
+    model = linerate.Cigre601(transposed_span, transposed_weather, line_model.time.T)
+
+    rating, limiting_span = linerate.Line(model, span_axis=0).compute_steady_state_ampacity(90)
+    span_ampacity = line_model.compute_steady_state_ampacity(90)
+    np.testing.assert_allclose(rating, span_ampacity.min(axis=1))
+    np.testing.assert_array_equal(limiting_span, span_ampacity.argmin(axis=1))
+
+
+@pytest.mark.parametrize("prune", [False, True])
+def test_line_rating_is_nan_if_any_span_is_nan(line_model, prune):
+    line_model.weather.air_temperature[3, 5] = np.nan
+    rating, limiting_span = linerate.Line(line_model).compute_steady_state_ampacity(90, prune=prune)
+    assert np.isnan(rating[3])
+    assert limiting_span[3] == 5
+    assert not np.any(np.isnan(np.delete(rating, 3)))
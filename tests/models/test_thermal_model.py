@@ -1,5 +1,14 @@
 """Test cases from Annex E of CIGRE TB 601."""
 
+import dataclasses
+import warnings
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import linerate
+
 
 def test_compute_conductor_temperature(example_model_1_conductors, example_model_2_conductors):
     # Check that the ampacity of a span with two conductors is divided
@@ -10,3 +19,704 @@ def test_compute_conductor_temperature(example_model_1_conductors, example_model
     assert example_model_1_conductors.compute_conductor_temperature(
         current_1_conductor
     ) == example_model_2_conductors.compute_conductor_temperature(current_2_conductors)
+
+
+def test_active_set_matches_global_bisection(example_span_1_conductor):
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 40, 6)[:, None],
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.61, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre601(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+
+    ampacity = model.compute_steady_state_ampacity(90, tolerance=1e-3)
+    active_set_ampacity = model.compute_steady_state_ampacity(90, tolerance=1e-3, active_set=True)
+    np.testing.assert_array_equal(active_set_ampacity, ampacity)
+
+    temperature = model.compute_conductor_temperature(ampacity, tolerance=1e-3)
+    active_set_temperature = model.compute_conductor_temperature(
+        ampacity, tolerance=1e-3, active_set=True
+    )
+    np.testing.assert_array_equal(active_set_temperature, temperature)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+@pytest.mark.parametrize("linear_magnetic_effect", [0, 4e-8])
+def test_direct_ampacity_matches_bisection(model_class, linear_magnetic_effect):
+    conductor = linerate.Conductor(
+        core_diameter=10.4e-3,
+        conductor_diameter=28.1e-3,
+        outer_layer_strand_diameter=4.4e-3,
+        emissivity=0.8,
+        solar_absorptivity=0.8,
+        temperature1=25,
+        temperature2=75,
+        resistance_at_temperature2=8.688e-5,
+        resistance_at_temperature1=7.283e-5,
+        aluminium_cross_section_area=4e-4,
+        constant_magnetic_effect=1,
+        current_density_proportional_magnetic_effect=linear_magnetic_effect,
+        max_magnetic_core_relative_resistance_increase=1.06,
+    )
+    span = linerate.Span(
+        conductor=conductor,
+        start_tower=linerate.Tower(latitude=30, longitude=0.0001, altitude=0),
+        end_tower=linerate.Tower(latitude=30, longitude=-0.0001, altitude=0),
+        num_conductors=2,
+    )
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 40, 4),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.61, 2.0, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = model_class(span, weather, np.datetime64("2016-06-10 11:00"))
+
+    ampacity = model.compute_steady_state_ampacity(90, tolerance=1e-8)
+    direct_ampacity = model.compute_steady_state_ampacity(90, method="direct")
+    np.testing.assert_allclose(direct_ampacity, ampacity, atol=1e-7)
+
+
+def test_direct_ampacity_handles_invalid_values(example_model_1_conductors):
+    with pytest.raises(ValueError):
+        example_model_1_conductors.compute_steady_state_ampacity(
+            90, max_ampacity=500, method="direct"
+        )
+
+    ampacity = example_model_1_conductors.compute_steady_state_ampacity(
+        np.array([90, 40]), method="direct", accept_invalid_values=True
+    )
+    assert ampacity[0] == pytest.approx(
+        example_model_1_conductors.compute_steady_state_ampacity(90, tolerance=1e-8)
+    )
+    assert np.isnan(ampacity[1])
+
+
+def test_direct_ampacity_falls_back_to_bisection(example_model_1_conductors, monkeypatch):
+    monkeypatch.setattr(example_model_1_conductors, "_has_closed_form_ampacity", False)
+    ampacity = example_model_1_conductors.compute_steady_state_ampacity(90, method="direct")
+    assert ampacity == example_model_1_conductors.compute_steady_state_ampacity(90)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+@pytest.mark.parametrize("linear_magnetic_effect", [0, 4e-8])
+def test_heat_balance_derivative_matches_finite_difference(model_class, linear_magnetic_effect):
+    conductor = linerate.Conductor(
+        core_diameter=10.4e-3,
+        conductor_diameter=28.1e-3,
+        outer_layer_strand_diameter=4.4e-3,
+        emissivity=0.8,
+        solar_absorptivity=0.8,
+        temperature1=25,
+        temperature2=75,
+        resistance_at_temperature2=8.688e-5,
+        resistance_at_temperature1=7.283e-5,
+        aluminium_cross_section_area=4e-4,
+        constant_magnetic_effect=1,
+        current_density_proportional_magnetic_effect=linear_magnetic_effect,
+        max_magnetic_core_relative_resistance_increase=1.06,
+    )
+    span = linerate.Span(
+        conductor=conductor,
+        start_tower=linerate.Tower(latitude=30, longitude=0.0001, altitude=0),
+        end_tower=linerate.Tower(latitude=30.0001, longitude=-0.0001, altitude=10),
+        num_conductors=1,
+    )
+    weather = linerate.Weather(
+        air_temperature=np.array([0.0, 10.0, 20.0, 30.0, 40.0]),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.2, 0.61, 3.0, 10.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = model_class(span, weather, np.datetime64("2016-06-10 11:00"))
+    h = 1e-4
+
+    for temperature, current in [(60.0, 800.0), (90.0, 1500.0), (150.0, 100.0)]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            dP_dT, dP_dI = model.compute_heat_balance_derivative(temperature, current)
+            fd_dP_dT = (
+                model.compute_heat_balance(temperature + h, current)
+                - model.compute_heat_balance(temperature - h, current)
+            ) / (2 * h)
+            fd_dP_dI = (
+                model.compute_heat_balance(temperature, current + h)
+                - model.compute_heat_balance(temperature, current - h)
+            ) / (2 * h)
+        np.testing.assert_allclose(dP_dT, fd_dP_dT, rtol=1e-6)
+        np.testing.assert_allclose(dP_dI, fd_dP_dI, rtol=1e-6)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_prepared_heat_balance_is_unchanged(model_class, example_span_1_conductor):
+    weather = linerate.Weather(
+        air_temperature=np.array([0.0, 20.0, 40.0]),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.61, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = model_class(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+
+    heat_balance = model.compute_heat_balance(90.0, 1000.0)
+    with model.prepared():
+        prepared_heat_balance = model.compute_heat_balance(90.0, 1000.0)
+        repeated_heat_balance = model.compute_heat_balance(90.0, 1000.0)
+    np.testing.assert_array_equal(prepared_heat_balance, heat_balance)
+    np.testing.assert_array_equal(repeated_heat_balance, heat_balance)
+    assert model._invariant_cache is None
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_compute_info_matches_individual_effects(model_class, example_span_1_conductor):
+    weather = linerate.Weather(
+        air_temperature=np.array([0.0, 20.0, 40.0]),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.61, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = model_class(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+
+    info = model.compute_info(90.0, 1000.0, intermediates=True)
+    np.testing.assert_array_equal(
+        info["convective_cooling"], model.compute_convective_cooling(90.0, 1000.0)
+    )
+    np.testing.assert_array_equal(
+        info["radiative_cooling"], model.compute_radiative_cooling(90.0, 1000.0)
+    )
+    np.testing.assert_array_equal(info["joule_heating"], model.compute_joule_heating(90.0, 1000.0))
+    np.testing.assert_array_equal(info["solar_heating"], model.compute_solar_heating(90.0, 1000.0))
+    np.testing.assert_allclose(
+        info["heat_balance"], model.compute_heat_balance(90.0, 1000.0), rtol=1e-12
+    )
+    np.testing.assert_array_equal(info["resistance"], model.compute_resistance(90.0, 1000.0))
+    assert {"film_temperature", "reynolds_number"} <= info.keys()
+    assert model._intermediates is None
+
+    assert "reynolds_number" not in model.compute_info(90.0, 1000.0)
+
+
+def test_compute_info_structured(example_model_1_conductors):
+    info = example_model_1_conductors.compute_info(90.0, 1000.0, intermediates=True)
+    structured_info = example_model_1_conductors.compute_info(
+        90.0, 1000.0, intermediates=True, structured=True
+    )
+
+    assert structured_info.dtype.names == tuple(info)
+    for key, value in info.items():
+        np.testing.assert_array_equal(
+            structured_info[key], np.broadcast_to(value, np.shape(structured_info))
+        )
+    assert structured_info["nusselt_number"].shape == np.shape(info["convective_cooling"])
+
+
+@pytest.mark.parametrize(
+    "model_class, convective_cooling",
+    [
+        (linerate.Cigre601, linerate.equations.cigre601.convective_cooling),
+        (linerate.Cigre207, linerate.equations.cigre207.convective_cooling),
+    ],
+)
+@pytest.mark.parametrize("validation, expected_num_checks", [("once", 1), ("never", 0)])
+def test_validation_policy_skips_repeated_checks(
+    example_span_1_conductor, model_class, convective_cooling, validation, expected_num_checks
+):
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 40, 6)[:, None],
+        wind_direction=np.radians(30),
+        wind_speed=np.linspace(0.5, 10, 4),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    time = np.datetime64("2016-06-10 11:00")
+    model = model_class(example_span_1_conductor, weather, time)
+    trusted_model = model_class(example_span_1_conductor, weather, time)
+    trusted_model.validation = validation
+
+    check = convective_cooling._check_horizontal_natural_nusselt_number
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        with mock.patch.object(
+            convective_cooling, "_check_horizontal_natural_nusselt_number", wraps=check
+        ) as patched_check:
+            ampacity = model.compute_steady_state_ampacity(100.0, tolerance=1e-6)
+            assert patched_check.call_count > 1
+
+            patched_check.reset_mock()
+            trusted_ampacity = trusted_model.compute_steady_state_ampacity(100.0, tolerance=1e-6)
+            assert patched_check.call_count == expected_num_checks
+
+    np.testing.assert_array_equal(trusted_ampacity, ampacity)
+
+
+def test_validation_policy_once_checks_every_evaluation_if_not_prepared(example_model_1_conductors):
+    model = example_model_1_conductors
+    negative_wind_model = linerate.Cigre601(
+        model.span,
+        dataclasses.replace(model.weather, wind_speed=-1.0),
+        model.time,
+    )
+    negative_wind_model.validation = "once"
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Reynolds number"):
+            negative_wind_model.compute_heat_balance(100.0, 1000.0)
+
+    negative_wind_model.validation = "never"
+    negative_wind_model.compute_heat_balance(100.0, 1000.0)
+
+
+def test_unknown_validation_policy_raises(example_model_1_conductors):
+    with pytest.raises(ValueError, match="validation"):
+        example_model_1_conductors.validation = "sometimes"
+
+
+@pytest.mark.parametrize("engine", ["numpy", "compiled"])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_solve_records_diagnostics(example_span_1_conductor, engine, n_jobs):
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 40, 6)[:, None],
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.5, 2.0, 20.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre207(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+    model.validation = "never"
+
+    diagnostics = linerate.solver.SolverDiagnostics()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        ampacity = model.compute_steady_state_ampacity(
+            90,
+            max_ampacity=1500,
+            accept_invalid_values=True,
+            engine=engine,
+            n_jobs=n_jobs,
+            diagnostics=diagnostics,
+        )
+
+    np.testing.assert_array_equal(diagnostics.invalid_bracket, np.isnan(ampacity))
+    assert diagnostics.invalid_bracket.any()
+    info = model.compute_info(90, ampacity, intermediates=True)
+    Re = np.broadcast_to(info["reynolds_number"], ampacity.shape)
+    np.testing.assert_array_equal(
+        diagnostics.reynolds_number_out_of_bounds, (Re < 100) | (Re > 5e4)
+    )
+    assert diagnostics.reynolds_number_out_of_bounds.any()
+    assert not diagnostics.grashof_prandtl_product_out_of_bounds.any()
+    assert diagnostics.inclination_out_of_bounds is None
+    assert diagnostics.counts()["invalid_bracket"] == np.isnan(ampacity).sum()
+
+
+def test_temperature_solve_records_diagnostics(example_model_1_conductors):
+    model = example_model_1_conductors
+    nan_wind_model = linerate.Cigre601(
+        model.span,
+        dataclasses.replace(model.weather, wind_speed=np.array([0.0, 1.0, np.nan])),
+        model.time,
+    )
+
+    diagnostics = linerate.solver.SolverDiagnostics()
+    temperature = nan_wind_model.compute_conductor_temperature(1000.0, diagnostics=diagnostics)
+
+    # NaN-valued inputs give NaN without being invalid, like for the solvers
+    assert np.isnan(temperature[2])
+    np.testing.assert_array_equal(diagnostics.invalid_bracket, [False] * 3)
+    np.testing.assert_array_equal(diagnostics.reynolds_number_out_of_bounds, [False] * 3)
+    np.testing.assert_array_equal(diagnostics.inclination_out_of_bounds, [False] * 3)
+
+
+@pytest.mark.parametrize("linear_magnetic_effect", [0, 4e-8])
+def test_cigre601_numba_backend_matches_numpy_backend(rng, linear_magnetic_effect):
+    conductor = linerate.Conductor(
+        core_diameter=10.4e-3,
+        conductor_diameter=28.1e-3,
+        outer_layer_strand_diameter=4.4e-3,
+        emissivity=0.8,
+        solar_absorptivity=0.8,
+        temperature1=25,
+        temperature2=75,
+        resistance_at_temperature2=8.688e-5,
+        resistance_at_temperature1=7.283e-5,
+        aluminium_cross_section_area=4e-4,
+        constant_magnetic_effect=1,
+        current_density_proportional_magnetic_effect=linear_magnetic_effect,
+        max_magnetic_core_relative_resistance_increase=1.06,
+    )
+    span = linerate.Span(
+        conductor=conductor,
+        start_tower=linerate.Tower(latitude=60, longitude=5, altitude=0),
+        end_tower=linerate.Tower(latitude=60.01, longitude=5.01, altitude=30),
+        num_conductors=2,
+    )
+    weather = linerate.Weather(
+        air_temperature=rng.uniform(-20, 40, (50, 1)),
+        wind_direction=rng.uniform(0, 2 * np.pi, (50, 1)),
+        wind_speed=rng.uniform(0, 10, 4),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    time = np.datetime64("2016-06-10 11:00")
+    numpy_model = linerate.Cigre601(span, weather, time)
+    numba_model = linerate.Cigre601(span, weather, time, backend="numba")
+
+    temperature = rng.uniform(-20, 150, (50, 4))
+    current = rng.uniform(0, 3000, (50, 4))
+    np.testing.assert_allclose(
+        numba_model.compute_heat_balance(temperature, current),
+        numpy_model.compute_heat_balance(temperature, current),
+        rtol=1e-12,
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        numba_model.compute_steady_state_ampacity(100, tolerance=1e-6),
+        numpy_model.compute_steady_state_ampacity(100, tolerance=1e-6),
+        atol=1e-5,
+    )
+
+
+def test_cigre601_numba_backend_with_nan_aluminium_area(example_model_1_conductors):
+    model = example_model_1_conductors
+    numba_model = linerate.Cigre601(model.span, model.weather, model.time, backend="numba")
+    assert numba_model.compute_heat_balance(100.0, 1000.0) == pytest.approx(
+        model.compute_heat_balance(100.0, 1000.0), rel=1e-12
+    )
+
+
+def test_cigre601_unknown_backend_raises(example_span_1_conductor, example_weather_a):
+    with pytest.raises(ValueError, match="backend"):
+        linerate.Cigre601(
+            example_span_1_conductor, example_weather_a, np.datetime64("2016-06-10"), backend="c"
+        )
+
+
+def test_ieee738_numba_backend_matches_numpy_backend(rng, example_span_1_conductor):
+    weather = linerate.Weather(
+        air_temperature=rng.uniform(-20, 40, (50, 1)),
+        wind_direction=rng.uniform(0, 2 * np.pi, (50, 1)),
+        wind_speed=rng.uniform(0, 10, 4),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    time = np.datetime64("2016-06-10 11:00")
+    numpy_model = linerate.IEEE738(example_span_1_conductor, weather, time)
+    numba_model = linerate.IEEE738(example_span_1_conductor, weather, time, backend="numba")
+
+    temperature = rng.uniform(-20, 150, (50, 4))
+    current = rng.uniform(0, 3000, (50, 4))
+    numpy_cooling = numpy_model.compute_convective_cooling(temperature, current)
+    numba_cooling = numba_model.compute_convective_cooling(temperature, current)
+    np.testing.assert_allclose(numba_cooling, numpy_cooling, rtol=1e-13, atol=1e-12)
+    np.testing.assert_array_equal(np.isnan(numba_cooling), np.isnan(numpy_cooling))
+    np.testing.assert_allclose(
+        numba_model.compute_steady_state_ampacity(100, tolerance=1e-6),
+        numpy_model.compute_steady_state_ampacity(100, tolerance=1e-6),
+        atol=1e-5,
+    )
+
+    info = numba_model.compute_info(100.0, 1000.0, intermediates=True)
+    assert "reynolds_number" in info
+    np.testing.assert_allclose(
+        info["convective_cooling"], numpy_model.compute_convective_cooling(100.0, 1000.0)
+    )
+
+
+def test_ieee738_unknown_backend_raises(example_span_1_conductor, example_weather_a):
+    with pytest.raises(ValueError, match="backend"):
+        linerate.IEEE738(
+            example_span_1_conductor, example_weather_a, np.datetime64("2016-06-10"), backend="c"
+        )
+
+
+@pytest.mark.parametrize("method", ["bisect", "chandrupatla"])
+def test_compiled_engine_matches_numpy_engine(example_span_1_conductor, method):
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 40, 6)[:, None],
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.61, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre601(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+
+    ampacity = model.compute_steady_state_ampacity(90, tolerance=1e-6, method=method)
+    compiled_ampacity = model.compute_steady_state_ampacity(
+        90, tolerance=1e-6, method=method, engine="compiled"
+    )
+    assert compiled_ampacity.shape == ampacity.shape
+    np.testing.assert_allclose(compiled_ampacity, ampacity, atol=1e-6)
+
+    temperature = model.compute_conductor_temperature(ampacity, tolerance=1e-6, method=method)
+    compiled_temperature = model.compute_conductor_temperature(
+        ampacity, tolerance=1e-6, method=method, engine="compiled"
+    )
+    np.testing.assert_allclose(compiled_temperature, temperature, atol=1e-6)
+    np.testing.assert_allclose(compiled_temperature, 90, atol=1e-5)
+
+
+def test_compiled_engine_handles_invalid_values(example_model_1_conductors):
+    model = example_model_1_conductors
+    max_temperature = np.array([20.0, 100.0])  # Below and above the air temperature
+    with pytest.raises(ValueError, match="same sign"):
+        model.compute_steady_state_ampacity(max_temperature, engine="compiled")
+
+    ampacity = model.compute_steady_state_ampacity(
+        max_temperature, engine="compiled", accept_invalid_values=True
+    )
+    assert np.isnan(ampacity[0])
+    assert np.isfinite(ampacity[1])
+
+
+def test_compiled_engine_falls_back_to_numpy_engine(example_span_1_conductor, example_weather_a):
+    model = linerate.IEEE738(
+        example_span_1_conductor, example_weather_a, np.datetime64("2016-06-10 11:00")
+    )
+    assert model.compute_steady_state_ampacity(90, engine="compiled") == pytest.approx(
+        model.compute_steady_state_ampacity(90)
+    )
+
+
+def test_unknown_engine_raises(example_model_1_conductors):
+    with pytest.raises(ValueError, match="engine"):
+        example_model_1_conductors.compute_steady_state_ampacity(90, engine="gpu")
+    with pytest.raises(ValueError, match="engine"):
+        example_model_1_conductors.compute_conductor_temperature(1000, engine="gpu")
+
+
+@pytest.mark.parametrize(
+    "solver_kwargs",
+    [{}, {"method": "chandrupatla"}, {"active_set": True}, {"engine": "compiled"}],
+)
+def test_parallel_solve_is_identical_to_serial_solve(example_span_1_conductor, solver_kwargs):
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 40, 7)[:, None],
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.0, 0.61, 2.0, 5.0, 10.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre601(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+
+    ampacity = model.compute_steady_state_ampacity(90, **solver_kwargs)
+    parallel_ampacity = model.compute_steady_state_ampacity(90, n_jobs=3, **solver_kwargs)
+    assert parallel_ampacity.shape == ampacity.shape
+    np.testing.assert_array_equal(parallel_ampacity, ampacity)
+
+    temperature = model.compute_conductor_temperature(ampacity, **solver_kwargs)
+    parallel_temperature = model.compute_conductor_temperature(ampacity, n_jobs=-1, **solver_kwargs)
+    np.testing.assert_array_equal(parallel_temperature, temperature)
+
+
+def test_parallel_solve_raises_for_invalid_values(example_model_1_conductors):
+    model = example_model_1_conductors
+    max_temperature = np.array([100.0, 20.0, 100.0])  # 20 is below the air temperature
+    with pytest.raises(ValueError, match="same sign"):
+        model.compute_steady_state_ampacity(max_temperature, n_jobs=2)
+    ampacity = model.compute_steady_state_ampacity(
+        max_temperature, n_jobs=2, accept_invalid_values=True
+    )
+    np.testing.assert_array_equal(np.isnan(ampacity), [False, True, False])
+
+
+@pytest.mark.parametrize("n_jobs", [0, 1.5])
+def test_invalid_n_jobs_raises(example_model_1_conductors, n_jobs):
+    with pytest.raises(ValueError, match="n_jobs"):
+        example_model_1_conductors.compute_steady_state_ampacity(90, n_jobs=n_jobs)
+
+
+def test_solve_records_stats(example_model_1_conductors):
+    model = example_model_1_conductors
+    stats = linerate.SolverStats()
+    model.compute_steady_state_ampacity(90, stats=stats)
+    assert stats.function_evaluations > 2
+    assert set(stats.component_wall_time) == {
+        "joule_heating",
+        "solar_heating",
+        "convective_cooling",
+        "radiative_cooling",
+    }
+    assert model._stats is None
+
+    # Statistics accumulate over solves, also when recorded with the context manager
+    function_evaluations = stats.function_evaluations
+    with model.instrumented(stats):
+        model.compute_conductor_temperature(1000)
+    assert stats.function_evaluations > function_evaluations
+
+
+def test_active_set_solve_records_component_wall_time(rng, example_span_1_conductor):
+    weather = linerate.Weather(
+        air_temperature=rng.uniform(0, 30, 100_000),
+        wind_direction=rng.uniform(0, 2 * np.pi, 100_000),
+        wind_speed=rng.uniform(0, 10, 100_000),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre601(example_span_1_conductor, weather, np.datetime64("2016-06-10 11:00"))
+
+    stats = linerate.SolverStats()
+    model.compute_steady_state_ampacity(90, tolerance=1e-3, active_set=True, stats=stats)
+
+    # The element subsets of the active set record their wall times in the same statistics
+    assert sum(stats.component_wall_time.values()) > 0.5 * stats.wall_time
+
+
+def test_instrumented_heat_balance_is_unchanged(example_model_1_conductors):
+    model = example_model_1_conductors
+    heat_balance = model.compute_heat_balance(90.0, 1000.0)
+    with model.instrumented(linerate.SolverStats()):
+        np.testing.assert_array_equal(model.compute_heat_balance(90.0, 1000.0), heat_balance)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_transient_temperature_converges_to_steady_state(model_class, example_span_1_conductor):
+    conductor = dataclasses.replace(example_span_1_conductor.conductor, heat_capacity=1310.0)
+    span = dataclasses.replace(
+        example_span_1_conductor, conductor=conductor, num_conductors=np.array([1, 2])
+    )
+    weather = linerate.Weather(
+        air_temperature=np.full((50, 1), 20.0),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.61, 2.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = model_class(span, weather, np.datetime64("2016-06-10 11:00"))
+    current = np.array([1000.0, 2000.0])
+
+    temperature = model.compute_transient_conductor_temperature(20.0, current, time_step=3600.0)
+    steady_state_temperature = model_class(
+        span, dataclasses.replace(weather, air_temperature=20.0), np.datetime64("2016-06-10 11:00")
+    ).compute_conductor_temperature(current, min_temperature=20.0, tolerance=1e-8)
+
+    assert temperature.shape == (50, 2)
+    np.testing.assert_array_equal(temperature[0], 20.0)
+    assert np.all(np.diff(temperature, axis=0) >= -1e-9)
+    np.testing.assert_allclose(temperature[-1], steady_state_temperature, atol=1e-5)
+
+
+def test_transient_temperature_matches_ode_solver(example_span_1_conductor, example_weather_a):
+    from scipy.integrate import solve_ivp
+
+    conductor = dataclasses.replace(example_span_1_conductor.conductor, heat_capacity=1310.0)
+    span = dataclasses.replace(example_span_1_conductor, conductor=conductor)
+    time = np.datetime64("2016-06-10 11:00")
+    model = linerate.Cigre601(span, example_weather_a, time)
+    # Step change in the current after 10 minutes, for one hour with one minute time steps
+    times = 60.0 * np.arange(61)
+    current = np.where(times <= 600, 500.0, 1500.0)
+
+    temperature = model.compute_transient_conductor_temperature(
+        60.0, current, time_step=60.0, time_axis=0, num_substeps=60
+    )
+
+    def compute_derivative(t, T):
+        I = 500.0 if t <= 600 else 1500.0  # noqa
+        return model.compute_heat_balance(T, I) / conductor.heat_capacity
+
+    solution = solve_ivp(
+        compute_derivative, (0, times[-1]), [60.0], t_eval=times, rtol=1e-10, atol=1e-10
+    )
+    np.testing.assert_allclose(temperature, solution.y[0], atol=0.1)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_transient_ampacity_reaches_max_temperature(model_class, example_span_1_conductor):
+    conductor = dataclasses.replace(example_span_1_conductor.conductor, heat_capacity=1310.0)
+    span = dataclasses.replace(example_span_1_conductor, conductor=conductor)
+    weather = linerate.Weather(
+        air_temperature=np.array([0.0, 20.0, 40.0]),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.61, 2.0, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = model_class(span, weather, np.datetime64("2016-06-10 11:00"))
+
+    ampacity = model.compute_transient_ampacity(
+        100.0, 50.0, 900.0, tolerance=1e-6, num_steps=15, method="chandrupatla"
+    )
+    steady_state_ampacity = model.compute_steady_state_ampacity(100.0, tolerance=1e-6)
+    assert np.all(ampacity > steady_state_ampacity)
+    hotter_ampacity = model.compute_transient_ampacity(
+        100.0, 80.0, 900.0, tolerance=1e-6, num_steps=15, method="chandrupatla"
+    )
+    assert np.all(hotter_ampacity < ampacity)
+
+    # Integrating with the short-time rating gives the maximum temperature after the time window
+    time_model = model_class(
+        span,
+        dataclasses.replace(
+            weather, air_temperature=np.broadcast_to(weather.air_temperature, (16, 3))
+        ),
+        np.datetime64("2016-06-10 11:00"),
+    )
+    temperature = time_model.compute_transient_conductor_temperature(
+        50.0, ampacity, time_step=60.0, time_axis=0
+    )
+    np.testing.assert_allclose(temperature[-1], 100.0, atol=1e-4)
+
+    # With a long time window, the short-time rating approaches the steady-state rating
+    long_ampacity = model.compute_transient_ampacity(
+        100.0, 50.0, 10 * 24 * 3600.0, tolerance=1e-6, num_steps=100, method="chandrupatla"
+    )
+    np.testing.assert_allclose(long_ampacity, steady_state_ampacity, rtol=1e-6)
+
+
+def test_transient_temperature_requires_heat_capacity(example_model_1_conductors):
+    with pytest.raises(ValueError, match="heat capacity"):
+        example_model_1_conductors.compute_transient_conductor_temperature(
+            20.0, np.full(10, 1000.0), time_step=60.0, time_axis=0
+        )
+    with pytest.raises(ValueError, match="heat capacity"):
+        example_model_1_conductors.compute_transient_ampacity(100.0, 50.0, 900.0)
+
+
+@pytest.mark.parametrize("argument", ["num_substeps", "max_iterations"])
+def test_transient_temperature_raises_for_non_positive_counts(example_span_1_conductor, argument):
+    conductor = dataclasses.replace(example_span_1_conductor.conductor, heat_capacity=1310.0)
+    span = dataclasses.replace(example_span_1_conductor, conductor=conductor)
+    weather = linerate.Weather(
+        air_temperature=20.0,
+        wind_direction=np.radians(30),
+        wind_speed=2.0,
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre601(span, weather, np.datetime64("2016-06-10 11:00"))
+    with pytest.raises(ValueError, match=argument):
+        model.compute_transient_conductor_temperature(
+            20.0, np.full(10, 1000.0), time_step=60.0, time_axis=0, **{argument: 0}
+        )
+
+
+def test_transient_ampacity_uses_step_tolerance_and_max_iterations(example_span_1_conductor):
+    conductor = dataclasses.replace(example_span_1_conductor.conductor, heat_capacity=1310.0)
+    span = dataclasses.replace(example_span_1_conductor, conductor=conductor)
+    weather = linerate.Weather(
+        air_temperature=np.array([0.0, 20.0, 40.0]),
+        wind_direction=np.radians(30),
+        wind_speed=np.array([0.61, 2.0, 5.0]),
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    model = linerate.Cigre601(span, weather, np.datetime64("2016-06-10 11:00"))
+
+    ampacity = model.compute_transient_ampacity(100.0, 50.0, 900.0, num_steps=15)
+    # A single Newton iteration per step does not converge, so all currents exceed the maximum
+    # temperature and no rating is found
+    with pytest.raises(ValueError, match="same sign"):
+        model.compute_transient_ampacity(
+            100.0, 50.0, 900.0, num_steps=15, step_tolerance=1e-12, max_iterations=1
+        )
+    loose_ampacity = model.compute_transient_ampacity(
+        100.0, 50.0, 900.0, num_steps=15, step_tolerance=1e-3, max_iterations=100
+    )
+    np.testing.assert_allclose(loose_ampacity, ampacity, atol=1.0)
+    with pytest.raises(ValueError, match="max_iterations"):
+        model.compute_transient_ampacity(100.0, 50.0, 900.0, max_iterations=0)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import linerate
+from linerate import axes
+
+LAYOUT = ("ensemble", "time", "span")
+
+
+def test_align_transposes_and_inserts_axes():
+    value = np.arange(2 * 3 * 4).reshape(2, 3, 4)  # Axes ("span", "ensemble", "time")
+    aligned = axes.align(value, ("span", "ensemble", "time"), LAYOUT)
+    assert aligned.shape == (3, 4, 2)
+    assert aligned[1, 2, 0] == value[0, 1, 2]
+    assert np.shares_memory(aligned, value)
+
+    assert axes.align(np.zeros(4), ("time",), LAYOUT).shape == (1, 4, 1)
+    assert axes.align(np.zeros(2), ("span",)).shape == (1, 2)
+    assert axes.align(1.0, (), LAYOUT).shape == (1, 1, 1)
+
+
+def test_align_raises_for_invalid_axes():
+    with pytest.raises(ValueError):
+        axes.align(np.zeros((2, 3)), ("time",))
+    with pytest.raises(ValueError):
+        axes.align(np.zeros((2, 3)), ("time", "time"))
+    with pytest.raises(ValueError):
+        axes.align(np.zeros(2), ("ensemble",), layout=("time", "span"))
+    with pytest.raises(ValueError):
+        axes.align(np.zeros(2), ("time",), layout=("span", "time"))
+
+
+def test_get_axis():
+    assert axes.get_axis("span", LAYOUT) == -1
+    assert axes.get_axis("ensemble", LAYOUT) == -3
+    with pytest.raises(ValueError):
+        axes.get_axis("ensemble")
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_model_evaluates_all_span_time_ensemble_combinations(drake_conductor_a, rng, model_class):
+    num_spans, num_times, num_members = 4, 3, 2
+    latitude = 50 + np.cumsum(rng.uniform(0, 0.003, num_spans + 1))
+    spans = linerate.SpanArray(
+        conductor=drake_conductor_a,
+        start_tower=linerate.Tower(latitude=latitude[:-1], longitude=10, altitude=0),
+        end_tower=linerate.Tower(latitude=latitude[1:], longitude=10.001, altitude=0),
+        num_conductors=1,
+    )
+    air_temperature = rng.uniform(0, 30, (num_times, num_spans))
+    wind_speed = rng.uniform(0.5, 5, (num_spans, num_members, num_times))
+    time = np.datetime64("2022-06-01T06:00") + 2 * np.arange(num_times) * np.timedelta64(1, "h")
+    weather = linerate.Weather(
+        air_temperature=axes.align(air_temperature, ("time", "span"), LAYOUT),
+        wind_direction=0.5,
+        wind_speed=axes.align(wind_speed, ("span", "ensemble", "time"), LAYOUT),
+        ground_albedo=0.1,
+    )
+    model = model_class(spans, weather, axes.align(time, ("time",), LAYOUT))
+
+    ampacity = model.compute_steady_state_ampacity(90, tolerance=1e-6)
+    assert ampacity.shape == (num_members, num_times, num_spans)
+    # Span-only quantities are not broadcast to the full shape
+    assert np.shape(model._compute_conductor_roughness()) == (num_spans,)
+
+    for member, time_index, span_index in [(0, 0, 0), (1, 2, 3), (1, 0, 2)]:
+        single_weather = linerate.Weather(
+            air_temperature=air_temperature[time_index, span_index],
+            wind_direction=0.5,
+            wind_speed=wind_speed[span_index, member, time_index],
+            ground_albedo=0.1,
+        )
+        single_model = model_class(spans[span_index], single_weather, time[time_index])
+        expected = single_model.compute_steady_state_ampacity(90, tolerance=1e-6)
+        assert ampacity[member, time_index, span_index] == pytest.approx(expected, rel=1e-12)
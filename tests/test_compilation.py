@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import linerate
+from linerate import compilation
+
+
+def test_warmup_compiles_all_kernels_for_float64():
+    linerate.warmup()
+
+    ufuncs = list(compilation._get_compiled_ufuncs())
+    assert linerate.equations.cigre601.heat_balance._compute_conductor_ampacity in ufuncs
+    for ufunc in ufuncs:
+        assert "d" * ufunc.nin + "->d" in ufunc.types, ufunc.__name__
+
+
+@pytest.mark.integration
+def test_warmup_caches_all_kernels_on_disk(tmp_path):
+    command = [sys.executable, "-W", "error::numba.NumbaWarning", "-c"]
+    warmup = "import linerate; linerate.warmup()"
+    environment = {**os.environ, "NUMBA_CACHE_DIR": str(tmp_path)}
+
+    subprocess.run(command + [warmup], check=True, env=environment)
+
+    cached_kernels = {path.name.split("-")[0] for path in tmp_path.rglob("*.nbi")}
+    for ufunc in compilation._get_compiled_ufuncs():
+        assert any(name.endswith(f".{ufunc.__name__}") for name in cached_kernels)
@@ -0,0 +1,67 @@
+import numpy as np
+import pygeodesy
+import pytest
+from pygeodesy import ellipsoidalVincenty
+
+from linerate import geodesy
+
+
+@pytest.fixture
+def tower_pairs(rng):
+    num_pairs = 200
+    lat1 = rng.uniform(-85, 85, num_pairs)
+    lon1 = rng.uniform(-179, 179, num_pairs)
+    # Span lengths from a few metres to thousands of kilometres
+    distance = rng.choice([1e-4, 1e-2, 1, 30], num_pairs)
+    lat2 = np.clip(lat1 + distance * rng.normal(size=num_pairs), -89, 89)
+    lon2 = np.clip(lon1 + distance * rng.normal(size=num_pairs), -180, 180)
+    return lat1, lon1, lat2, lon2
+
+
+def _angle_difference(angle1, angle2):
+    return np.abs(np.angle(np.exp(1j * (angle1 - angle2))))
+
+
+def test_spherical_span_length_matches_pygeodesy(tower_pairs):
+    span_length = geodesy.compute_span_length(*tower_pairs)
+    expected = np.vectorize(pygeodesy.formy.haversine)(*tower_pairs)
+    np.testing.assert_allclose(span_length, expected, rtol=0, atol=1e-8)
+
+
+def test_spherical_bearing_matches_pygeodesy(tower_pairs):
+    bearing = geodesy.compute_bearing(*tower_pairs)
+    expected = np.radians(np.vectorize(pygeodesy.formy.bearing)(*tower_pairs))
+    assert np.all((0 <= bearing) & (bearing < 2 * np.pi))
+    assert np.all(_angle_difference(bearing, expected) < 1e-8)
+
+
+def test_ellipsoidal_span_length_and_bearing_match_pygeodesy(tower_pairs):
+    span_length, bearing = geodesy.compute_span_length_and_bearing(*tower_pairs, ellipsoidal=True)
+
+    expected_length, expected_bearing = [], []
+    for lat1, lon1, lat2, lon2 in zip(*tower_pairs):
+        start = ellipsoidalVincenty.LatLon(lat1, lon1)
+        end = ellipsoidalVincenty.LatLon(lat2, lon2)
+        expected_length.append(start.distanceTo(end))
+        expected_bearing.append(np.radians(start.initialBearingTo(end)))
+
+    np.testing.assert_allclose(span_length, expected_length, rtol=0, atol=1e-5)
+    assert np.all(_angle_difference(bearing, expected_bearing) < 1e-8)
+
+
+@pytest.mark.parametrize("ellipsoidal", [False, True])
+def test_coincident_points_have_zero_length_and_bearing(ellipsoidal):
+    span_length, bearing = geodesy.compute_span_length_and_bearing(
+        50, 10, 50, 10, ellipsoidal=ellipsoidal
+    )
+    assert span_length == 0
+    assert bearing == 0
+
+
+def test_ellipsoidal_span_length_along_equator():
+    span_length = geodesy.compute_span_length(0, 0, 0, 1, ellipsoidal=True)
+    assert span_length == pytest.approx(np.radians(1) * geodesy.WGS84_SEMI_MAJOR_AXIS)
+
+
+def test_ellipsoidal_span_length_is_nan_for_nearly_antipodal_points():
+    assert np.isnan(geodesy.compute_span_length(0, 0, 0.5, 179.7, ellipsoidal=True))
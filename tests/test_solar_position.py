@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+import linerate
+from linerate.equations import solar_angles
+from linerate.solar_position import SolarPositionCache
+
+
+@pytest.fixture
+def when():
+    return np.arange("2022-06-01T00:00", "2022-06-02T00:00", dtype="datetime64[h]")[:, np.newaxis]
+
+
+def test_cache_matches_direct_computation(when, rng):
+    latitude = np.repeat(rng.uniform(50, 70, size=5), 3)
+    longitude = np.repeat(rng.uniform(5, 30, size=5), 3)
+    cache = SolarPositionCache()
+
+    sin_H_c, Z_c = cache.compute_solar_position(when, latitude, longitude)
+
+    expected_sin_H_c, expected_Z_c = solar_angles.compute_solar_position(when, latitude, longitude)
+    assert sin_H_c.shape == (24, 15)
+    np.testing.assert_array_equal(sin_H_c, expected_sin_H_c)
+    np.testing.assert_array_equal(Z_c, expected_Z_c)
+    assert not sin_H_c.flags.writeable
+
+
+def test_cache_is_keyed_by_array_contents(when):
+    cache = SolarPositionCache()
+    latitude, longitude = np.array([60.0, 61.0]), np.array([10.0, 11.0])
+
+    position = cache.compute_solar_position(when, latitude, longitude)
+    assert cache.compute_solar_position(when.copy(), latitude.copy(), longitude) is position
+    assert cache.compute_solar_position(when[:12], latitude, longitude) is not position
+    assert cache.compute_solar_position(when, latitude[:1], longitude[:1]) is not position
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 3)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache), cache.nbytes) == (0, 0, 0, 0)
+
+
+def test_cache_quantizes_locations(when):
+    cache = SolarPositionCache(resolution=0.1)
+
+    sin_H_c, Z_c = cache.compute_solar_position(
+        when, np.array([60.01, 59.99, 63.0]), np.array([10.02, 9.98, 10.0])
+    )
+
+    expected_sin_H_c, expected_Z_c = solar_angles.compute_solar_position(
+        when, np.array([60.0, 60.0, 63.0]), np.array([10.0, 10.0, 10.0])
+    )
+    np.testing.assert_allclose(sin_H_c, expected_sin_H_c, rtol=1e-12)
+    np.testing.assert_allclose(Z_c, expected_Z_c, rtol=1e-12)
+    np.testing.assert_array_equal(sin_H_c[:, 0], sin_H_c[:, 1])
+
+
+def test_cache_evicts_least_recently_used_entries(when):
+    entry_nbytes = 2 * when.size * 8
+    cache = SolarPositionCache(max_bytes=2 * entry_nbytes)
+
+    first = cache.compute_solar_position(when, 60.0, 10.0)
+    cache.compute_solar_position(when, 61.0, 10.0)
+    assert cache.compute_solar_position(when, 60.0, 10.0) is first
+    cache.compute_solar_position(when, 62.0, 10.0)  # Evicts the second entry
+
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * entry_nbytes
+    assert cache.compute_solar_position(when, 60.0, 10.0) is first
+    assert cache.misses == 3
+    cache.compute_solar_position(when, 61.0, 10.0)
+    assert cache.misses == 4
+
+
+def test_models_share_solar_position(example_span_1_conductor, example_weather_a, monkeypatch):
+    cache = SolarPositionCache()
+    monkeypatch.setattr(linerate.solar_position, "default_cache", cache)
+    time = np.datetime64("2016-06-10 11:00")
+
+    for model_class in [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207]:
+        model = model_class(example_span_1_conductor, example_weather_a, time)
+        model.compute_steady_state_ampacity(100.0)
+
+    assert (cache.hits, cache.misses) == (2, 1)
@@ -1,3 +1,5 @@
+import tracemalloc
+
 import numpy as np
 import pytest
 
@@ -119,3 +121,319 @@ def test_bisect_return_nan_if_heat_balance_returns_nan():
     )
 
     np.testing.assert_array_equal(np.isnan(solution), np.full_like(solution, True, dtype=bool))
+
+
+def test_chandrupatla_handles_function_returning_array_happy_path():
+    def heat_balance(currents: np.array):
+        A = currents
+        T = 90
+        res = (A - 100 * T) * (currents + 100 * T)
+        return res
+
+    solution = solver.chandrupatla(
+        heat_balance,
+        xmin=np.array([0, 0, 5_000]),
+        xmax=np.array([10_000, 20_000, 9_500]),
+        tolerance=1e-8,
+    )
+    np.testing.assert_allclose(solution, [9_000, 9_000, 9_000], atol=0.5e-8)
+
+
+def test_chandrupatla_needs_fewer_evaluations_than_bisect():
+    evaluations = {"bisect": 0, "chandrupatla": 0}
+
+    def make_heat_balance(method):
+        def heat_balance(currents: np.array):
+            evaluations[method] += 1
+            return 1e5 - 1e-2 * currents**2 - 50 * np.sqrt(currents)
+
+        return heat_balance
+
+    for method in evaluations:
+        solver._get_root_finder(method)(
+            make_heat_balance(method), xmin=np.zeros(3), xmax=np.full(3, 5_000), tolerance=1
+        )
+    assert evaluations["chandrupatla"] < evaluations["bisect"]
+
+
+def test_chandrupatla_matches_bisect(rng):
+    roots = rng.uniform(0, 5000, size=100)
+
+    def heat_balance(currents: np.array):
+        return np.tanh((roots - currents) / 1000) + 0.01 * (roots - currents)
+
+    bisect_solution = solver.bisect(heat_balance, xmin=0, xmax=5000, tolerance=1e-6)
+    chandrupatla_solution = solver.chandrupatla(heat_balance, xmin=0, xmax=5000, tolerance=1e-6)
+    np.testing.assert_allclose(chandrupatla_solution, roots, atol=0.5e-6)
+    np.testing.assert_allclose(chandrupatla_solution, bisect_solution, atol=1e-6)
+
+
+def test_chandrupatla_raises_valueerror_when_same_sign_for_array_input():
+    with pytest.raises(ValueError):
+        solver.chandrupatla(
+            lambda x: x - 9_000,
+            xmin=np.array([0, 0]),
+            xmax=np.array([10_000, 8_000]),
+            tolerance=1e-8,
+        )
+
+
+def test_chandrupatla_returns_nan_for_invalid_and_nan_values():
+    def heat_balance(currents: np.array):
+        return (currents - np.array([9_000, 9_000, np.nan])) * np.array([1, 1, 1])
+
+    solution = solver.chandrupatla(
+        heat_balance,
+        xmin=np.array([0, 0, 0]),
+        xmax=np.array([10_000, 8_000, 10_000]),
+        tolerance=1e-8,
+        accept_invalid_values=True,
+    )
+    np.testing.assert_allclose(solution[0], 9_000)
+    assert np.isnan(solution[1])
+    assert np.isnan(solution[2])
+
+
+@pytest.mark.parametrize("method", ["bisect", "chandrupatla"])
+def test_compute_conductor_ampacity_supports_method(method):
+    def heat_balance(conductor_temperature, current):
+        A = current
+        T = conductor_temperature
+        return (A - 100 * T) * (current + 100 * T)
+
+    ampacity = solver.compute_conductor_ampacity(
+        heat_balance,
+        max_conductor_temperature=90,
+        tolerance=1e-8,
+        max_ampacity=10_000,
+        method=method,
+    )
+    assert ampacity == pytest.approx(9000, rel=1e-7)
+
+
+def test_compute_conductor_temperature_raises_for_unknown_method():
+    with pytest.raises(ValueError):
+        solver.compute_conductor_temperature(lambda T, current: T, current=0, method="newton")
+
+
+def _make_active_set_function(roots, evaluated_elements=None):
+    def f(x, where=None):
+        r = roots if where is None else roots[where]
+        if evaluated_elements is not None:
+            evaluated_elements.append(np.size(x))
+        return np.tanh((r - x) / 1000) + 0.01 * (r - x)
+
+    return f
+
+
+def test_bisect_active_set_matches_global_bisect(rng):
+    roots = rng.uniform(0, 5000, size=(10, 20))
+    f = _make_active_set_function(roots)
+
+    solution = solver.bisect(f, xmin=0, xmax=5000, tolerance=1e-6)
+    active_set_solution = solver.bisect(f, xmin=0, xmax=5000, tolerance=1e-6, active_set=True)
+    np.testing.assert_array_equal(active_set_solution, solution)
+
+
+def test_bisect_active_set_evaluates_fewer_elements_for_mixed_brackets():
+    roots = np.array([100.0, 200.0, 4000.0])
+    xmax = np.array([128.0, 256.0, 5000.0])
+    evaluated_elements = []
+    f = _make_active_set_function(roots, evaluated_elements)
+
+    solution = solver.bisect(f, xmin=0, xmax=xmax, tolerance=1e-3, active_set=True)
+    np.testing.assert_allclose(solution, roots, atol=1e-3)
+    assert sum(evaluated_elements[2:]) < 3 * len(evaluated_elements[2:])
+
+
+def test_bisect_active_set_returns_nan_for_invalid_and_nan_values():
+    def f(x, where=None):
+        offset = np.array([9_000, 9_000, np.nan])
+        if where is not None:
+            offset = offset[where]
+        return x - offset
+
+    solution = solver.bisect(
+        f,
+        xmin=np.array([0, 0, 0]),
+        xmax=np.array([10_000, 8_000, 10_000]),
+        tolerance=1e-8,
+        accept_invalid_values=True,
+        active_set=True,
+    )
+    np.testing.assert_allclose(solution[0], 9_000)
+    assert np.isnan(solution[1])
+    assert np.isnan(solution[2])
+
+
+def test_compute_conductor_ampacity_active_set_passes_selected_elements():
+    max_temperatures = np.array([50.0, 90.0])
+
+    def heat_balance(conductor_temperature, current, where=None):
+        if where is not None:
+            assert np.shape(conductor_temperature) == np.shape(current) == (where.sum(),)
+        return 100 * conductor_temperature - current
+
+    ampacity = solver.compute_conductor_ampacity(
+        heat_balance,
+        max_conductor_temperature=max_temperatures,
+        max_ampacity=10_000,
+        tolerance=1e-6,
+        active_set=True,
+    )
+    np.testing.assert_allclose(ampacity, [5000, 9000], atol=1e-6)
+
+
+def test_compute_conductor_ampacity_active_set_requires_bisect():
+    with pytest.raises(ValueError):
+        solver.compute_conductor_ampacity(
+            lambda T, current: T - current, 90, method="chandrupatla", active_set=True
+        )
+
+
+@pytest.mark.parametrize("method", ["bisect", "chandrupatla"])
+def test_root_finder_records_stats(method):
+    evaluations = []
+
+    def f(x):
+        value = np.array([1000.0, 1000.0, np.nan, -1.0]) - x
+        evaluations.append(value.size)
+        return value
+
+    stats = solver.SolverStats()
+    solution = solver._get_root_finder(method)(
+        f,
+        xmin=0.0,
+        xmax=np.full(4, 2000.0),
+        tolerance=1e-3,
+        accept_invalid_values=True,
+        stats=stats,
+    )
+    np.testing.assert_array_equal(np.isnan(solution), [False, False, True, True])
+    assert stats.function_evaluations == len(evaluations)
+    assert stats.iterations == len(evaluations) - 2
+    assert stats.evaluated_elements == sum(evaluations)
+    assert stats.invalid_elements == 1
+    assert stats.nan_elements == 1
+    assert stats.wall_time > 0
+
+
+def test_bisect_active_set_records_evaluated_elements():
+    roots = np.array([100.0, 200.0, 4000.0])
+    evaluated_elements = []
+    f = _make_active_set_function(roots, evaluated_elements)
+
+    stats = solver.SolverStats()
+    solver.bisect(
+        f,
+        xmin=0,
+        xmax=np.array([128.0, 256.0, 5000.0]),
+        tolerance=1e-3,
+        active_set=True,
+        stats=stats,
+    )
+    # The first two evaluations are for the full bracket
+    assert stats.evaluated_elements == 2 * roots.size + sum(evaluated_elements[2:])
+    assert stats.function_evaluations == len(evaluated_elements)
+
+
+def test_solver_stats_update():
+    stats = solver.SolverStats(iterations=3, function_evaluations=5, component_wall_time={"a": 1.0})
+    stats.update(
+        solver.SolverStats(iterations=2, function_evaluations=4, component_wall_time={"a": 1.0})
+    )
+    assert stats.iterations == 3
+    assert stats.function_evaluations == 9
+    assert stats.component_wall_time == {"a": 2.0}
+
+
+def test_solver_diagnostics_combines_masks():
+    diagnostics = solver.SolverDiagnostics()
+    diagnostics.record("invalid_bracket", [True, False, False])
+    diagnostics.record("invalid_bracket", [False, False, True])
+    diagnostics.record("reynolds_number_out_of_bounds", [False, False, False])
+
+    np.testing.assert_array_equal(diagnostics.invalid_bracket, [True, False, True])
+    assert diagnostics.grashof_prandtl_product_out_of_bounds is None
+    assert diagnostics.counts() == {"invalid_bracket": 2, "reynolds_number_out_of_bounds": 0}
+    assert diagnostics.report() == (
+        "invalid_bracket: 2 of 3 elements\nreynolds_number_out_of_bounds: 0 of 3 elements"
+    )
+    with pytest.raises(ValueError, match="Unknown diagnostic"):
+        diagnostics.record("froude_number_out_of_bounds", [True, False, False])
+
+
+def test_bisect_in_place_matches_bisect(rng):
+    roots = rng.uniform(0, 5000, size=(10, 20))
+    roots[0, 0] = 6000
+    f = _make_active_set_function(roots)
+
+    solution = solver.bisect(f, xmin=0, xmax=5000, tolerance=1e-6, accept_invalid_values=True)
+    in_place_solution = solver.bisect(
+        f, xmin=0, xmax=5000, tolerance=1e-6, accept_invalid_values=True, in_place=True
+    )
+    assert np.isnan(in_place_solution[0, 0])
+    np.testing.assert_array_equal(in_place_solution, solution)
+
+
+def test_bisect_in_place_reuses_workspace():
+    workspace = solver.BisectWorkspace((3,))
+    for offset in [1_000, 2_000]:
+        roots = np.array([100.0, 200.0, 4000.0]) + offset
+        solution = solver.bisect(
+            lambda x: x - roots, xmin=0, xmax=10_000, tolerance=1e-8, workspace=workspace
+        )
+        np.testing.assert_allclose(solution, roots)
+
+
+def test_bisect_in_place_returns_nan_for_invalid_and_nan_values():
+    def f(x):
+        return x - np.array([9_000, 9_000, np.nan])
+
+    solution = solver.bisect(
+        f,
+        xmin=np.array([0, 0, 0]),
+        xmax=np.array([10_000, 8_000, 10_000]),
+        tolerance=1e-8,
+        accept_invalid_values=True,
+        in_place=True,
+    )
+    np.testing.assert_allclose(solution[0], 9_000)
+    assert np.isnan(solution[1])
+    assert np.isnan(solution[2])
+
+
+def test_bisect_in_place_raises_for_wrong_workspace_shape():
+    with pytest.raises(ValueError):
+        solver.bisect(
+            lambda x: x - 1,
+            xmin=np.zeros(3),
+            xmax=np.full(3, 2.0),
+            tolerance=1e-3,
+            workspace=solver.BisectWorkspace((4,)),
+        )
+
+
+def test_bisect_in_place_raises_with_active_set():
+    with pytest.raises(ValueError):
+        solver.bisect(
+            lambda x: x - 1, xmin=0, xmax=2, tolerance=1e-3, in_place=True, active_set=True
+        )
+
+
+def test_bisect_in_place_has_lower_peak_memory():
+    roots = np.linspace(1, 4999, 100_000)
+
+    def f(x):
+        return x - roots
+
+    peak_memory = {}
+    tracemalloc.start()
+    try:
+        for in_place in [False, True]:
+            stats = solver.SolverStats()
+            solver.bisect(f, xmin=0, xmax=5000, tolerance=1e-3, in_place=in_place, stats=stats)
+            peak_memory[in_place] = stats.peak_memory
+    finally:
+        tracemalloc.stop()
+    assert 0 < peak_memory[True] < peak_memory[False]
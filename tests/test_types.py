@@ -0,0 +1,256 @@
+from dataclasses import replace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import linerate
+
+
+@pytest.fixture
+def spans(drake_conductor_a):
+    return [
+        linerate.Span(
+            conductor=replace(
+                drake_conductor_a, resistance_at_temperature1=(7 + i) * 1e-5, emissivity=0.5
+            ),
+            start_tower=linerate.Tower(latitude=50 + i, longitude=10, altitude=100 * i),
+            end_tower=linerate.Tower(latitude=50.01 + i, longitude=10.01, altitude=50),
+            num_conductors=1 + i % 2,
+        )
+        for i in range(4)
+    ]
+
+
+def test_span_array_from_spans_stores_contiguous_columns(spans):
+    span_array = linerate.SpanArray.from_spans(spans)
+
+    assert len(span_array) == 4
+    assert isinstance(span_array, linerate.Span)
+    resistance = span_array.conductor.resistance_at_temperature1
+    np.testing.assert_array_equal(
+        resistance, [span.conductor.resistance_at_temperature1 for span in spans]
+    )
+    np.testing.assert_array_equal(span_array.start_tower.latitude, [50, 51, 52, 53])
+    np.testing.assert_array_equal(span_array.num_conductors, [1, 2, 1, 2])
+    assert span_array.conductor.thermal_conductivity is None
+    assert span_array.end_tower.longitude.flags.c_contiguous
+
+
+def test_span_array_broadcasts_scalar_parameters(drake_conductor_a):
+    span_array = linerate.SpanArray(
+        conductor=drake_conductor_a,
+        start_tower=linerate.Tower(latitude=np.array([50, 60]), longitude=10, altitude=0),
+        end_tower=linerate.Tower(latitude=np.array([50.01, 60.01]), longitude=10, altitude=0),
+        num_conductors=1,
+    )
+    assert len(span_array) == 2
+    np.testing.assert_array_equal(span_array.conductor.emissivity, [0.8, 0.8])
+    np.testing.assert_array_equal(span_array.start_tower.longitude, [10, 10])
+
+
+def test_span_array_raises_for_multidimensional_parameters(drake_conductor_a):
+    tower = linerate.Tower(latitude=np.zeros((2, 2)), longitude=10, altitude=0)
+    with pytest.raises(ValueError):
+        linerate.SpanArray(drake_conductor_a, tower, tower, num_conductors=1)
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "latitude",
+        "longitude",
+        "inclination",
+        "conductor_azimuth",
+        "span_length",
+        "conductor_altitude",
+    ],
+)
+def test_span_array_geometry_matches_spans(spans, attribute):
+    span_array = linerate.SpanArray.from_spans(spans)
+    expected = [getattr(span, attribute) for span in spans]
+    np.testing.assert_allclose(getattr(span_array, attribute), expected)
+
+
+def test_span_array_indexing(spans):
+    span_array = linerate.SpanArray.from_spans(spans)
+
+    span = span_array[1]
+    assert type(span) is linerate.Span
+    assert (
+        span.conductor.resistance_at_temperature1 == spans[1].conductor.resistance_at_temperature1
+    )
+    assert span.span_length == pytest.approx(spans[1].span_length)
+
+    sub_array = span_array[1:3]
+    assert isinstance(sub_array, linerate.SpanArray)
+    np.testing.assert_array_equal(sub_array.num_conductors, [2, 1])
+
+
+def test_span_array_from_spans_handles_missing_magnetic_effect(spans):
+    spans[0] = replace(
+        spans[0], conductor=replace(spans[0].conductor, constant_magnetic_effect=None)
+    )
+    span_array = linerate.SpanArray.from_spans(spans)
+    np.testing.assert_array_equal(span_array.conductor.constant_magnetic_effect, [1, 1, 1, 1])
+
+    spans[0] = replace(spans[0], conductor=replace(spans[0].conductor, thermal_conductivity=1.0))
+    with pytest.raises(ValueError):
+        linerate.SpanArray.from_spans(spans)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_span_array_ampacity_matches_individual_spans(spans, model_class):
+    time = np.datetime64("2022-06-01T12:00")
+
+    def weather(num_spans):
+        return linerate.Weather(
+            air_temperature=np.full(num_spans, 20.0),
+            wind_direction=np.full(num_spans, 0.3),
+            wind_speed=np.full(num_spans, 1.0),
+            ground_albedo=0.1,
+        )
+
+    span_array = linerate.SpanArray.from_spans(spans)
+    ampacity = model_class(span_array, weather(len(spans)), time).compute_steady_state_ampacity(
+        100, tolerance=1e-8
+    )
+    expected = [
+        model_class(span, weather(1), time).compute_steady_state_ampacity(100, tolerance=1e-8)[0]
+        for span in spans
+    ]
+    np.testing.assert_allclose(ampacity, expected, rtol=1e-10)
+
+
+def test_span_ellipsoidal_geometry(spans):
+    span = replace(spans[0], ellipsoidal=True)
+    assert span.span_length == pytest.approx(spans[0].span_length, rel=1e-2)
+    assert span.span_length != spans[0].span_length
+
+    span_array = linerate.SpanArray.from_spans([replace(span, ellipsoidal=True) for span in spans])
+    assert span_array.ellipsoidal
+    assert span_array[0].span_length == span.span_length
+    with pytest.raises(ValueError):
+        linerate.SpanArray.from_spans([span, spans[1]])
+
+
+def test_span_ellipsoidal_geometry_is_solved_once(spans):
+    span = replace(spans[0], ellipsoidal=True)
+    solve = linerate.geodesy._compute_ellipsoidal_length_and_bearing
+    with mock.patch.object(
+        linerate.geodesy, "_compute_ellipsoidal_length_and_bearing", wraps=solve
+    ) as patched_solve:
+        length, bearing = span.span_length, span.conductor_azimuth
+    assert patched_solve.call_count == 1
+    assert (length, bearing) == solve(
+        span.start_tower.latitude,
+        span.start_tower.longitude,
+        span.end_tower.latitude,
+        span.end_tower.longitude,
+    )
+
+
+@pytest.fixture
+def catalog(drake_conductor_a):
+    conductors = [drake_conductor_a, replace(drake_conductor_a, resistance_at_temperature1=6e-5)]
+    return linerate.ConductorCatalog(conductors, names=["Drake", "Modified Drake"])
+
+
+def test_conductor_catalog_gathers_parameters_by_code(catalog):
+    conductor = catalog.take([1, 0, 1])
+    np.testing.assert_array_equal(conductor.resistance_at_temperature1, [6e-5, 7.283e-5, 6e-5])
+    np.testing.assert_array_equal(conductor.temperature1, [25, 25, 25])
+    assert conductor.thermal_conductivity is None
+    np.testing.assert_array_equal(catalog.get_codes(["Modified Drake", "Drake"]), [1, 0])
+    with pytest.raises(AttributeError):
+        conductor.not_a_conductor_parameter
+
+
+def test_conductor_catalog_raises_for_invalid_codes(catalog):
+    with pytest.raises(ValueError):
+        catalog.take([0, 2])
+
+
+def test_conductor_catalog_computes_derived_values_once_per_type(catalog):
+    calls = []
+
+    def compute_double_emissivity(parameters):
+        calls.append(parameters.emissivity.shape)
+        return 2 * parameters.emissivity
+
+    for codes in [[0, 1, 1, 1], [1, 0]]:
+        conductor = catalog.take(codes)
+        for _ in range(2):
+            value = conductor.gather_derived("double_emissivity", compute_double_emissivity)
+            np.testing.assert_array_equal(value, np.full(len(codes), 1.6))
+    assert calls == [(2,)]
+
+
+def test_span_array_from_spans_with_catalog(spans):
+    span_array = linerate.SpanArray.from_spans(spans, use_catalog=True)
+
+    assert isinstance(span_array.conductor, linerate.CatalogConductor)
+    assert len(span_array.conductor.catalog) == len(spans)
+    assert span_array[2].conductor == spans[2].conductor
+    assert isinstance(span_array[1:3].conductor, linerate.CatalogConductor)
+    np.testing.assert_array_equal(
+        span_array.conductor.resistance_at_temperature1,
+        [span.conductor.resistance_at_temperature1 for span in spans],
+    )
+
+    duplicated = linerate.SpanArray.from_spans(spans + spans, use_catalog=True)
+    np.testing.assert_array_equal(duplicated.conductor.codes, [0, 1, 2, 3, 0, 1, 2, 3])
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_catalog_span_array_ampacity_matches_span_array(spans, model_class):
+    spans = spans + spans[::-1]
+    time = np.datetime64("2022-06-01T12:00")
+    weather = linerate.Weather(
+        air_temperature=np.linspace(0, 30, len(spans)),
+        wind_direction=0.3,
+        wind_speed=np.linspace(0.5, 5, len(spans)),
+        ground_albedo=0.1,
+    )
+
+    span_array = linerate.SpanArray.from_spans(spans)
+    catalog_span_array = linerate.SpanArray.from_spans(spans, use_catalog=True)
+    ampacity = model_class(span_array, weather, time).compute_steady_state_ampacity(100)
+    catalog_ampacity = model_class(catalog_span_array, weather, time).compute_steady_state_ampacity(
+        100
+    )
+    np.testing.assert_array_equal(catalog_ampacity, ampacity)
+
+
+def test_time_index_decomposes_datetimes():
+    when = np.array(
+        ["1969-12-31T23:59:59", "2020-02-29T13:30", "2022-12-31T00:15"], "datetime64[s]"
+    )
+
+    time_index = linerate.TimeIndex.from_datetime64(when)
+
+    np.testing.assert_array_equal(time_index.day_of_year, [365, 60, 365])
+    np.testing.assert_array_equal(time_index.hour_of_day, [23 + 59 / 60, 13.5, 0.25])
+    assert time_index.shape == (3,)
+
+
+@pytest.mark.parametrize("model_class", [linerate.Cigre601, linerate.IEEE738, linerate.Cigre207])
+def test_time_index_ampacity_matches_datetime64(spans, model_class):
+    span_array = linerate.SpanArray.from_spans(spans)
+    weather = linerate.Weather(
+        air_temperature=20.0,
+        wind_direction=np.radians(30),
+        wind_speed=1.0,
+        ground_albedo=0.1,
+        clearness_ratio=1,
+    )
+    when = np.arange("2022-06-01", "2022-06-02", dtype="datetime64[h]")[:, np.newaxis]
+    time_index = linerate.TimeIndex.from_datetime64(when)
+
+    ampacity = model_class(span_array, weather, when).compute_steady_state_ampacity(100.0)
+    time_index_ampacity = model_class(
+        span_array, weather, time_index
+    ).compute_steady_state_ampacity(100.0)
+
+    assert time_index_ampacity.shape == (24, len(spans))
+    np.testing.assert_array_equal(time_index_ampacity, ampacity)